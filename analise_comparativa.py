@@ -20,6 +20,11 @@ from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass, asdict
 
+try:
+    import orjson
+except ImportError:  # orjson é opcional: sem ele usa json da stdlib
+    orjson = None
+
 
 @dataclass
 class ComparisonMetrics:
@@ -72,9 +77,10 @@ def load_sizing_reports(directory: str, filters: Dict[str, Any]) -> List[Dict[st
     
     for json_file in json_files:
         try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                report = json.load(f)
-                
+            # Bytes direto para o parser (sem camada de texto)
+            raw = json_file.read_bytes()
+            report = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            
             # Aplicar filtros
             if filters.get('models'):
                 model_list = [m.strip().lower() for m in filters['models'].split(',')]
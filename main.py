@@ -9,30 +9,10 @@ MODO B — Sizing por SLO:          --ttft e --tpot
 """
 
 import sys
+from dataclasses import replace
 from typing import Dict, List
 
 from sizing.cli import parse_cli_args
-from sizing.config_loader import ConfigLoader
-from sizing.capacity_policy import load_capacity_policy
-from sizing.platform_storage import load_platform_storage_profile
-from sizing.calc_kv import calc_kv_cache
-from sizing.calc_vram import calc_vram
-from sizing.calc_scenarios import (
-    create_scenario_configs, calc_scenario, ScenarioResult,
-)
-from sizing.calc_physical import calc_physical_consumption
-from sizing.calc_storage import calc_storage_requirements
-from sizing.calc_storage_validation import validate_storage_profile, format_validation_report
-from sizing.calc_warmup import calc_warmup_estimate
-from sizing.validator import validate_all_configs, print_validation_report
-from sizing.report_full import format_full_report, format_json_report
-from sizing.report_exec import format_exec_summary, format_executive_markdown
-from sizing.writer import ReportWriter
-from sizing.calc_response_time import (
-    calc_latency_analysis, calc_max_concurrency_from_slo,
-    has_performance_data, load_latency_benchmarks,
-    get_token_throughput, load_parameter
-)
 
 
 def main():
@@ -42,6 +22,32 @@ def main():
         # 1. Parse CLI
         config = parse_cli_args()
 
+        # Pipeline de sizing importado só após o parse: --help e erros de
+        # argumentos terminam sem carregar os módulos de cálculo/relatório
+        from sizing.config_loader import ConfigLoader
+        from sizing.capacity_policy import load_capacity_policy
+        from sizing.platform_storage import load_platform_storage_profile
+        from sizing.calc_kv import calc_kv_cache
+        from sizing.calc_vram import calc_vram
+        from sizing.calc_scenarios import (
+            create_scenario_configs, calc_scenario, ScenarioResult,
+        )
+        from sizing.calc_physical import calc_physical_consumption
+        from sizing.calc_storage import calc_storage_requirements
+        from sizing.calc_storage_validation import (
+            validate_storage_profile, validate_storage_profiles_batch, format_validation_report
+        )
+        from sizing.calc_warmup import calc_warmup_estimate
+        from sizing.validator import validate_all_configs, print_validation_report
+        from sizing.report_full import format_full_report, format_json_report
+        from sizing.report_exec import format_exec_summary, format_executive_markdown
+        from sizing.writer import ReportWriter
+        from sizing.calc_response_time import (
+            calc_latency_analysis, calc_max_concurrency_from_slo,
+            has_performance_data, load_latency_benchmarks,
+            get_token_throughput, load_parameter
+        )
+
         # 2. Se --validate-only, executar apenas validação
         if config.validate_only:
             print("\n" + "="*100)
@@ -65,15 +71,14 @@ def main():
             print("VALIDACAO DE STORAGE (Consistencia Fisica IOPS/Throughput/BlockSize)")
             print("="*100)
 
-            for profile_dict in storage_data:
-                storage_profile = loader.get_storage(profile_dict["name"])
-                storage_validation = validate_storage_profile(storage_profile)
+            storage_profiles = [loader.get_storage(p["name"]) for p in storage_data]
+            for storage_validation in validate_storage_profiles_batch(storage_profiles):
                 print(format_validation_report(storage_validation))
 
                 if storage_validation.overall_status == "error":
-                    errors.append(f"Storage profile '{storage_profile.name}' tem divergencia fisica critica (>25%)")
+                    errors.append(f"Storage profile '{storage_validation.profile_name}' tem divergencia fisica critica (>25%)")
                 elif storage_validation.overall_status == "warning":
-                    warnings.append(f"Storage profile '{storage_profile.name}' tem divergencia fisica moderada (10-25%)")
+                    warnings.append(f"Storage profile '{storage_validation.profile_name}' tem divergencia fisica moderada (10-25%)")
 
             success = print_validation_report(errors, warnings)
             sys.exit(0 if success else 1)
@@ -82,10 +87,9 @@ def main():
         if config.verbose:
             print("Carregando configuracoes...")
 
-        loader = ConfigLoader(base_path=".", validate=True)
-        loader.load_models()
-        loader.load_servers()
-        loader.load_storage()
+        # Só as specs solicitadas são construídas; o schema é validado apenas em
+        # --validate-only (JSONs já validados no CI)
+        loader = ConfigLoader(base_path=".", validate=config.validate_only)
 
         model = loader.get_model(config.model_name)
         server = loader.get_server(config.server_name)
@@ -102,7 +106,7 @@ def main():
                 sys.exit(1)
             if config.target_load_time < 10:
                 print(f"AVISO: --target-load-time muito baixo ({config.target_load_time}s). Valores < 10s podem nao ser viaveis com storage real.")
-            capacity_policy.target_load_time_sec = config.target_load_time
+            capacity_policy = replace(capacity_policy, target_load_time_sec=config.target_load_time)
 
         platform_storage_profile = load_platform_storage_profile(
             filepath="platform_storage_profile.json"
@@ -143,7 +147,7 @@ def main():
 
             # Calcular P99 derivado
             if config.ttft_p99 is None:
-                ttft_p99_multiplier = float(_load_param('ttft_p99_multiplier', 2.0))
+                ttft_p99_multiplier = float(load_parameter('ttft_p99_multiplier', 2.0))
                 effective_ttft_p99 = int(config.ttft_input_ms * ttft_p99_multiplier)
             else:
                 effective_ttft_p99 = config.ttft_p99
@@ -271,6 +275,16 @@ def main():
                 runtime_overhead_gib=config.runtime_overhead_gib
             )
 
+            if not scenario.is_feasible:
+                print("\n" + "=" * 80)
+                print(f"ERRO: CENÁRIO {scenario_config.name} INVIÁVEL")
+                print("=" * 80)
+                print(f"\nCausa Raiz: {scenario.infeasibility_reason}")
+                for warning in vram_scenario.warnings:
+                    print(f"  {warning}")
+                print("\nRelatórios NÃO serão gerados.")
+                sys.exit(1)
+
             calc_physical_consumption(scenario, server)
 
             storage_reqs = calc_storage_requirements(
@@ -284,8 +298,7 @@ def main():
                 replicas_per_node=config.replicas_per_node,
                 capacity_policy=capacity_policy,
                 platform_storage_profile=platform_storage_profile,
-                scenario=key,
-                retention_days=30
+                scenario=key
             )
             scenario.storage = storage_reqs
 
@@ -624,16 +637,5 @@ def main():
         sys.exit(1)
 
 
-def _load_param(param_name: str, default):
-    """Carrega parâmetro de parameters.json com fallback."""
-    import json
-    try:
-        with open('parameters.json', 'r', encoding='utf-8') as f:
-            params = json.load(f)
-            return params.get(param_name, default)
-    except Exception:
-        return default
-
-
 if __name__ == "__main__":
     main()
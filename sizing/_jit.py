@@ -0,0 +1,15 @@
+"""
+Decorador njit compartilhado pelos núcleos numéricos (latência e storage).
+
+numba é opcional: quando disponível, njit é o do numba; sem ele, um decorador
+no-op mantém as funções como Python puro, com os mesmos argumentos
+(ex.: @njit(cache=True)).
+"""
+
+try:
+    from numba import njit
+except ImportError:  # numba é opcional: sem ele os núcleos rodam como Python puro
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
@@ -0,0 +1,78 @@
+"""
+Núcleos numéricos de IOPS e throughput de storage (sem rationale).
+
+Funções puras sobre int/float, compiladas pelo numba quando disponível para
+planejadores que avaliam milhares de configurações; a montagem do rationale
+fica em calc_storage.
+"""
+
+from typing import Tuple
+
+from ._jit import njit
+
+
+_GIB = 1 << 30
+_BYTES_PER_REQUEST = 10 * 1024   # 10 KB de log + métricas por requisição
+
+# IOPS de leitura por nó: startup (leitura de pesos) e steady (cache hits)
+_IOPS_READ_PER_NODE_STARTUP = 50000
+_IOPS_READ_PER_NODE_STEADY = 1000
+
+_READ_STEADY_GBPS_PER_NODE = 0.5   # GB/s por nó em operação normal
+_LOG_FLUSH_INTERVAL_SEC = 10       # buffer de logs entre flushes
+
+
+@njit(cache=True)
+def _iops_math(
+    concurrency: int,
+    num_nodes: int,
+    nodes_restarting: int,
+    scenario_factor: float
+) -> Tuple[int, int, int, int]:
+    """Retorna (read_peak, write_peak, read_steady, write_steady) em IOPS."""
+    iops_read_peak = nodes_restarting * _IOPS_READ_PER_NODE_STARTUP
+    iops_read_steady = num_nodes * _IOPS_READ_PER_NODE_STEADY
+
+    # Escrita: 1 write op por requisição completada; burst = 2x concurrency
+    iops_write_peak = int(concurrency * 2)
+    iops_write_steady = int(concurrency)
+
+    iops_read_peak = int(iops_read_peak * scenario_factor)
+    iops_write_peak = int(iops_write_peak * scenario_factor)
+    return iops_read_peak, iops_write_peak, iops_read_steady, iops_write_steady
+
+
+@njit(cache=True)
+def _throughput_math(
+    concurrency: int,
+    num_nodes: int,
+    storage_gib: float,
+    target_load_time_sec: float,
+    nodes_restarting: int,
+    scenario_factor: float
+) -> Tuple[float, float, float, float, float]:
+    """
+    Retorna (model_per_node_gib, read_peak, write_peak, read_steady, write_steady),
+    throughputs em GB/s sem arredondamento.
+    """
+    model_per_node_gib = storage_gib / num_nodes
+
+    throughput_read_per_node = model_per_node_gib / target_load_time_sec
+    throughput_read_peak_gbps = throughput_read_per_node * nodes_restarting
+    throughput_read_steady_gbps = _READ_STEADY_GBPS_PER_NODE * num_nodes
+
+    # Flush de logs em batch a cada _LOG_FLUSH_INTERVAL_SEC segundos
+    requests_per_flush = concurrency * _LOG_FLUSH_INTERVAL_SEC
+    bytes_per_flush = _BYTES_PER_REQUEST * requests_per_flush
+    throughput_write_peak_gbps = (bytes_per_flush / _LOG_FLUSH_INTERVAL_SEC) / _GIB
+    throughput_write_steady_gbps = throughput_write_peak_gbps * 0.5
+
+    throughput_read_peak_gbps *= scenario_factor
+    throughput_write_peak_gbps *= scenario_factor
+    return (
+        model_per_node_gib,
+        throughput_read_peak_gbps,
+        throughput_write_peak_gbps,
+        throughput_read_steady_gbps,
+        throughput_write_steady_gbps,
+    )
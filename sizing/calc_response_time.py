@@ -10,28 +10,84 @@ Fontes de dados:
 
 import json
 import math
+import os
+import threading
 from dataclasses import dataclass
-from typing import Any, Dict, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 
+from ._jit import njit
 from .models import ModelSpec
 from .servers import ServerSpec
 
+try:
+    import orjson
+except ImportError:  # orjson é opcional: sem ele usa json da stdlib
+    orjson = None
+
+# Constantes do cálculo de latência (imediatos no kernel compilado pelo numba)
+_MS_PER_SEC = 1000.0
+_TTFT_P99_PREFILL_FACTOR = 1.2   # prefill no P99 ~20% mais lento que no P50
+_INPUT_TOKEN_RATIO = 2           # avg_input_tokens = effective_context // 2
+_SATURATED_MS = 99999.0          # sentinela: fila saturada / ITL indefinido
+_SATURATED_THRESHOLD_MS = 0.99 * _SATURATED_MS  # acima disso o valor é (ou contém) o sentinela
+_MIN_FEASIBLE_FACTOR = 1.05      # folga de 5% sobre o TTFT mínimo viável
+_PERCENT = 100
+
 
 # ---------------------------------------------------------------------------
 # Helpers de carregamento de parâmetros
 # ---------------------------------------------------------------------------
 
+# Cache de parameters.json: relido apenas quando o arquivo (ou o mtime) muda
+_PARAMS_FILE = 'parameters.json'
+_params_lock = threading.Lock()
+_params_cache: Dict[str, Any] = {}
+_params_cache_key: Optional[Tuple[str, int]] = None
+
+
+def _load_params() -> Dict[str, Any]:
+    """
+    Retorna parameters.json parseado, com cache invalidado por mtime.
+
+    Um os.stat por chamada substitui o open + parse repetido em cada
+    load_parameter. Arquivo ausente ou inválido resulta em {} (defaults).
+    O dict retornado é o próprio cache: uso interno, somente leitura.
+    """
+    global _params_cache, _params_cache_key
+    try:
+        path = os.path.abspath(_PARAMS_FILE)
+        key = (path, os.stat(path).st_mtime_ns)
+    except OSError:
+        return {}
+    with _params_lock:
+        if key != _params_cache_key:
+            try:
+                with open(path, 'rb') as f:
+                    raw = f.read()
+                params = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            except (OSError, ValueError):  # JSONDecodeError (json e orjson) é ValueError
+                params = {}
+            _params_cache = params if isinstance(params, dict) else {}
+            _params_cache_key = key
+        return _params_cache
+
+
+def _read_only(value: Any) -> Any:
+    """Visão somente leitura de um valor do cache (dict → MappingProxyType, list → tuple)."""
+    if isinstance(value, dict):
+        return MappingProxyType(value)
+    if isinstance(value, list):
+        return tuple(value)
+    return value
+
+
 def load_parameter(param_name: str, default: Any) -> Any:
     """Carrega parâmetro de parameters.json com fallback para default."""
-    try:
-        with open('parameters.json', 'r', encoding='utf-8') as f:
-            params = json.load(f)
-            return params.get(param_name, default)
-    except Exception:
-        return default
+    return _read_only(_load_params().get(param_name, default))
 
 
-def load_latency_benchmarks() -> Dict[str, Any]:
+def load_latency_benchmarks() -> Mapping[str, Any]:
     """Carrega benchmarks de latência de parameters.json (retorna defaults se ausente)."""
     defaults = {
         'ttft_excellent_ms': 500,
@@ -41,12 +97,7 @@ def load_latency_benchmarks() -> Dict[str, Any]:
         'tpot_good_tokens_per_sec': 8,
         'tpot_acceptable_tokens_per_sec': 6
     }
-    try:
-        with open('parameters.json', 'r', encoding='utf-8') as f:
-            params = json.load(f)
-            return params.get('latency_benchmarks', defaults)
-    except Exception:
-        return defaults
+    return _read_only(_load_params().get('latency_benchmarks', defaults))
 
 
 # ---------------------------------------------------------------------------
@@ -126,17 +177,19 @@ def _gpu_key(server: ServerSpec) -> str:
 # Throughput de tokens
 # ---------------------------------------------------------------------------
 
+# TFLOPs FP4 estimados por GPU (chave de _gpu_key)
+_GPU_FP4_TFLOPS = {
+    "b300": 144.0,
+    "b200": 90.0,
+    "h200": 60.0,
+    "h100": 40.0,
+    "a100": 20.0,
+}
+
+
 def _gpu_fp4_tflops(server: ServerSpec) -> float:
     """Retorna TFLOPs FP4 estimados por nó para estimativa genérica."""
-    gpu_key = _gpu_key(server)
-    tflops_map = {
-        "b300": 144.0,
-        "b200": 90.0,
-        "h200": 60.0,
-        "h100": 40.0,
-        "a100": 20.0,
-    }
-    return tflops_map.get(gpu_key, 40.0)
+    return _GPU_FP4_TFLOPS.get(_gpu_key(server), 40.0)
 
 
 def estimate_throughput(model: ModelSpec, server: ServerSpec) -> Tuple[float, float]:
@@ -163,7 +216,7 @@ def get_token_throughput(
       1. models.json → performance.prefill/decode_tokens_per_sec_<gpu>
       2. Estimativa genérica via FLOPs
     """
-    perf = getattr(model, 'performance', None) or {}
+    perf = model.performance
     gpu_key = _gpu_key(server)
 
     prefill_key = f"prefill_tokens_per_sec_{gpu_key}"
@@ -189,7 +242,7 @@ def get_token_throughput(
 
 def has_performance_data(model: ModelSpec, server: ServerSpec) -> bool:
     """Verifica se dados de performance existem para o par modelo/GPU."""
-    perf = getattr(model, 'performance', None) or {}
+    perf = model.performance
     gpu_key = _gpu_key(server)
     return f"prefill_tokens_per_sec_{gpu_key}" in perf
 
@@ -198,7 +251,7 @@ def has_performance_data(model: ModelSpec, server: ServerSpec) -> bool:
 # Classificação de qualidade
 # ---------------------------------------------------------------------------
 
-def classify_ttft(ttft_ms: float, benchmarks: Optional[Dict] = None) -> str:
+def classify_ttft(ttft_ms: float, benchmarks: Optional[Mapping[str, Any]] = None) -> str:
     """Classifica TTFT segundo benchmarks da indústria (lidos de parameters.json)."""
     if benchmarks is None:
         benchmarks = load_latency_benchmarks()
@@ -216,7 +269,7 @@ def classify_ttft(ttft_ms: float, benchmarks: Optional[Dict] = None) -> str:
         return 'slow'
 
 
-def classify_tpot(tpot_tokens_per_sec: float, benchmarks: Optional[Dict] = None) -> str:
+def classify_tpot(tpot_tokens_per_sec: float, benchmarks: Optional[Mapping[str, Any]] = None) -> str:
     """Classifica TPOT segundo benchmarks da indústria (lidos de parameters.json)."""
     if benchmarks is None:
         benchmarks = load_latency_benchmarks()
@@ -241,13 +294,15 @@ def classify_tpot(tpot_tokens_per_sec: float, benchmarks: Optional[Dict] = None)
 def identify_bottleneck(
     queuing_ms: float,
     prefill_ms: float,
-    tpot_tokens_per_sec: float
+    tpot_tokens_per_sec: float,
+    benchmarks: Optional[Mapping[str, Any]] = None
 ) -> str:
     """Identifica o principal gargalo de latência."""
-    benchmarks = load_latency_benchmarks()
+    if benchmarks is None:
+        benchmarks = load_latency_benchmarks()
     tpot_acceptable = benchmarks.get('tpot_acceptable_tokens_per_sec', 6)
 
-    if queuing_ms == float('inf') or queuing_ms >= 99990:
+    if queuing_ms >= _SATURATED_THRESHOLD_MS:
         return 'QUEUING_DELAY - Sistema saturado (utilização >= threshold). Adicionar nós imediatamente.'
 
     if queuing_ms > (prefill_ms * 2):
@@ -269,6 +324,32 @@ def identify_bottleneck(
 # Recomendação
 # ---------------------------------------------------------------------------
 
+# Status que não geram recomendação (lookup O(1))
+_NO_RECOMMENDATION_STATUS = frozenset({'OK', 'SLO_MARGINAL', 'NO_SLO'})
+
+# Templates de recomendação (str.format), pré-montados no import
+_REC_QUEUING = (
+    "SLO inviável com a configuração atual: sistema saturado ({util:.1f}% utilização). "
+    "Impossível atender TTFT/TPOT com o modelo e servidor selecionados sob as premissas atuais. "
+    "Reduza contexto, reduza concorrência, use mais servidores de inferência ou ajuste quantização."
+)
+_REC_PREFILL = (
+    "Tempo de prefill ({ttft:.0f}ms) domina a latência. "
+    "TTFT mínimo viável estimado: {min_feasible:.0f}ms. "
+    "Impossível atender TTFT/TPOT com o modelo e servidor selecionados sob as premissas atuais. "
+    "Reduza contexto, use servidor com maior throughput de prefill ou ajuste quantização."
+)
+_REC_DECODE = (
+    "Throughput de decode insuficiente ({tpot:.2f} tok/s). "
+    "Impossível atender TTFT/TPOT com o modelo e servidor selecionados sob as premissas atuais. "
+    "Reduza concorrência por nó, use servidor com maior throughput de decode ou ajuste quantização."
+)
+_REC_OTHER = (
+    "Impossível atender TTFT/TPOT com o modelo e servidor selecionados sob as premissas atuais. "
+    "Verifique configuração de paralelismo e otimizações do serving framework."
+)
+
+
 def generate_recommendation(
     status: str,
     bottleneck: str,
@@ -281,45 +362,100 @@ def generate_recommendation(
     target_ttft_p50: Optional[int]
 ) -> str:
     """Gera diagnóstico de gargalo baseado no status e bottleneck."""
-    if status in ('OK', 'SLO_MARGINAL', 'NO_SLO'):
+    if status in _NO_RECOMMENDATION_STATUS:
         return ''
 
-    lines = []
-
     if 'QUEUING_DELAY' in bottleneck:
-        lines.append(
-            f"SLO inviável com a configuração atual: sistema saturado ({utilization*100:.1f}% utilização). "
-            f"Impossível atender TTFT/TPOT com o modelo e servidor selecionados sob as premissas atuais. "
-            f"Reduza contexto, reduza concorrência, use mais servidores de inferência ou ajuste quantização."
-        )
-    elif 'PREFILL_COMPUTE' in bottleneck or 'PREFILL_MODERATE' in bottleneck:
-        min_feasible = (ttft_p50_ms or 0) * 1.05
-        lines.append(
-            f"Tempo de prefill ({ttft_p50_ms:.0f}ms) domina a latência. "
-            f"TTFT mínimo viável estimado: {min_feasible:.0f}ms. "
-            f"Impossível atender TTFT/TPOT com o modelo e servidor selecionados sob as premissas atuais. "
-            f"Reduza contexto, use servidor com maior throughput de prefill ou ajuste quantização."
-        )
-    elif 'DECODE_THROUGHPUT' in bottleneck:
-        lines.append(
-            f"Throughput de decode insuficiente ({tpot_tokens_per_sec:.2f} tok/s). "
-            f"Impossível atender TTFT/TPOT com o modelo e servidor selecionados sob as premissas atuais. "
-            f"Reduza concorrência por nó, use servidor com maior throughput de decode ou ajuste quantização."
+        return _REC_QUEUING.format(util=utilization * _PERCENT)
+    if 'PREFILL_COMPUTE' in bottleneck or 'PREFILL_MODERATE' in bottleneck:
+        return _REC_PREFILL.format(
+            ttft=ttft_p50_ms, min_feasible=(ttft_p50_ms or 0) * _MIN_FEASIBLE_FACTOR
         )
+    if 'DECODE_THROUGHPUT' in bottleneck:
+        return _REC_DECODE.format(tpot=tpot_tokens_per_sec)
+    return _REC_OTHER
+
+
+# ---------------------------------------------------------------------------
+# Kernel de latência (primitivos apenas; compilado com numba se disponível)
+# ---------------------------------------------------------------------------
+
+# Sem fastmath=True: reassociar as somas/produtos mudaria os últimos bits dos
+# tempos, e o relatório passaria a depender de o numba estar instalado; o
+# ganho seria nulo para um kernel escalar chamado 3 vezes por execução.
+@njit(cache=True)
+def _core_latency(
+    avg_input_tokens: int,
+    avg_output_tokens: int,
+    prefill_thr: float,
+    decode_thr: float,
+    concurrency: int,
+    sessions_per_node: int,
+    total_sessions: int,
+    network_p50: float,
+    network_p99: float,
+    max_util_threshold: float,
+    qf_p50: float,
+    qf_p99: float
+) -> Tuple[float, float, float, float, float, float, float, float, float]:
+    """
+    Núcleo aritmético de calc_latency_analysis.
+
+    Retorna (prefill_ms, decode_ms, tpot_tok_s, itl_ms, utilization,
+    queuing_p50_ms, queuing_p99_ms, ttft_p50_ms, ttft_p99_ms).
+    """
+    # -- Tempos de compute
+    prefill_time_ms = (avg_input_tokens / prefill_thr) * _MS_PER_SEC
+    decode_time_ms = (avg_output_tokens / decode_thr) * _MS_PER_SEC
+
+    # -- TPOT por sessão
+    tpot_tokens_per_sec = decode_thr / sessions_per_node if sessions_per_node > 0 else 0.0
+    itl_ms = _MS_PER_SEC / tpot_tokens_per_sec if tpot_tokens_per_sec > 0 else _SATURATED_MS
+
+    # -- Utilização e queuing delay
+    utilization = min(concurrency / total_sessions, 1.0) if total_sessions > 0 else 1.0
+
+    if utilization >= max_util_threshold:
+        queuing_p50 = _SATURATED_MS
+        queuing_p99 = _SATURATED_MS
     else:
-        lines.append(
-            "Impossível atender TTFT/TPOT com o modelo e servidor selecionados sob as premissas atuais. "
-            "Verifique configuração de paralelismo e otimizações do serving framework."
-        )
+        service_time = prefill_time_ms + decode_time_ms
+        queuing_factor = utilization / (1.0 - utilization)
+        queuing_p50 = queuing_factor * service_time * qf_p50
+        queuing_p99 = queuing_factor * service_time * qf_p99
+
+    # -- TTFT
+    ttft_p50 = network_p50 + queuing_p50 + prefill_time_ms
+    ttft_p99 = network_p99 + queuing_p99 + (prefill_time_ms * _TTFT_P99_PREFILL_FACTOR)
 
-    return '\n'.join(lines)
+    return (prefill_time_ms, decode_time_ms, tpot_tokens_per_sec, itl_ms, utilization,
+            queuing_p50, queuing_p99, ttft_p50, ttft_p99)
 
 
 # ---------------------------------------------------------------------------
 # Cálculo principal
 # ---------------------------------------------------------------------------
 
-def calc_latency_analysis(
+def _load_latency_params() -> Dict[str, Any]:
+    """
+    Carrega de parameters.json todos os parâmetros do cálculo de latência.
+
+    Permite que chamadores em lote (ex.: calc_scenarios_fused) leiam os
+    parâmetros uma única vez e os reutilizem em todos os pontos.
+    """
+    return {
+        'network_p50': float(load_parameter('network_latency_p50_ms', 10)),
+        'network_p99': float(load_parameter('network_latency_p99_ms', 50)),
+        'avg_output_tokens': int(load_parameter('avg_output_tokens', 100)),
+        'max_util_threshold': float(load_parameter('max_utilization_threshold', 0.95)),
+        'ttft_p99_multiplier': float(load_parameter('ttft_p99_multiplier', 2.0)),
+        'qf_p50': float(load_parameter('queuing_factor_p50', 0.3)),
+        'qf_p99': float(load_parameter('queuing_factor_p99', 0.8)),
+        'benchmarks': load_latency_benchmarks(),
+    }
+
+
+def _calc_latency_fields(
     model: ModelSpec,
     server: ServerSpec,
     num_nodes: int,
@@ -329,10 +465,12 @@ def calc_latency_analysis(
     target_ttft_p99_ms: Optional[int],
     target_tpot_min_tokens_per_sec: Optional[float],
     effective_context: int
-) -> 'LatencyAnalysis':
+) -> Dict[str, Any]:
     """
     Calcula TTFT e TPOT esperados e valida contra SLOs.
 
+    Retorna os campos de LatencyAnalysis como dict (sem construir a dataclass).
+
     Quando targets são None (Modo A - Concorrência-Driven), retorna estimativas
     sem validação de SLO (status = 'NO_SLO').
 
@@ -343,50 +481,55 @@ def calc_latency_analysis(
       - queuing_factor_p50, queuing_factor_p99
       - latency_benchmarks (para classificação)
     """
+    return _latency_fields_from_throughput(
+        _load_latency_params(), get_token_throughput(model, server),
+        num_nodes, sessions_per_node, concurrency,
+        target_ttft_p50_ms, target_ttft_p99_ms,
+        target_tpot_min_tokens_per_sec, effective_context
+    )
 
-    # -- Carregar parâmetros de parameters.json ----------------------------
-    network_p50 = float(load_parameter('network_latency_p50_ms', 10))
-    network_p99 = float(load_parameter('network_latency_p99_ms', 50))
-    avg_output_tokens = int(load_parameter('avg_output_tokens', 100))
-    max_util_threshold = float(load_parameter('max_utilization_threshold', 0.95))
-    ttft_p99_multiplier = float(load_parameter('ttft_p99_multiplier', 2.0))
-    qf_p50 = float(load_parameter('queuing_factor_p50', 0.3))
-    qf_p99 = float(load_parameter('queuing_factor_p99', 0.8))
+
+def _latency_fields_from_throughput(
+    params: Dict[str, Any],
+    throughput: Tuple[float, float, str, str],
+    num_nodes: int,
+    sessions_per_node: int,
+    concurrency: int,
+    target_ttft_p50_ms: Optional[int],
+    target_ttft_p99_ms: Optional[int],
+    target_tpot_min_tokens_per_sec: Optional[float],
+    effective_context: int
+) -> Dict[str, Any]:
+    """
+    Núcleo de _calc_latency_fields com parâmetros (_load_latency_params) e
+    throughput (get_token_throughput) já resolvidos pelo chamador.
+    """
+    network_p50 = params['network_p50']
+    network_p99 = params['network_p99']
+    avg_output_tokens = params['avg_output_tokens']
+    max_util_threshold = params['max_util_threshold']
+    ttft_p99_multiplier = params['ttft_p99_multiplier']
+    qf_p50 = params['qf_p50']
+    qf_p99 = params['qf_p99']
+    benchmarks = params['benchmarks']
 
     # Default P99 se não especificado pelo usuário
     if target_ttft_p50_ms is not None and target_ttft_p99_ms is None:
         target_ttft_p99_ms = int(target_ttft_p50_ms * ttft_p99_multiplier)
 
     # -- Throughput de tokens ----------------------------------------------
-    prefill_thr, decode_thr, src_prefill, src_decode = get_token_throughput(model, server)
+    prefill_thr, decode_thr, src_prefill, src_decode = throughput
 
     # -- Tokens de entrada: effective_context / 2 --------------------------
-    avg_input_tokens = max(1, effective_context // 2)
-
-    # -- Tempos de compute -------------------------------------------------
-    prefill_time_ms = (avg_input_tokens / prefill_thr) * 1000.0
-    decode_time_ms = (avg_output_tokens / decode_thr) * 1000.0
-
-    # -- TPOT por sessão ---------------------------------------------------
-    total_sessions = num_nodes * sessions_per_node
-    tpot_tokens_per_sec = decode_thr / sessions_per_node if sessions_per_node > 0 else 0.0
-    itl_ms = 1000.0 / tpot_tokens_per_sec if tpot_tokens_per_sec > 0 else 99999.0
-
-    # -- Utilização e queuing delay ----------------------------------------
-    utilization = min(concurrency / total_sessions, 1.0) if total_sessions > 0 else 1.0
-
-    if utilization >= max_util_threshold:
-        queuing_p50 = 99999.0
-        queuing_p99 = 99999.0
-    else:
-        service_time = prefill_time_ms + decode_time_ms
-        queuing_factor = utilization / (1.0 - utilization)
-        queuing_p50 = queuing_factor * service_time * qf_p50
-        queuing_p99 = queuing_factor * service_time * qf_p99
-
-    # -- TTFT --------------------------------------------------------------
-    ttft_p50 = network_p50 + queuing_p50 + prefill_time_ms
-    ttft_p99 = network_p99 + queuing_p99 + (prefill_time_ms * 1.2)
+    avg_input_tokens = max(1, effective_context // _INPUT_TOKEN_RATIO)
+
+    # -- Tempos, TPOT, utilização, queuing e TTFT (kernel) ----------------
+    (prefill_time_ms, decode_time_ms, tpot_tokens_per_sec, itl_ms, utilization,
+     queuing_p50, queuing_p99, ttft_p50, ttft_p99) = _core_latency(
+        avg_input_tokens, avg_output_tokens, prefill_thr, decode_thr,
+        concurrency, sessions_per_node, num_nodes * sessions_per_node,
+        network_p50, network_p99, max_util_threshold, qf_p50, qf_p99
+    )
 
     # -- Validação SLO (apenas Modo B) -------------------------------------
     ttft_p50_ok = True
@@ -400,16 +543,16 @@ def calc_latency_analysis(
 
     if target_ttft_p50_ms is not None:
         ttft_p50_ok = ttft_p50 <= target_ttft_p50_ms
-        ttft_p50_margin = ((target_ttft_p50_ms - ttft_p50) / target_ttft_p50_ms) * 100
+        ttft_p50_margin = ((target_ttft_p50_ms - ttft_p50) / target_ttft_p50_ms) * _PERCENT
 
     if target_ttft_p99_ms is not None:
         ttft_p99_ok = ttft_p99 <= target_ttft_p99_ms
-        ttft_p99_margin = ((target_ttft_p99_ms - ttft_p99) / target_ttft_p99_ms) * 100
+        ttft_p99_margin = ((target_ttft_p99_ms - ttft_p99) / target_ttft_p99_ms) * _PERCENT
 
     if target_tpot_min_tokens_per_sec is not None:
         tpot_ok = tpot_tokens_per_sec >= target_tpot_min_tokens_per_sec
         tpot_margin = ((tpot_tokens_per_sec - target_tpot_min_tokens_per_sec) /
-                       target_tpot_min_tokens_per_sec) * 100
+                       target_tpot_min_tokens_per_sec) * _PERCENT
 
     if no_slo:
         status = 'NO_SLO'
@@ -424,12 +567,11 @@ def calc_latency_analysis(
             status = 'SLO_VIOLATION'
 
     # -- Qualidade ---------------------------------------------------------
-    benchmarks = load_latency_benchmarks()
     ttft_quality = classify_ttft(ttft_p50, benchmarks)
     tpot_quality = classify_tpot(tpot_tokens_per_sec, benchmarks)
 
     # -- Gargalo e recomendação -------------------------------------------
-    bottleneck = identify_bottleneck(queuing_p50, prefill_time_ms, tpot_tokens_per_sec)
+    bottleneck = identify_bottleneck(queuing_p50, prefill_time_ms, tpot_tokens_per_sec, benchmarks)
     recommendation = generate_recommendation(
         status, bottleneck, utilization,
         num_nodes, sessions_per_node,
@@ -437,7 +579,7 @@ def calc_latency_analysis(
         ttft_p50, target_ttft_p50_ms
     )
 
-    return LatencyAnalysis(
+    return dict(
         target_ttft_p50_ms=target_ttft_p50_ms,
         target_ttft_p99_ms=target_ttft_p99_ms,
         target_tpot_tokens_per_sec=target_tpot_min_tokens_per_sec,
@@ -472,6 +614,53 @@ def calc_latency_analysis(
     )
 
 
+def calc_latency_analysis(
+    model: ModelSpec,
+    server: ServerSpec,
+    num_nodes: int,
+    sessions_per_node: int,
+    concurrency: int,
+    target_ttft_p50_ms: Optional[int],
+    target_ttft_p99_ms: Optional[int],
+    target_tpot_min_tokens_per_sec: Optional[float],
+    effective_context: int
+) -> 'LatencyAnalysis':
+    """
+    Calcula TTFT e TPOT esperados e valida contra SLOs.
+
+    Quando targets são None (Modo A - Concorrência-Driven), retorna estimativas
+    sem validação de SLO (status = 'NO_SLO').
+    """
+    return LatencyAnalysis(**_calc_latency_fields(
+        model, server, num_nodes, sessions_per_node, concurrency,
+        target_ttft_p50_ms, target_ttft_p99_ms,
+        target_tpot_min_tokens_per_sec, effective_context
+    ))
+
+
+def calc_latency_analysis_dict(
+    model: ModelSpec,
+    server: ServerSpec,
+    num_nodes: int,
+    sessions_per_node: int,
+    concurrency: int,
+    target_ttft_p50_ms: Optional[int],
+    target_ttft_p99_ms: Optional[int],
+    target_tpot_min_tokens_per_sec: Optional[float],
+    effective_context: int
+) -> Dict[str, Any]:
+    """
+    Caminho rápido para exportação: mesmo cálculo de calc_latency_analysis,
+    mas retorna diretamente o dict serializável (formato de
+    latency_analysis_to_dict) sem instanciar LatencyAnalysis.
+    """
+    return _latency_fields_to_dict(_calc_latency_fields(
+        model, server, num_nodes, sessions_per_node, concurrency,
+        target_ttft_p50_ms, target_ttft_p99_ms,
+        target_tpot_min_tokens_per_sec, effective_context
+    ))
+
+
 def calc_max_concurrency_from_slo(
     model: ModelSpec,
     server: ServerSpec,
@@ -493,7 +682,32 @@ def calc_max_concurrency_from_slo(
       sess_max = floor(decode_thr / tpot_min)
       max_conc_tpot = sess_max * num_nodes
     """
-    from .calc_scenarios import SLOCapacityResult
+    return calc_max_concurrency_from_slo_batch(
+        model, server, [num_nodes], sessions_per_node,
+        target_ttft_p50_ms, target_tpot_min_tokens_per_sec, effective_context
+    )[0]
+
+
+def calc_max_concurrency_from_slo_batch(
+    model: ModelSpec,
+    server: ServerSpec,
+    num_nodes_list: Sequence[int],
+    sessions_per_node: int,
+    target_ttft_p50_ms: Optional[int],
+    target_tpot_min_tokens_per_sec: Optional[float],
+    effective_context: int
+) -> List['SLOCapacityResult']:
+    """
+    Versão em lote de calc_max_concurrency_from_slo para curvas de capacidade.
+
+    Parâmetros, throughput e tempos de prefill/decode (que não dependem de
+    num_nodes) são resolvidos uma única vez; cada ponto de num_nodes_list é
+    avaliado em forma fechada por compute_slo_capacity.
+
+    Returns:
+        Lista de SLOCapacityResult, na mesma ordem de num_nodes_list
+    """
+    from .calc_scenarios import compute_slo_capacity
 
     network_p50 = float(load_parameter('network_latency_p50_ms', 10))
     qf_p50 = float(load_parameter('queuing_factor_p50', 0.3))
@@ -501,119 +715,91 @@ def calc_max_concurrency_from_slo(
 
     prefill_thr, decode_thr, _, _ = get_token_throughput(model, server)
 
-    avg_input_tokens = max(1, effective_context // 2)
+    avg_input_tokens = max(1, effective_context // _INPUT_TOKEN_RATIO)
     avg_output_tokens = int(load_parameter('avg_output_tokens', 100))
 
-    prefill_time_ms = (avg_input_tokens / prefill_thr) * 1000.0
-    decode_time_ms = (avg_output_tokens / decode_thr) * 1000.0
-    service_time = prefill_time_ms + decode_time_ms
+    prefill_time_ms = (avg_input_tokens / prefill_thr) * _MS_PER_SEC
+    decode_time_ms = (avg_output_tokens / decode_thr) * _MS_PER_SEC
 
-    # === LIMITE POR TTFT ===
-    queuing_budget_ms = 0.0
-    util_max_from_ttft = max_util
-    max_concurrency_from_ttft = int(max_util * num_nodes * sessions_per_node)
-    is_feasible = True
-    infeasibility_reason = ""
-
-    if target_ttft_p50_ms is not None:
-        queuing_budget_ms = float(target_ttft_p50_ms) - network_p50 - prefill_time_ms
-        if queuing_budget_ms <= 0:
-            is_feasible = False
-            min_feasible = network_p50 + prefill_time_ms * 1.05
-            infeasibility_reason = (
-                f"Prefill ({prefill_time_ms:.0f}ms) + rede ({network_p50:.0f}ms) = {prefill_time_ms+network_p50:.0f}ms "
-                f"ja excede o SLO de TTFT ({target_ttft_p50_ms}ms). "
-                f"TTFT minimo viavel: {min_feasible:.0f}ms. "
-                f"Reducao de contexto ou GPU com maior throughput de prefill sao necessarios."
-            )
-            util_max_from_ttft = 0.0
-            max_concurrency_from_ttft = 0
-        else:
-            denom = service_time * qf_p50 + queuing_budget_ms
-            util_max_from_ttft = min(queuing_budget_ms / denom, max_util) if denom > 0 else 0.0
-            max_concurrency_from_ttft = int(util_max_from_ttft * num_nodes * sessions_per_node)
-
-    # === LIMITE POR TPOT ===
-    sessions_per_node_max_from_tpot = sessions_per_node
-    max_concurrency_from_tpot = num_nodes * sessions_per_node
-
-    if target_tpot_min_tokens_per_sec is not None and target_tpot_min_tokens_per_sec > 0:
-        sessions_per_node_max_from_tpot = max(1, int(decode_thr / target_tpot_min_tokens_per_sec))
-        max_concurrency_from_tpot = sessions_per_node_max_from_tpot * num_nodes
-
-    # === GARGALO ===
-    max_concurrency_combined = min(max_concurrency_from_ttft, max_concurrency_from_tpot)
-
-    if target_ttft_p50_ms is None and target_tpot_min_tokens_per_sec is None:
-        limiting_factor = "NO_SLO"
-    elif target_ttft_p50_ms is None:
-        limiting_factor = "TPOT"
-    elif target_tpot_min_tokens_per_sec is None:
-        limiting_factor = "TTFT"
-    elif max_concurrency_from_ttft < max_concurrency_from_tpot:
-        limiting_factor = "TTFT"
-    elif max_concurrency_from_tpot < max_concurrency_from_ttft:
-        limiting_factor = "TPOT"
-    else:
-        limiting_factor = "BALANCED"
-
-    return SLOCapacityResult(
-        max_concurrency_from_ttft=max_concurrency_from_ttft,
-        max_concurrency_from_tpot=max_concurrency_from_tpot,
-        max_concurrency_combined=max_concurrency_combined,
-        limiting_factor=limiting_factor,
-        util_max_from_ttft=util_max_from_ttft,
-        sessions_per_node_max_from_tpot=sessions_per_node_max_from_tpot,
-        prefill_time_ms=prefill_time_ms,
-        queuing_budget_ms=queuing_budget_ms,
-        is_feasible=is_feasible,
-        infeasibility_reason=infeasibility_reason
-    )
+    return [
+        compute_slo_capacity(
+            num_nodes, sessions_per_node, prefill_time_ms, decode_time_ms, decode_thr,
+            network_p50, qf_p50, max_util,
+            target_ttft_p50_ms, target_tpot_min_tokens_per_sec
+        )
+        for num_nodes in num_nodes_list
+    ]
 
 
 def latency_analysis_to_dict(la: Optional['LatencyAnalysis']) -> Optional[Dict[str, Any]]:
     """Converte LatencyAnalysis para dict serializável em JSON."""
     if la is None:
         return None
+    return _latency_fields_to_dict(vars(la))
+
+
+def latency_analysis_to_json_bytes(la: Optional['LatencyAnalysis']) -> bytes:
+    """Serializa LatencyAnalysis em JSON UTF-8 (orjson se disponível)."""
+    return _dumps_json_bytes(latency_analysis_to_dict(la))
+
+
+def latency_analyses_to_json_bytes(analyses: Iterable[Optional['LatencyAnalysis']]) -> bytes:
+    """
+    Serializa várias análises (ex.: uma varredura) como um único array JSON.
+
+    Os dicts são agregados em lista e serializados de uma só vez.
+    """
+    return _dumps_json_bytes([latency_analysis_to_dict(la) for la in analyses])
+
+
+def _dumps_json_bytes(data: Any) -> bytes:
+    """json compacto em UTF-8; mesma saída com orjson ou com a stdlib."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _latency_fields_to_dict(f: Dict[str, Any]) -> Dict[str, Any]:
+    """Monta o dict serializável a partir dos campos de LatencyAnalysis."""
     return {
         "slo_defined": {
-            "target_ttft_p50_ms": la.target_ttft_p50_ms,
-            "target_ttft_p99_ms": la.target_ttft_p99_ms,
-            "target_tpot_min_tokens_per_sec": la.target_tpot_tokens_per_sec,
-            "avg_input_tokens": la.avg_input_tokens,
-            "avg_output_tokens": la.avg_output_tokens
+            "target_ttft_p50_ms": f['target_ttft_p50_ms'],
+            "target_ttft_p99_ms": f['target_ttft_p99_ms'],
+            "target_tpot_min_tokens_per_sec": f['target_tpot_tokens_per_sec'],
+            "avg_input_tokens": f['avg_input_tokens'],
+            "avg_output_tokens": f['avg_output_tokens']
         },
         "expected": {
-            "network_latency_p50_ms": round(la.network_latency_p50_ms, 1),
-            "network_latency_p99_ms": round(la.network_latency_p99_ms, 1),
-            "prefill_time_ms": round(la.prefill_time_ms, 1),
-            "decode_time_ms": round(la.decode_time_ms, 1),
-            "queuing_delay_p50_ms": round(la.queuing_delay_p50_ms, 1) if la.queuing_delay_p50_ms < 99000 else "saturated",
-            "queuing_delay_p99_ms": round(la.queuing_delay_p99_ms, 1) if la.queuing_delay_p99_ms < 99000 else "saturated",
-            "ttft_p50_ms": round(la.ttft_p50_ms, 1),
-            "ttft_p99_ms": round(la.ttft_p99_ms, 1),
-            "tpot_tokens_per_sec": round(la.tpot_tokens_per_sec, 2),
-            "itl_ms_per_token": round(la.itl_ms_per_token, 1) if la.itl_ms_per_token < 99000 else "n/a",
-            "utilization_percent": round(la.utilization * 100, 1)
+            "network_latency_p50_ms": round(f['network_latency_p50_ms'], 1),
+            "network_latency_p99_ms": round(f['network_latency_p99_ms'], 1),
+            "prefill_time_ms": round(f['prefill_time_ms'], 1),
+            "decode_time_ms": round(f['decode_time_ms'], 1),
+            "queuing_delay_p50_ms": round(f['queuing_delay_p50_ms'], 1) if f['queuing_delay_p50_ms'] < _SATURATED_THRESHOLD_MS else "saturated",
+            "queuing_delay_p99_ms": round(f['queuing_delay_p99_ms'], 1) if f['queuing_delay_p99_ms'] < _SATURATED_THRESHOLD_MS else "saturated",
+            "ttft_p50_ms": round(f['ttft_p50_ms'], 1),
+            "ttft_p99_ms": round(f['ttft_p99_ms'], 1),
+            "tpot_tokens_per_sec": round(f['tpot_tokens_per_sec'], 2),
+            "itl_ms_per_token": round(f['itl_ms_per_token'], 1) if f['itl_ms_per_token'] < _SATURATED_THRESHOLD_MS else "n/a",
+            "utilization_percent": round(f['utilization'] * _PERCENT, 1)
         },
         "validation": {
-            "status": la.status,
-            "ttft_p50_ok": la.ttft_p50_ok,
-            "ttft_p99_ok": la.ttft_p99_ok,
-            "tpot_ok": la.tpot_ok,
-            "ttft_p50_margin_percent": round(la.ttft_p50_margin_percent, 1),
-            "ttft_p99_margin_percent": round(la.ttft_p99_margin_percent, 1),
-            "tpot_margin_percent": round(la.tpot_margin_percent, 1),
-            "ttft_quality": la.ttft_quality,
-            "tpot_quality": la.tpot_quality,
-            "bottleneck": la.bottleneck,
-            "recommendation": la.recommendation
+            "status": f['status'],
+            "ttft_p50_ok": f['ttft_p50_ok'],
+            "ttft_p99_ok": f['ttft_p99_ok'],
+            "tpot_ok": f['tpot_ok'],
+            "ttft_p50_margin_percent": round(f['ttft_p50_margin_percent'], 1),
+            "ttft_p99_margin_percent": round(f['ttft_p99_margin_percent'], 1),
+            "tpot_margin_percent": round(f['tpot_margin_percent'], 1),
+            "ttft_quality": f['ttft_quality'],
+            "tpot_quality": f['tpot_quality'],
+            "bottleneck": f['bottleneck'],
+            "recommendation": f['recommendation']
         },
         "rationale": {
-            "prefill_throughput_tokens_per_sec": round(la.prefill_throughput, 1),
-            "decode_throughput_tokens_per_sec": round(la.decode_throughput, 1),
-            "source_prefill": la.source_prefill,
-            "source_decode": la.source_decode,
+            "prefill_throughput_tokens_per_sec": round(f['prefill_throughput'], 1),
+            "decode_throughput_tokens_per_sec": round(f['decode_throughput'], 1),
+            "source_prefill": f['source_prefill'],
+            "source_decode": f['source_decode'],
             "queuing_model": "M/M/c Little's Law (queuing_factor_* from parameters.json)"
         }
     }
@@ -2,16 +2,26 @@
 Cálculos de cenários (Mínimo, Recomendado, Ideal).
 """
 
+from __future__ import annotations
+
+import functools
 import math
+import operator
 from dataclasses import dataclass
-from typing import List, Optional
+from types import MappingProxyType
+from typing import Mapping, NamedTuple, Sequence
 
 from .calc_vram import VRAMResult
 from .calc_storage import StorageRequirements
+from .calc_response_time import (
+    LatencyAnalysis, get_token_throughput,
+    _load_latency_params, _latency_fields_from_throughput, _MIN_FEASIBLE_FACTOR,
+)
+from .models import ModelSpec
+from .servers import ServerSpec
 
 
-@dataclass
-class SLOCapacityResult:
+class SLOCapacityResult(NamedTuple):
     """Resultado do cálculo de capacidade máxima a partir de SLOs de latência."""
     max_concurrency_from_ttft: int
     max_concurrency_from_tpot: int
@@ -25,20 +35,18 @@ class SLOCapacityResult:
     infeasibility_reason: str
 
 
-@dataclass
-class CalibrationRecommendation:
+class CalibrationRecommendation(NamedTuple):
     """Recomendação de calibração para atender SLOs com a concorrência desejada."""
     nodes_current: int
-    nodes_recommended: Optional[int]
+    nodes_recommended: int | None
     max_concurrency_current_nodes: int
     concurrency_requested: int
     limiting_factor: str        # "TTFT" | "TPOT" | "BALANCED" | "INFEASIBLE"
     extra_nodes_needed: int
 
 
-@dataclass
-class ScenarioConfig:
-    """Configuração de um cenário."""
+class ScenarioConfig(NamedTuple):
+    """Configuração de um cenário (imutável: instâncias são compartilhadas via cache)."""
     name: str
     peak_headroom_ratio: float
     ha_mode: str  # "none", "n+1", "n+2"
@@ -46,9 +54,9 @@ class ScenarioConfig:
     kv_budget_ratio: float
 
 
-@dataclass
-class ScenarioResult:
-    """Resultado completo de um cenário."""
+@dataclass(frozen=True, slots=True)
+class ScenarioCore:
+    """Núcleo imutável de um cenário: o que calc_scenario calcula."""
     config: ScenarioConfig
     vram: VRAMResult
     
@@ -62,13 +70,34 @@ class ScenarioResult:
     vram_total_node_effective_gib: float
     hbm_utilization_ratio_effective: float
     
+    # Viabilidade (False quando não cabe nem 1 sessão por nó; nós ficam zerados)
+    is_feasible: bool = True
+    infeasibility_reason: str = ""
+
+
+def _core_property(name: str) -> property:
+    """Expõe ScenarioCore.<name> como atributo somente leitura de ScenarioResult."""
+    return property(operator.attrgetter(f"core.{name}"), doc=f"ScenarioCore.{name}")
+
+
+@dataclass(slots=True)
+class ScenarioResult:
+    """
+    Resultado completo de um cenário.
+    
+    Compõe o núcleo imutável (ScenarioCore) com os campos preenchidos pelas
+    etapas seguintes (físico, storage, latência, SLO); os campos do núcleo
+    continuam acessíveis diretamente (ex.: result.nodes_final).
+    """
+    core: ScenarioCore
+    
     # Físico - Compute (será preenchido por calc_physical)
     total_power_kw: float = 0.0
     total_rack_u: int = 0
     total_heat_btu_hr: float = 0.0
     
     # Storage (será preenchido por calc_storage)
-    storage: Optional[StorageRequirements] = None
+    storage: StorageRequirements | None = None
     
     # Físico - Storage
     storage_rack_u: int = 0
@@ -79,30 +108,45 @@ class ScenarioResult:
     total_rack_u_with_storage: int = 0
     
     # Análise de latência TTFT/TPOT (será preenchido por main)
-    latency: Optional[object] = None
+    latency: object | None = None
 
     # Capacidade máxima por SLO (Modo SLO-Driven)
-    slo_capacity: Optional[SLOCapacityResult] = None
+    slo_capacity: SLOCapacityResult | None = None
 
     # Calibração recomendada (Modo Concorrência-Driven com violação)
-    calibration: Optional[CalibrationRecommendation] = None
+    calibration: CalibrationRecommendation | None = None
+    
+    config = _core_property("config")
+    vram = _core_property("vram")
+    nodes_capacity = _core_property("nodes_capacity")
+    nodes_with_headroom = _core_property("nodes_with_headroom")
+    nodes_final = _core_property("nodes_final")
+    sessions_per_node_effective = _core_property("sessions_per_node_effective")
+    vram_total_node_effective_gib = _core_property("vram_total_node_effective_gib")
+    hbm_utilization_ratio_effective = _core_property("hbm_utilization_ratio_effective")
+    is_feasible = _core_property("is_feasible")
+    infeasibility_reason = _core_property("infeasibility_reason")
 
 
+@functools.lru_cache(maxsize=32)
 def create_scenario_configs(
     peak_headroom_ratio: float,
     kv_budget_ratio: float
-) -> dict[str, ScenarioConfig]:
+) -> Mapping[str, ScenarioConfig]:
     """
     Cria configurações dos 3 cenários padrão.
     
+    Memoizado por (headroom, budget): chamadas repetidas compartilham o mesmo
+    mapeamento somente leitura e as mesmas instâncias imutáveis de ScenarioConfig.
+    
     Args:
         peak_headroom_ratio: Ratio de headroom fornecido pelo usuário
         kv_budget_ratio: Ratio de budget fornecido pelo usuário
     
     Returns:
-        Dict com configurações "minimum", "recommended", "ideal"
+        Mapeamento somente leitura com configurações "minimum", "recommended", "ideal"
     """
-    return {
+    return MappingProxyType({
         "minimum": ScenarioConfig(
             name="MÍNIMO",
             peak_headroom_ratio=0.0,
@@ -124,7 +168,7 @@ def create_scenario_configs(
             ha_extra_nodes=2,
             kv_budget_ratio=min(kv_budget_ratio, 0.65)
         )
-    }
+    })
 
 
 def calc_scenario(
@@ -145,38 +189,250 @@ def calc_scenario(
     Returns:
         ScenarioResult com métricas do cenário
     """
-    # Calcular número de nós
-    if vram.sessions_per_node > 0:
-        nodes_capacity = math.ceil(concurrency / vram.sessions_per_node)
-    else:
-        nodes_capacity = 999999  # Indicador de erro
+    cols = calc_scenarios_batch([config], [vram], concurrency, runtime_overhead_gib)
+    return ScenarioResult(core=ScenarioCore(
+        config=config,
+        vram=vram,
+        **{field: values[0] for field, values in cols.items()}
+    ))
+
+
+def _infeasibility_reason(vram: VRAMResult, runtime_overhead_gib: float) -> str:
+    """
+    Motivo de sessions_per_node == 0: floor(budget KV / KV por sessão) é zero.
+    
+    budget KV = max(0, HBM - pesos - overhead) x kv_budget_ratio (sessions_budget_gib).
+    """
+    return (
+        f"Não cabe nem 1 sessão por nó: budget de KV ({vram.sessions_budget_gib:.2f} GiB) "
+        f"< KV/sessão ({vram.vram_per_session_gib:.2f} GiB). "
+        f"Budget = (HBM {vram.hbm_total_gib:.1f} GiB - pesos {vram.fixed_model_gib:.1f} GiB "
+        f"- overhead {runtime_overhead_gib:.1f} GiB) x kv_budget_ratio."
+    )
+
+
+def calc_scenarios_batch(
+    configs: Sequence[ScenarioConfig],
+    vrams: Sequence[VRAMResult],
+    concurrency: int,
+    runtime_overhead_gib: float
+) -> dict[str, list]:
+    """
+    Calcula as métricas de nós de vários cenários de uma vez (estrutura SoA).
+    
+    Args:
+        configs: Configurações dos cenários
+        vrams: VRAMResult de cada cenário, na mesma ordem de configs
+        concurrency: Sessões simultâneas alvo
+        runtime_overhead_gib: Overhead do runtime
+    
+    Returns:
+        Dict campo de ScenarioCore -> lista com um valor por cenário
+    """
+    ceil = math.ceil
+    
+    # Sem sessões por nó o cenário é inviável: métricas zeradas, sem propagar aritmética
+    feasible = [v.sessions_per_node > 0 for v in vrams]
     
-    nodes_with_headroom = math.ceil(nodes_capacity * (1 + config.peak_headroom_ratio))
-    nodes_final = nodes_with_headroom + config.ha_extra_nodes
+    # Divisões inteiras usam -(-a // b) (teto sem passar por float)
+    nodes_capacity = [
+        -(-concurrency // v.sessions_per_node) if ok else 0
+        for v, ok in zip(vrams, feasible)
+    ]
+    nodes_with_headroom = [
+        ceil(n * (1 + c.peak_headroom_ratio)) if ok else 0
+        for n, c, ok in zip(nodes_capacity, configs, feasible)
+    ]
+    nodes_final = [
+        n + c.ha_extra_nodes if ok else 0
+        for n, c, ok in zip(nodes_with_headroom, configs, feasible)
+    ]
     
-    # Calcular sessões efetivas por nó (operando)
-    sessions_per_node_effective = math.ceil(concurrency / nodes_final) if nodes_final > 0 else 0
+    # Sessões efetivas por nó (operando)
+    sessions_effective = [
+        -(-concurrency // n) if n > 0 else 0 for n in nodes_final
+    ]
     
     # VRAM total efetiva por nó
-    vram_total_node_effective_gib = (
-        vram.fixed_model_gib +
-        runtime_overhead_gib +
-        (sessions_per_node_effective * vram.vram_per_session_gib)
-    )
+    vram_effective = [
+        v.fixed_model_gib + runtime_overhead_gib + (s * v.vram_per_session_gib) if ok else 0.0
+        for v, s, ok in zip(vrams, sessions_effective, feasible)
+    ]
     
     # Utilização de HBM efetiva
-    hbm_utilization_ratio_effective = (
-        vram_total_node_effective_gib / vram.hbm_total_gib 
-        if vram.hbm_total_gib > 0 else 0.0
+    hbm_utilization = [
+        g / v.hbm_total_gib if ok and v.hbm_total_gib > 0 else 0.0
+        for v, g, ok in zip(vrams, vram_effective, feasible)
+    ]
+    
+    return {
+        "nodes_capacity": nodes_capacity,
+        "nodes_with_headroom": nodes_with_headroom,
+        "nodes_final": nodes_final,
+        "sessions_per_node_effective": sessions_effective,
+        "vram_total_node_effective_gib": vram_effective,
+        "hbm_utilization_ratio_effective": hbm_utilization,
+        "is_feasible": feasible,
+        "infeasibility_reason": [
+            "" if ok else _infeasibility_reason(v, runtime_overhead_gib)
+            for v, ok in zip(vrams, feasible)
+        ],
+    }
+
+
+def calc_scenarios_fused(
+    configs: Mapping[str, ScenarioConfig],
+    vrams: dict[str, VRAMResult],
+    concurrency: int,
+    runtime_overhead_gib: float,
+    model: ModelSpec,
+    server: ServerSpec,
+    effective_context: int,
+    target_ttft_p50_ms: int | None = None,
+    target_ttft_p99_ms: int | None = None,
+    target_tpot_min_tokens_per_sec: float | None = None
+) -> dict[str, tuple[ScenarioResult, LatencyAnalysis | None]]:
+    """
+    Calcula nós (calc_scenario) e latência de todos os cenários em uma passada.
+
+    Throughput de tokens e parâmetros de parameters.json são resolvidos uma
+    única vez, fora do laço, e reutilizados por todos os cenários.
+
+    Args:
+        configs: Configurações dos cenários (ver create_scenario_configs)
+        vrams: VRAMResult de cada cenário, com as mesmas chaves de configs
+        concurrency: Sessões simultâneas alvo (também usada na latência)
+        runtime_overhead_gib: Overhead do runtime
+        model: Especificação do modelo
+        server: Especificação do servidor
+        effective_context: Contexto efetivo (tokens)
+        target_*: SLOs de latência (None = estimativa sem SLO)
+
+    Returns:
+        Dict cenário -> (ScenarioResult com latency preenchido, LatencyAnalysis);
+        latência é None para cenários inviáveis (is_feasible=False)
+    """
+    params = _load_latency_params()
+    throughput = get_token_throughput(model, server)
+
+    keys = list(configs)
+    cols = calc_scenarios_batch(
+        [configs[k] for k in keys], [vrams[k] for k in keys],
+        concurrency, runtime_overhead_gib
     )
+
+    results = {}
+    for i, key in enumerate(keys):
+        scenario = ScenarioResult(core=ScenarioCore(
+            config=configs[key],
+            vram=vrams[key],
+            **{field: values[i] for field, values in cols.items()}
+        ))
+        latency = None
+        if scenario.is_feasible:
+            latency = LatencyAnalysis(**_latency_fields_from_throughput(
+                params, throughput,
+                scenario.nodes_final, scenario.sessions_per_node_effective, concurrency,
+                target_ttft_p50_ms, target_ttft_p99_ms,
+                target_tpot_min_tokens_per_sec, effective_context
+            ))
+        scenario.latency = latency
+        results[key] = (scenario, latency)
+
+    return results
+
+
+def compute_slo_capacity(
+    num_nodes: int,
+    sessions_per_node: int,
+    prefill_time_ms: float,
+    decode_time_ms: float,
+    decode_tokens_per_sec: float,
+    network_p50_ms: float,
+    queuing_factor_p50: float,
+    max_utilization: float,
+    target_ttft_p50_ms: int | None = None,
+    target_tpot_min_tokens_per_sec: float | None = None
+) -> SLOCapacityResult:
+    """
+    Capacidade máxima por SLO em forma fechada (sem busca sobre concorrências).
     
-    return ScenarioResult(
-        config=config,
-        vram=vram,
-        nodes_capacity=nodes_capacity,
-        nodes_with_headroom=nodes_with_headroom,
-        nodes_final=nodes_final,
-        sessions_per_node_effective=sessions_per_node_effective,
-        vram_total_node_effective_gib=vram_total_node_effective_gib,
-        hbm_utilization_ratio_effective=hbm_utilization_ratio_effective
+    TTFT: queuing_budget = TTFT_SLO - rede_p50 - prefill_time
+          util_max = queuing_budget / (service_time * qf_p50 + queuing_budget)
+          max_conc_ttft = floor(util_max * num_nodes * sessions_per_node)
+    TPOT: sess_max = floor(decode_thr / tpot_min); max_conc_tpot = sess_max * num_nodes
+    
+    Args:
+        num_nodes: Número de nós
+        sessions_per_node: Sessões por nó (limite de VRAM)
+        prefill_time_ms: Tempo de prefill de uma requisição média
+        decode_time_ms: Tempo de decode de uma requisição média
+        decode_tokens_per_sec: Throughput de decode do nó (tokens/s, dividido entre as sessões)
+        network_p50_ms: Latência de rede P50
+        queuing_factor_p50: Fator de fila P50
+        max_utilization: Teto de utilização do nó
+        target_*: SLOs (None = sem limite por aquele SLO)
+    
+    Returns:
+        SLOCapacityResult
+    """
+    service_time = prefill_time_ms + decode_time_ms
+    
+    # === LIMITE POR TTFT ===
+    queuing_budget_ms = 0.0
+    util_max_from_ttft = max_utilization
+    is_feasible = True
+    infeasibility_reason = ""
+    
+    if target_ttft_p50_ms is not None:
+        queuing_budget_ms = float(target_ttft_p50_ms) - network_p50_ms - prefill_time_ms
+        if queuing_budget_ms <= 0:
+            is_feasible = False
+            min_feasible = network_p50_ms + prefill_time_ms * _MIN_FEASIBLE_FACTOR
+            infeasibility_reason = (
+                f"Prefill ({prefill_time_ms:.0f}ms) + rede ({network_p50_ms:.0f}ms) = {prefill_time_ms+network_p50_ms:.0f}ms "
+                f"ja excede o SLO de TTFT ({target_ttft_p50_ms}ms). "
+                f"TTFT minimo viavel: {min_feasible:.0f}ms. "
+                f"Reducao de contexto ou GPU com maior throughput de prefill sao necessarios."
+            )
+            util_max_from_ttft = 0.0
+        else:
+            denom = service_time * queuing_factor_p50 + queuing_budget_ms
+            util_max_from_ttft = min(queuing_budget_ms / denom, max_utilization) if denom > 0 else 0.0
+    
+    max_concurrency_from_ttft = int(util_max_from_ttft * num_nodes * sessions_per_node)
+    
+    # === LIMITE POR TPOT ===
+    sessions_per_node_max_from_tpot = sessions_per_node
+    if target_tpot_min_tokens_per_sec is not None and target_tpot_min_tokens_per_sec > 0:
+        sessions_per_node_max_from_tpot = max(1, int(decode_tokens_per_sec / target_tpot_min_tokens_per_sec))
+    max_concurrency_from_tpot = sessions_per_node_max_from_tpot * num_nodes
+    
+    # === GARGALO ===
+    max_concurrency_combined = min(max_concurrency_from_ttft, max_concurrency_from_tpot)
+    
+    if target_ttft_p50_ms is None and target_tpot_min_tokens_per_sec is None:
+        limiting_factor = "NO_SLO"
+    elif target_ttft_p50_ms is None:
+        limiting_factor = "TPOT"
+    elif target_tpot_min_tokens_per_sec is None:
+        limiting_factor = "TTFT"
+    elif max_concurrency_from_ttft < max_concurrency_from_tpot:
+        limiting_factor = "TTFT"
+    elif max_concurrency_from_tpot < max_concurrency_from_ttft:
+        limiting_factor = "TPOT"
+    else:
+        limiting_factor = "BALANCED"
+    
+    return SLOCapacityResult(
+        max_concurrency_from_ttft=max_concurrency_from_ttft,
+        max_concurrency_from_tpot=max_concurrency_from_tpot,
+        max_concurrency_combined=max_concurrency_combined,
+        limiting_factor=limiting_factor,
+        util_max_from_ttft=util_max_from_ttft,
+        sessions_per_node_max_from_tpot=sessions_per_node_max_from_tpot,
+        prefill_time_ms=prefill_time_ms,
+        queuing_budget_ms=queuing_budget_ms,
+        is_feasible=is_feasible,
+        infeasibility_reason=infeasibility_reason
     )
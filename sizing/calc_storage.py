@@ -7,14 +7,93 @@ Storage é um recurso crítico para:
 - Governança (auditoria, métricas, traces)
 """
 
+from __future__ import annotations
+
 from dataclasses import dataclass
-from typing import Dict, Any
+from enum import Enum
+from typing import Any, NamedTuple
 from .models import ModelSpec
 from .servers import ServerSpec
 from .storage import StorageProfile
+from ._storage_math import (
+    _GIB, _BYTES_PER_REQUEST,
+    _IOPS_READ_PER_NODE_STARTUP, _IOPS_READ_PER_NODE_STEADY,
+    _iops_math, _throughput_math,
+)
+
+
+# Precisão -> (atributo de ModelSpec com os pesos em GiB, bytes por parâmetro)
+_PRECISION_TABLE: dict[str, tuple[str | None, float]] = {
+    "fp16": ("weights_memory_gib_fp16", 2.0),
+    "bf16": ("weights_memory_gib_fp16", 2.0),
+    "fp8": ("weights_memory_gib_fp8", 1.0),
+    "int8": ("weights_memory_gib_int8", 1.0),
+    "int4": ("weights_memory_gib_int4", 0.5),
+}
+
+# Unidades (_GIB e _BYTES_PER_REQUEST vêm de _storage_math)
+_GIB_PER_TB = 1024.0
+_SEC_PER_DAY = 86_400
+
+# Bilhões de parâmetros (x bytes/param) -> GiB
+_B_TO_GIB = 1e9 / _GIB
+
+class Scenario(str, Enum):
+    """
+    Cenário de storage, normalizado uma vez na entrada da API.
+    
+    Aceita os nomes sem diferenciar maiúsculas e os aliases usados como chave
+    de cenário em main ("minimum", "recommended"); nome desconhecido gera ValueError.
+    """
+    MINIMO = "minimo"
+    RECOMENDADO = "recomendado"
+    IDEAL = "ideal"
+    
+    @classmethod
+    def _missing_(cls, value):
+        if isinstance(value, str):
+            key = value.lower()
+            key = _SCENARIO_ALIASES.get(key, key)
+            for member in cls:
+                if member.value == key:
+                    return member
+        return None
+    
+    def __str__(self) -> str:
+        return self.value
+
+
+_SCENARIO_ALIASES = {
+    "minimum": "minimo",
+    "mínimo": "minimo",
+    "recommended": "recomendado",
+}
 
+# Fator de margem por cenário (cache, operacional, IOPS e throughput)
+_SCENARIO_FACTOR: dict[Scenario, float] = {
+    Scenario.MINIMO: 1.0,       # Apenas o essencial
+    Scenario.RECOMENDADO: 1.5,  # Margem operacional
+    Scenario.IDEAL: 2.0         # Margem ampla para picos
+}
 
-@dataclass
+# Retenção de logs por cenário (dias)
+_RETENTION_POLICY: dict[Scenario, int] = {
+    Scenario.MINIMO: 7,
+    Scenario.RECOMENDADO: 30,
+    Scenario.IDEAL: 90
+}
+
+
+# Fração dos nós reiniciando simultaneamente no pior caso (pico de leitura)
+_RESTART_FRACTION = 0.25
+
+
+def _restart_topology(num_nodes: int) -> int:
+    """Número de nós reiniciando simultaneamente (mínimo 1)."""
+    return max(1, int(num_nodes * _RESTART_FRACTION))
+
+
+@dataclass(slots=True)
 class StorageRequirements:
     """Requisitos de storage calculados para um cenário."""
     
@@ -54,16 +133,66 @@ class StorageRequirements:
     throughput_read_steady_gbps: float
     throughput_write_steady_gbps: float
     
-    # Metadata
-    rationale: Dict[str, Any]
+    # Metadata (None quando calculado com explain=False)
+    rationale: dict[str, Any] | None
+    
+    @classmethod
+    def from_components(
+        cls,
+        base: _StorageComponents,
+        recommended: _StorageComponents,
+        iops: dict[str, int],
+        throughput: dict[str, float],
+        platform_storage_profile,
+        margin_percent: float,
+        rationale: dict[str, Any] | None
+    ) -> StorageRequirements:
+        """Monta o resultado a partir das volumetrias BASE/RECOMENDADA (TB)."""
+        # _StorageComponents segue a ordem dos campos BASE e RECOMENDADO acima
+        return cls(
+            *base,
+            *recommended,
+            platform_storage_profile.total_per_server_gb,
+            platform_storage_profile.total_per_server_tb,
+            True,
+            margin_percent,
+            iops["iops_read_peak"],
+            iops["iops_write_peak"],
+            iops["iops_read_steady"],
+            iops["iops_write_steady"],
+            throughput["throughput_read_peak_gbps"],
+            throughput["throughput_write_peak_gbps"],
+            throughput["throughput_read_steady_gbps"],
+            throughput["throughput_write_steady_gbps"],
+            rationale
+        )
+
+
+class _StorageComponents(NamedTuple):
+    """Volumetria por componente (TB), na ordem dos campos de StorageRequirements."""
+    model: float
+    cache: float
+    logs: float
+    operational: float
+    platform: float
+    total: float
+
+
+# Métrica da política de capacidade usada para a margem de cada componente
+# (o volume da plataforma usa o mesmo target de storage_total)
+_MARGIN_METRICS = _StorageComponents(
+    "storage_model", "storage_cache", "storage_logs",
+    "storage_operational", "storage_total", "storage_total"
+)
 
 
 def calc_storage_model_tb(
     model: ModelSpec,
     weights_precision: str,
     num_nodes: int,
-    replicas_per_node: int = 1
-) -> tuple[float, Dict[str, Any]]:
+    replicas_per_node: int = 1,
+    explain: bool = True
+) -> tuple[float, dict[str, Any] | None]:
     """
     Calcula volumetria de storage para pesos do modelo.
     
@@ -72,30 +201,29 @@ def calc_storage_model_tb(
     - Replicação para tolerância a falhas
     - Margem para versionamento (rollback)
     
-    Retorna: (storage_tb, rationale)
+    Retorna: (storage_tb, rationale); rationale é None se explain=False
     """
+    storage_model_gib, rationale = _storage_model_gib(
+        model, weights_precision, num_nodes, replicas_per_node, explain
+    )
+    return storage_model_gib / _GIB_PER_TB, rationale
+
+
+def _storage_model_gib(
+    model: ModelSpec,
+    weights_precision: str,
+    num_nodes: int,
+    replicas_per_node: int,
+    explain: bool
+) -> tuple[float, dict[str, Any] | None]:
+    """Como calc_storage_model_tb, em GiB."""
     # Obter tamanho dos pesos baseado na precisão
-    weights_gib = 0.0
-    if weights_precision == "fp16" or weights_precision == "bf16":
-        weights_gib = model.weights_memory_gib_fp16 or 0.0
-    elif weights_precision == "fp8":
-        weights_gib = model.weights_memory_gib_fp8 or 0.0
-    elif weights_precision == "int8":
-        weights_gib = model.weights_memory_gib_int8 or 0.0
-    elif weights_precision == "int4":
-        weights_gib = model.weights_memory_gib_int4 or 0.0
+    attr, bytes_per_param = _PRECISION_TABLE.get(weights_precision, (None, 2.0))
+    weights_gib = (getattr(model, attr) if attr else None) or 0.0
     
     # Se não disponível, estimar
     if weights_gib == 0.0 and model.total_params_b:
-        bytes_per_param = {
-            "fp16": 2.0, "bf16": 2.0,
-            "fp8": 1.0, "int8": 1.0,
-            "int4": 0.5
-        }.get(weights_precision, 2.0)
-        weights_gib = (model.total_params_b * 1e9 * bytes_per_param) / (2**30)
-    
-    # Converter GiB para TB
-    weights_tb = weights_gib / 1024.0
+        weights_gib = model.total_params_b * bytes_per_param * _B_TO_GIB
     
     # Total de réplicas na plataforma
     total_replicas = num_nodes * replicas_per_node
@@ -103,13 +231,16 @@ def calc_storage_model_tb(
     # Storage base: 1 cópia por réplica + 1 cópia de backup + 1 versão anterior
     # Fator de replicação conservador: 2.5x
     storage_factor = 2.5
-    storage_model_tb = weights_tb * total_replicas * storage_factor
+    storage_model_gib = weights_gib * total_replicas * storage_factor
+    
+    if not explain:
+        return storage_model_gib, None
     
     rationale = {
         "formula": "storage_model_tb = weights_tb * total_replicas * storage_factor",
         "inputs": {
-            "weights_gib": round(weights_gib, 2),
-            "weights_tb": round(weights_tb, 4),
+            "weights_gib": weights_gib,
+            "weights_tb": weights_gib / _GIB_PER_TB,
             "num_nodes": num_nodes,
             "replicas_per_node": replicas_per_node,
             "total_replicas": total_replicas,
@@ -119,14 +250,15 @@ def calc_storage_model_tb(
         "operational_meaning": f"Armazena {total_replicas} réplicas do modelo com backup e capacidade de rollback. Crítico para restart rápido e scale-out."
     }
     
-    return storage_model_tb, rationale
+    return storage_model_gib, rationale
 
 
 def calc_storage_cache_tb(
     num_nodes: int,
     sessions_per_node: int,
-    scenario: str = "recomendado"
-) -> tuple[float, Dict[str, Any]]:
+    scenario: Scenario | str = Scenario.RECOMENDADO,
+    explain: bool = True
+) -> tuple[float, dict[str, Any] | None]:
     """
     Calcula volumetria de cache local/runtime por nó.
     
@@ -135,8 +267,21 @@ def calc_storage_cache_tb(
     - Cache de artefatos (tokenizers, configs)
     - Cache temporário de execução
     
-    Retorna: (storage_cache_tb, rationale)
+    Retorna: (storage_cache_tb, rationale); rationale é None se explain=False
     """
+    cache_total_gib, rationale = _storage_cache_gib(
+        num_nodes, sessions_per_node, Scenario(scenario), explain
+    )
+    return cache_total_gib / _GIB_PER_TB, rationale
+
+
+def _storage_cache_gib(
+    num_nodes: int,
+    sessions_per_node: int,
+    scenario: Scenario,
+    explain: bool
+) -> tuple[float, dict[str, Any] | None]:
+    """Como calc_storage_cache_tb, em GiB."""
     # Base: 50 GiB por nó (engine compilado + artefatos)
     base_cache_gib = 50.0
     
@@ -144,15 +289,13 @@ def calc_storage_cache_tb(
     per_session_cache_gib = 1.0
     
     # Fator de cenário
-    scenario_factor = {
-        "minimo": 1.0,      # Apenas cache essencial
-        "recomendado": 1.5, # Margem operacional
-        "ideal": 2.0        # Margem ampla para picos
-    }.get(scenario.lower(), 1.5)
+    scenario_factor = _SCENARIO_FACTOR[scenario]
     
     cache_per_node_gib = (base_cache_gib + per_session_cache_gib * sessions_per_node) * scenario_factor
     cache_total_gib = cache_per_node_gib * num_nodes
-    cache_total_tb = cache_total_gib / 1024.0
+    
+    if not explain:
+        return cache_total_gib, None
     
     rationale = {
         "formula": "storage_cache_tb = ((base_cache + per_session_cache * sessions) * scenario_factor * num_nodes) / 1024",
@@ -162,21 +305,21 @@ def calc_storage_cache_tb(
             "sessions_per_node": sessions_per_node,
             "num_nodes": num_nodes,
             "scenario_factor": scenario_factor,
-            "cache_per_node_gib": round(cache_per_node_gib, 2)
+            "cache_per_node_gib": cache_per_node_gib
         },
         "assumption": f"Cenário {scenario}: fator {scenario_factor}x para cache local e temporário",
         "operational_meaning": "Cache de engine compilado, artefatos e buffers temporários. Essencial para latência e throughput."
     }
     
-    return cache_total_tb, rationale
+    return cache_total_gib, rationale
 
 
 def calc_storage_logs_tb(
     concurrency: int,
     num_nodes: int,
-    retention_days: int,
-    scenario: str = "recomendado"
-) -> tuple[float, Dict[str, Any]]:
+    scenario: Scenario | str = Scenario.RECOMENDADO,
+    explain: bool = True
+) -> tuple[float, dict[str, Any] | None]:
     """
     Calcula volumetria de logs, métricas e auditoria.
     
@@ -184,75 +327,98 @@ def calc_storage_logs_tb(
     - Logs de requisições
     - Métricas de inferência
     - Traces (se habilitado)
-    - Retenção por cenário
+    - Retenção por cenário (_RETENTION_POLICY: 7, 30 ou 90 dias)
     
-    Retorna: (storage_logs_tb, rationale)
+    Retorna: (storage_logs_tb, rationale); rationale é None se explain=False
     """
+    logs_total_gib, rationale = _storage_logs_gib(
+        concurrency, num_nodes, Scenario(scenario), explain
+    )
+    return logs_total_gib / _GIB_PER_TB, rationale
+
+
+def _storage_logs_gib(
+    concurrency: int,
+    num_nodes: int,
+    scenario: Scenario,
+    explain: bool
+) -> tuple[float, dict[str, Any] | None]:
+    """Como calc_storage_logs_tb, em GiB."""
     # Retenção por cenário
-    retention_policy = {
-        "minimo": 7,        # 7 dias
-        "recomendado": 30,  # 30 dias
-        "ideal": 90         # 90 dias
-    }
-    retention_days = retention_policy.get(scenario.lower(), retention_days)
+    retention_days = _RETENTION_POLICY[scenario]
     
     # Estimativa: 10 KB por requisição (log + métricas)
-    bytes_per_request = 10 * 1024
+    bytes_per_request = _BYTES_PER_REQUEST
     
     # Requisições por dia (assumindo operação 24/7 com concorrência média)
     # Tempo médio por requisição: 2 segundos (estimativa conservadora)
-    avg_request_duration_sec = 2.0
-    requests_per_second = concurrency / avg_request_duration_sec
-    requests_per_day = requests_per_second * 86400
+    # Aritmética inteira até a conversão final para GiB (86400 é múltiplo de 2)
+    avg_request_duration_sec = 2
+    requests_per_day = concurrency * _SEC_PER_DAY // avg_request_duration_sec
     
-    # Storage de logs por dia
+    # Storage de logs por dia e total (bytes)
     logs_per_day_bytes = requests_per_day * bytes_per_request
-    logs_per_day_gib = logs_per_day_bytes / (2**30)
+    logs_total_bytes = logs_per_day_bytes * retention_days
+    
+    logs_total_gib = logs_total_bytes / _GIB
     
-    # Storage total
-    logs_total_gib = logs_per_day_gib * retention_days
-    logs_total_tb = logs_total_gib / 1024.0
+    if not explain:
+        return logs_total_gib, None
+    
+    requests_per_second = concurrency / avg_request_duration_sec
+    logs_per_day_gib = logs_per_day_bytes / _GIB
     
     rationale = {
         "formula": "storage_logs_tb = (concurrency / avg_duration * 86400 * bytes_per_req * retention_days) / (1024^4)",
         "inputs": {
             "concurrency": concurrency,
             "num_nodes": num_nodes,
-            "avg_request_duration_sec": avg_request_duration_sec,
-            "requests_per_second": round(requests_per_second, 2),
-            "requests_per_day": round(requests_per_day, 0),
+            "avg_request_duration_sec": float(avg_request_duration_sec),
+            "requests_per_second": requests_per_second,
+            "requests_per_day": float(requests_per_day),
             "bytes_per_request": bytes_per_request,
             "retention_days": retention_days,
-            "logs_per_day_gib": round(logs_per_day_gib, 2)
+            "logs_per_day_gib": logs_per_day_gib
         },
         "assumption": f"Cenário {scenario}: retenção de {retention_days} dias. 10KB/req (logs+métricas), duração média 2s/req.",
         "operational_meaning": "Logs e métricas são críticos para debugging, auditoria e conformidade. Retenção inadequada compromete troubleshooting."
     }
     
-    return logs_total_tb, rationale
+    return logs_total_gib, rationale
 
 
 def calc_storage_operational_tb(
     num_nodes: int,
-    scenario: str = "recomendado"
-) -> tuple[float, Dict[str, Any]]:
+    scenario: Scenario | str = Scenario.RECOMENDADO,
+    explain: bool = True
+) -> tuple[float, dict[str, Any] | None]:
     """
     Calcula volumetria de dados operacionais (configs, metadados, artefatos auxiliares).
     
-    Retorna: (storage_operational_tb, rationale)
+    Retorna: (storage_operational_tb, rationale); rationale é None se explain=False
     """
+    operational_total_gib, rationale = _storage_operational_gib(
+        num_nodes, Scenario(scenario), explain
+    )
+    return operational_total_gib / _GIB_PER_TB, rationale
+
+
+def _storage_operational_gib(
+    num_nodes: int,
+    scenario: Scenario,
+    explain: bool
+) -> tuple[float, dict[str, Any] | None]:
+    """Como calc_storage_operational_tb, em GiB."""
     # Base por nó: 10 GiB (configs, metadados, artefatos)
     operational_per_node_gib = 10.0
     
     # Fator de cenário
-    scenario_factor = {
-        "minimo": 1.0,
-        "recomendado": 1.5,
-        "ideal": 2.0
-    }.get(scenario.lower(), 1.5)
+    scenario_factor = _SCENARIO_FACTOR[scenario]
     
     operational_total_gib = operational_per_node_gib * num_nodes * scenario_factor
-    operational_total_tb = operational_total_gib / 1024.0
+    
+    if not explain:
+        return operational_total_gib, None
     
     rationale = {
         "formula": "storage_operational_tb = (operational_per_node * num_nodes * scenario_factor) / 1024",
@@ -265,15 +431,17 @@ def calc_storage_operational_tb(
         "operational_meaning": "Configurações, metadados e artefatos auxiliares. Essencial para orquestração e recuperação."
     }
     
-    return operational_total_tb, rationale
+    return operational_total_gib, rationale
 
 
 def calc_storage_iops(
     concurrency: int,
     num_nodes: int,
     storage_model_tb: float,
-    scenario: str = "recomendado"
-) -> tuple[Dict[str, int], Dict[str, Any]]:
+    scenario: Scenario | str = Scenario.RECOMENDADO,
+    explain: bool = True,
+    nodes_restarting: int | None = None
+) -> tuple[dict[str, int], dict[str, Any] | None]:
     """
     Calcula IOPS de leitura e escrita para operação de inferência.
     
@@ -282,40 +450,23 @@ def calc_storage_iops(
     - Escrita: logs, métricas, checkpoints
     - Steady-state vs. peak
     
-    Retorna: (iops_dict, rationale)
+    nodes_restarting: pré-calculado por _restart_topology (None = calcular aqui)
+    
+    Retorna: (iops_dict, rationale); rationale é None se explain=False
     """
     # IOPS de leitura PEAK (startup/restart de múltiplos nós simultâneos)
     # Assumindo restart de 25% dos nós simultaneamente no pior caso
-    nodes_restarting = max(1, int(num_nodes * 0.25))
-    
-    # IOPS por nó durante startup: 50k IOPS (leitura de pesos)
-    iops_read_per_node_startup = 50000
-    iops_read_peak = nodes_restarting * iops_read_per_node_startup
-    
-    # IOPS de leitura STEADY (operação normal, cache hits)
-    # Muito baixo, pesos já em memória: 1k IOPS por nó
-    iops_read_per_node_steady = 1000
-    iops_read_steady = num_nodes * iops_read_per_node_steady
-    
-    # IOPS de escrita PEAK (logs + métricas em burst)
-    # Estimativa: 1 write op por requisição completada
-    # Burst: 2x concurrency
-    writes_per_second_peak = concurrency * 2
-    iops_write_peak = int(writes_per_second_peak)
-    
-    # IOPS de escrita STEADY (operação normal)
-    writes_per_second_steady = concurrency
-    iops_write_steady = int(writes_per_second_steady)
-    
-    # Ajuste por cenário
-    scenario_factor = {
-        "minimo": 1.0,
-        "recomendado": 1.5,
-        "ideal": 2.0
-    }.get(scenario.lower(), 1.5)
-    
-    iops_read_peak = int(iops_read_peak * scenario_factor)
-    iops_write_peak = int(iops_write_peak * scenario_factor)
+    scenario = Scenario(scenario)
+    if nodes_restarting is None:
+        nodes_restarting = _restart_topology(num_nodes)
+    
+    # Leitura: pico = nós reiniciando x 50k IOPS; steady = 1k IOPS por nó (pesos em memória)
+    # Escrita: 1 write op por requisição completada; pico = 2x concurrency (burst)
+    # Pico ajustado pelo fator de cenário
+    scenario_factor = _SCENARIO_FACTOR[scenario]
+    iops_read_peak, iops_write_peak, iops_read_steady, iops_write_steady = _iops_math(
+        concurrency, num_nodes, nodes_restarting, scenario_factor
+    )
     
     iops_dict = {
         "iops_read_peak": iops_read_peak,
@@ -324,17 +475,20 @@ def calc_storage_iops(
         "iops_write_steady": iops_write_steady
     }
     
+    if not explain:
+        return iops_dict, None
+    
     rationale = {
         "formula": "IOPS = f(nodes_restarting, concurrency, scenario_factor)",
         "inputs": {
             "concurrency": concurrency,
             "num_nodes": num_nodes,
             "nodes_restarting": nodes_restarting,
-            "iops_read_per_node_startup": iops_read_per_node_startup,
-            "iops_read_per_node_steady": iops_read_per_node_steady,
+            "iops_read_per_node_startup": _IOPS_READ_PER_NODE_STARTUP,
+            "iops_read_per_node_steady": _IOPS_READ_PER_NODE_STEADY,
             "scenario_factor": scenario_factor
         },
-        "assumption": f"Cenário {scenario}: {nodes_restarting} nós reiniciando simultaneamente (25%). Fator {scenario_factor}x para margem.",
+        "assumption": f"Cenário {scenario}: {nodes_restarting} nós reiniciando simultaneamente ({_RESTART_FRACTION:.0%}). Fator {scenario_factor}x para margem.",
         "operational_meaning": f"IOPS pico ({iops_read_peak:,} R / {iops_write_peak:,} W) suporta restart de {nodes_restarting} nós + burst de logs. IOPS steady ({iops_read_steady:,} R / {iops_write_steady:,} W) para operação normal."
     }
     
@@ -346,8 +500,10 @@ def calc_storage_throughput(
     num_nodes: int,
     storage_model_tb: float,
     target_load_time_sec: float,
-    scenario: str = "recomendado"
-) -> tuple[Dict[str, float], Dict[str, Any]]:
+    scenario: Scenario | str = Scenario.RECOMENDADO,
+    explain: bool = True,
+    nodes_restarting: int | None = None
+) -> tuple[dict[str, float], dict[str, Any] | None]:
     """
     Calcula throughput de leitura e escrita (GB/s) para operação de inferência.
     
@@ -356,39 +512,45 @@ def calc_storage_throughput(
     - Escrita: flush de logs, checkpoints
     - Steady-state vs. peak
     
-    Retorna: (throughput_dict, rationale)
+    nodes_restarting: pré-calculado por _restart_topology (None = calcular aqui)
+    
+    Retorna: (throughput_dict, rationale); rationale é None se explain=False
     """
+    return _storage_throughput(
+        concurrency, num_nodes, storage_model_tb * _GIB_PER_TB, target_load_time_sec,
+        Scenario(scenario), explain, nodes_restarting
+    )
+
+
+def _storage_throughput(
+    concurrency: int,
+    num_nodes: int,
+    storage_gib: float,
+    target_load_time_sec: float,
+    scenario: Scenario,
+    explain: bool,
+    nodes_restarting: int | None = None
+) -> tuple[dict[str, float], dict[str, Any] | None]:
+    """Como calc_storage_throughput, recebendo o volume em GiB."""
     # Throughput de leitura PEAK (startup/restart)
     # Meta: carregar modelo completo em tempo configurável
     # Assumindo restart de 25% dos nós simultaneamente
-    nodes_restarting = max(1, int(num_nodes * 0.25))
-    model_per_node_gib = (storage_model_tb * 1024) / num_nodes
-    
-    throughput_read_per_node = model_per_node_gib / target_load_time_sec
-    throughput_read_peak_gbps = throughput_read_per_node * nodes_restarting
-    
-    # Throughput de leitura STEADY (cache hits, minimal disk read)
-    throughput_read_steady_gbps = 0.5 * num_nodes  # 0.5 GB/s por nó
-    
-    # Throughput de escrita PEAK (flush de logs em batch)
-    # Estimativa: 10 KB por requisição, flush a cada 10 segundos
-    bytes_per_request = 10 * 1024
-    requests_per_flush = concurrency * 10  # 10 segundos de buffer
-    bytes_per_flush = bytes_per_request * requests_per_flush
-    throughput_write_peak_gbps = (bytes_per_flush / 10) / (2**30)  # GB/s
-    
-    # Throughput de escrita STEADY (flush contínuo)
-    throughput_write_steady_gbps = throughput_write_peak_gbps * 0.5
-    
-    # Ajuste por cenário
-    scenario_factor = {
-        "minimo": 1.0,
-        "recomendado": 1.5,
-        "ideal": 2.0
-    }.get(scenario.lower(), 1.5)
-    
-    throughput_read_peak_gbps *= scenario_factor
-    throughput_write_peak_gbps *= scenario_factor
+    if nodes_restarting is None:
+        nodes_restarting = _restart_topology(num_nodes)
+    
+    # Leitura steady: 0.5 GB/s por nó; escrita: 10 KB/req com flush a cada 10 s
+    # Pico (leitura e escrita) ajustado pelo fator de cenário
+    scenario_factor = _SCENARIO_FACTOR[scenario]
+    (
+        model_per_node_gib,
+        throughput_read_peak_gbps,
+        throughput_write_peak_gbps,
+        throughput_read_steady_gbps,
+        throughput_write_steady_gbps,
+    ) = _throughput_math(
+        concurrency, num_nodes, storage_gib, target_load_time_sec,
+        nodes_restarting, scenario_factor
+    )
     
     throughput_dict = {
         "throughput_read_peak_gbps": round(throughput_read_peak_gbps, 2),
@@ -397,17 +559,20 @@ def calc_storage_throughput(
         "throughput_write_steady_gbps": round(throughput_write_steady_gbps, 2)
     }
     
+    if not explain:
+        return throughput_dict, None
+    
     rationale = {
         "formula": "Throughput = f(model_size, nodes_restarting, target_load_time, log_flush_rate)",
         "inputs": {
-            "storage_model_tb": round(storage_model_tb, 2),
-            "model_per_node_gib": round(model_per_node_gib, 2),
+            "storage_model_tb": storage_gib / _GIB_PER_TB,
+            "model_per_node_gib": model_per_node_gib,
             "num_nodes": num_nodes,
             "nodes_restarting": nodes_restarting,
             "target_load_time_sec": target_load_time_sec,
             "scenario_factor": scenario_factor
         },
-        "assumption": f"Cenário {scenario}: carregar modelo em <{target_load_time_sec}s. {nodes_restarting} nós reiniciando (25%). Fator {scenario_factor}x.",
+        "assumption": f"Cenário {scenario}: carregar modelo em <{target_load_time_sec}s. {nodes_restarting} nós reiniciando ({_RESTART_FRACTION:.0%}). Fator {scenario_factor}x.",
         "operational_meaning": f"Throughput pico ({throughput_dict['throughput_read_peak_gbps']:.2f} R / {throughput_dict['throughput_write_peak_gbps']:.2f} W GB/s) garante restart rápido. Throughput steady ({throughput_dict['throughput_read_steady_gbps']:.2f} R / {throughput_dict['throughput_write_steady_gbps']:.2f} W GB/s) para operação contínua."
     }
     
@@ -425,8 +590,8 @@ def calc_storage_requirements(
     replicas_per_node: int,
     capacity_policy,  # CapacityPolicy instance
     platform_storage_profile,  # PlatformStorageProfile instance
-    scenario: str = "recomendado",
-    retention_days: int = 30
+    scenario: Scenario | str = Scenario.RECOMENDADO,
+    explain: bool = True
 ) -> StorageRequirements:
     """
     Calcula requisitos completos de storage para um cenário de inferência.
@@ -442,136 +607,110 @@ def calc_storage_requirements(
         replicas_per_node: Réplicas por nó
         capacity_policy: Política de margem de capacidade
         platform_storage_profile: Profile de storage da plataforma (SO, AI Enterprise, runtime)
-        scenario: "minimo", "recomendado" ou "ideal"
-        retention_days: Dias de retenção de logs (sobrescrito por cenário)
+        scenario: Scenario ou "minimo", "recomendado", "ideal" (ValueError se desconhecido); define fatores e retenção de logs
+        explain: Se False, não monta os rationales (rationale=None); útil em varreduras
     
     Returns:
         StorageRequirements com todos os cálculos e rationale
     """
-    # Calcular volumetria BASE (valores técnicos)
-    storage_model_base_tb, rationale_model = calc_storage_model_tb(
-        model, weights_precision, num_nodes, replicas_per_node
+    scenario = Scenario(scenario)
+    
+    # Calcular volumetria BASE (valores técnicos), em GiB
+    storage_model_base_gib, rationale_model = _storage_model_gib(
+        model, weights_precision, num_nodes, replicas_per_node, explain
     )
     
-    storage_cache_base_tb, rationale_cache = calc_storage_cache_tb(
-        num_nodes, sessions_per_node, scenario
+    storage_cache_base_gib, rationale_cache = _storage_cache_gib(
+        num_nodes, sessions_per_node, scenario, explain
     )
     
-    storage_logs_base_tb, rationale_logs = calc_storage_logs_tb(
-        concurrency, num_nodes, retention_days, scenario
+    storage_logs_base_gib, rationale_logs = _storage_logs_gib(
+        concurrency, num_nodes, scenario, explain
     )
     
-    storage_operational_base_tb, rationale_operational = calc_storage_operational_tb(
-        num_nodes, scenario
+    storage_operational_base_gib, rationale_operational = _storage_operational_gib(
+        num_nodes, scenario, explain
     )
     
     # Calcular volume da plataforma (SO, AI Enterprise, runtime, etc.)
     platform_volume_total_tb = platform_storage_profile.calc_total_platform_volume_tb(num_nodes)
-    platform_rationale = platform_storage_profile.get_rationale(num_nodes)
     
     # Storage Total BASE inclui plataforma + modelo + cache + logs + operational
-    storage_total_base_tb = (
-        storage_model_base_tb + 
-        storage_cache_base_tb + 
-        storage_logs_base_tb + 
-        storage_operational_base_tb +
-        platform_volume_total_tb
+    # (sum() acumula da esquerda para a direita: mesma ordem da soma encadeada)
+    storage_total_base_gib = sum((
+        storage_model_base_gib,
+        storage_cache_base_gib,
+        storage_logs_base_gib,
+        storage_operational_base_gib,
+        platform_volume_total_tb * _GIB_PER_TB,
+    ))
+    
+    # Conversão única GiB -> TB
+    base = _StorageComponents(
+        model=storage_model_base_gib / _GIB_PER_TB,
+        cache=storage_cache_base_gib / _GIB_PER_TB,
+        logs=storage_logs_base_gib / _GIB_PER_TB,
+        operational=storage_operational_base_gib / _GIB_PER_TB,
+        platform=platform_volume_total_tb,
+        total=storage_total_base_gib / _GIB_PER_TB
     )
     
     # Aplicar margem de capacidade (valores estratégicos)
-    storage_model_recommended_tb = capacity_policy.apply_margin(
-        storage_model_base_tb, "storage_model"
-    )
-    storage_cache_recommended_tb = capacity_policy.apply_margin(
-        storage_cache_base_tb, "storage_cache"
-    )
-    storage_logs_recommended_tb = capacity_policy.apply_margin(
-        storage_logs_base_tb, "storage_logs"
-    )
-    storage_operational_recommended_tb = capacity_policy.apply_margin(
-        storage_operational_base_tb, "storage_operational"
-    )
-    # Volume da plataforma também recebe margem
-    platform_volume_recommended_tb = capacity_policy.apply_margin(
-        platform_volume_total_tb, "storage_total"  # Usa o mesmo target para aplicar margem
-    )
-    storage_total_recommended_tb = capacity_policy.apply_margin(
-        storage_total_base_tb, "storage_total"
+    recommended = _StorageComponents(
+        *capacity_policy.apply_margin_vector(base, _MARGIN_METRICS)
     )
     
+    # Nós reiniciando no pior caso (comum a IOPS e throughput)
+    nodes_restarting = _restart_topology(num_nodes)
+    
     # Calcular IOPS (baseado em valores recomendados para garantir margem)
     iops_dict, rationale_iops = calc_storage_iops(
-        concurrency, num_nodes, storage_total_recommended_tb, scenario
+        concurrency, num_nodes, recommended.total, scenario, explain,
+        nodes_restarting
     )
     
     # Calcular Throughput (baseado em valores recomendados)
-    throughput_dict, rationale_throughput = calc_storage_throughput(
-        concurrency, num_nodes, storage_total_recommended_tb, 
-        capacity_policy.target_load_time_sec, scenario
+    throughput_dict, rationale_throughput = _storage_throughput(
+        concurrency, num_nodes, recommended.total * _GIB_PER_TB,
+        capacity_policy.target_load_time_sec, scenario, explain, nodes_restarting
     )
     
     # Consolidar rationale
-    rationale = {
-        "storage_model": rationale_model,
-        "storage_cache": rationale_cache,
-        "storage_logs": rationale_logs,
-        "storage_operational": rationale_operational,
-        "platform_storage": platform_rationale,
-        "storage_total": {
-            "formula": "storage_total_tb = storage_model + storage_cache + storage_logs + storage_operational + platform_volume",
-            "inputs": {
-                "storage_model_base_tb": round(storage_model_base_tb, 3),
-                "storage_cache_base_tb": round(storage_cache_base_tb, 3),
-                "storage_logs_base_tb": round(storage_logs_base_tb, 3),
-                "storage_operational_base_tb": round(storage_operational_base_tb, 3),
-                "platform_volume_total_tb": round(platform_volume_total_tb, 3),
-                "storage_total_base_tb": round(storage_total_base_tb, 3)
+    rationale = None
+    if explain:
+        rationale = {
+            "storage_model": rationale_model,
+            "storage_cache": rationale_cache,
+            "storage_logs": rationale_logs,
+            "storage_operational": rationale_operational,
+            "platform_storage": platform_storage_profile.get_rationale(num_nodes),
+            "storage_total": {
+                "formula": "storage_total_tb = storage_model + storage_cache + storage_logs + storage_operational + platform_volume",
+                "inputs": {
+                    "storage_model_base_tb": base.model,
+                    "storage_cache_base_tb": base.cache,
+                    "storage_logs_base_tb": base.logs,
+                    "storage_operational_base_tb": base.operational,
+                    "platform_volume_total_tb": base.platform,
+                    "storage_total_base_tb": base.total
+                },
+                "assumption": f"Cenário {scenario}: soma de todos os componentes de storage incluindo volume estrutural da plataforma. "
+                             f"Margem de {capacity_policy.margin_percent*100:.0f}% aplicada conforme política de capacidade.",
+                "operational_meaning": f"Total BASE de {base.total:.2f} TB (inclui {base.platform:.2f} TB de plataforma). "
+                                      f"Total RECOMENDADO de {recommended.total:.2f} TB com margem de {capacity_policy.margin_percent*100:.0f}% para crescimento, retenção adicional e resiliência. "
+                                      f"Subdimensionamento compromete tempo de recuperação."
             },
-            "assumption": f"Cenário {scenario}: soma de todos os componentes de storage incluindo volume estrutural da plataforma. "
-                         f"Margem de {capacity_policy.margin_percent*100:.0f}% aplicada conforme política de capacidade.",
-            "operational_meaning": f"Total BASE de {storage_total_base_tb:.2f} TB (inclui {platform_volume_total_tb:.2f} TB de plataforma). "
-                                  f"Total RECOMENDADO de {storage_total_recommended_tb:.2f} TB com margem de {capacity_policy.margin_percent*100:.0f}% para crescimento, retenção adicional e resiliência. "
-                                  f"Subdimensionamento compromete tempo de recuperação."
-        },
-        "capacity_policy": {
-            "margin_percent": capacity_policy.margin_percent,
-            "target_load_time_sec": capacity_policy.target_load_time_sec,
-            "source": capacity_policy.source,
-            "notes": capacity_policy.notes
-        },
-        "iops": rationale_iops,
-        "throughput": rationale_throughput
-    }
+            "capacity_policy": {
+                "margin_percent": capacity_policy.margin_percent,
+                "target_load_time_sec": capacity_policy.target_load_time_sec,
+                "source": capacity_policy.source,
+                "notes": capacity_policy.notes
+            },
+            "iops": rationale_iops,
+            "throughput": rationale_throughput
+        }
     
-    return StorageRequirements(
-        # Valores BASE
-        storage_model_base_tb=storage_model_base_tb,
-        storage_cache_base_tb=storage_cache_base_tb,
-        storage_logs_base_tb=storage_logs_base_tb,
-        storage_operational_base_tb=storage_operational_base_tb,
-        platform_volume_total_tb=platform_volume_total_tb,
-        storage_total_base_tb=storage_total_base_tb,
-        # Valores RECOMENDADOS (com margem)
-        storage_model_recommended_tb=storage_model_recommended_tb,
-        storage_cache_recommended_tb=storage_cache_recommended_tb,
-        storage_logs_recommended_tb=storage_logs_recommended_tb,
-        storage_operational_recommended_tb=storage_operational_recommended_tb,
-        platform_volume_recommended_tb=platform_volume_recommended_tb,
-        storage_total_recommended_tb=storage_total_recommended_tb,
-        # Detalhamento da plataforma
-        platform_per_server_gb=platform_storage_profile.total_per_server_gb,
-        platform_per_server_tb=platform_storage_profile.total_per_server_tb,
-        # Margem aplicada
-        margin_applied=True,
-        margin_percent=capacity_policy.margin_percent,
-        # IOPS e Throughput
-        iops_read_peak=iops_dict["iops_read_peak"],
-        iops_write_peak=iops_dict["iops_write_peak"],
-        iops_read_steady=iops_dict["iops_read_steady"],
-        iops_write_steady=iops_dict["iops_write_steady"],
-        throughput_read_peak_gbps=throughput_dict["throughput_read_peak_gbps"],
-        throughput_write_peak_gbps=throughput_dict["throughput_write_peak_gbps"],
-        throughput_read_steady_gbps=throughput_dict["throughput_read_steady_gbps"],
-        throughput_write_steady_gbps=throughput_dict["throughput_write_steady_gbps"],
-        rationale=rationale
+    return StorageRequirements.from_components(
+        base, recommended, iops_dict, throughput_dict,
+        platform_storage_profile, capacity_policy.margin_percent, rationale
     )
@@ -7,8 +7,10 @@ Throughput(MB/s) = (IOPS × BlockSize(KB)) / 1024
 Esta validação garante que os parâmetros de storage no JSON são fisicamente consistentes.
 """
 
+import functools
+import io
 from dataclasses import dataclass
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, List, NamedTuple, Sequence, Tuple
 from .storage import StorageProfile
 
 
@@ -16,8 +18,24 @@ from .storage import StorageProfile
 WARNING_THRESHOLD = 0.10  # 10%
 ERROR_THRESHOLD = 0.25    # 25%
 
+# Constantes da fórmula (multiplicação pelo recíproco em vez de divisão por 1024)
+_K1024 = 1024.0
+_INV_1024 = 1.0 / 1024.0
 
-@dataclass
+# Templates do relatório de validação (tabelas read/write)
+_TABLE_HEADER = (
+    "=" * 100 + "\n"
+    + f"{'Métrica':<25} {'Informado':>20} {'Calculado':>20} {'Divergência':>15} {'Status':>15}\n"
+    + "-" * 100 + "\n"
+)
+_IOPS_ROW_FMT = "{name:<25} {informed:>20,} {calculated:>20,} {div:>14.1f}% {status:>15}\n"
+_FLOAT_ROW_FMT = "{name:<25} {informed:>20,.1f} {calculated:>20,.1f} {div:>14.1f}% {status:>15}\n"
+
+# Status indexado por (max_div > WARNING) + (max_div > ERROR): 0, 1 ou 2
+_STATUS_TABLE = ("ok", "warning", "error")
+
+
+@dataclass(slots=True)
 class StorageValidationResult:
     """Resultado da validação de um eixo (read ou write)."""
     
@@ -38,10 +56,10 @@ class StorageValidationResult:
     
     # Status
     status: str  # "ok", "warning", "error"
-    messages: list[str]
+    messages: list[str]  # Preenchido sob demanda (por isso a classe não é frozen)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StorageProfileValidation:
     """Validação completa de um perfil de storage."""
     
@@ -62,22 +80,68 @@ def validate_storage_profile(profile: StorageProfile) -> StorageProfileValidatio
     Returns:
         StorageProfileValidation com resultados e status
     """
-    # Validar leitura
-    read_val = _validate_axis(
-        iops=profile.iops_read_max,
-        throughput_mbps=profile.throughput_read_mbps,
-        block_size_kb=profile.block_size_kb_read,
-        axis_name="read"
-    )
+    return validate_storage_profiles_batch((profile,))[0]
+
+
+def validate_storage_profiles_batch(
+    profiles: Iterable[StorageProfile],
+    include_messages: bool = True
+) -> List[StorageProfileValidation]:
+    """
+    Valida vários perfis de storage de uma vez.
+    
+    Os eixos read e write de todos os perfis são empilhados em colunas
+    (IOPS, throughput, block size) e passam por um único kernel numérico;
+    só a montagem das mensagens fica por perfil.
     
-    # Validar escrita
-    write_val = _validate_axis(
-        iops=profile.iops_write_max,
-        throughput_mbps=profile.throughput_write_mbps,
-        block_size_kb=profile.block_size_kb_write,
-        axis_name="write"
+    Args:
+        profiles: Perfis de storage a validar
+        include_messages: Se False, não formata mensagens (chamadores que só
+            precisam de overall_status); mensagens só são geradas para status != "ok"
+    
+    Returns:
+        Lista de StorageProfileValidation, na ordem dos perfis
+    """
+    profiles = list(profiles)
+    
+    # Colunas: [read de todos os perfis] + [write de todos os perfis]
+    iops = [p.iops_read_max for p in profiles] + [p.iops_write_max for p in profiles]
+    throughput = (
+        [p.throughput_read_mbps for p in profiles]
+        + [p.throughput_write_mbps for p in profiles]
+    )
+    block_size = (
+        [p.block_size_kb_read for p in profiles]
+        + [p.block_size_kb_write for p in profiles]
     )
     
+    metrics = _axis_metrics_batch(iops, throughput, block_size)
+    
+    n = len(profiles)
+    results = []
+    for i, profile in enumerate(profiles):
+        read_val = _build_axis_result(iops[i], throughput[i], block_size[i], metrics[i])
+        write_val = _build_axis_result(
+            iops[n + i], throughput[n + i], block_size[n + i], metrics[n + i]
+        )
+        if include_messages:
+            if read_val.status != "ok":
+                read_val.messages = _format_axis_messages(read_val, "read")
+            if write_val.status != "ok":
+                write_val.messages = _format_axis_messages(write_val, "write")
+        results.append(
+            _build_profile_validation(profile, read_val, write_val, include_messages)
+        )
+    return results
+
+
+def _build_profile_validation(
+    profile: StorageProfile,
+    read_val: StorageValidationResult,
+    write_val: StorageValidationResult,
+    include_messages: bool = True
+) -> StorageProfileValidation:
+    """Consolida as validações read/write no status geral do perfil."""
     # Status geral
     statuses = [read_val.status, write_val.status]
     if "error" in statuses:
@@ -89,12 +153,12 @@ def validate_storage_profile(profile: StorageProfile) -> StorageProfileValidatio
     
     # Mensagens gerais
     messages = []
-    if overall_status == "error":
+    if include_messages and overall_status == "error":
         messages.append(
             f"❌ Divergência crítica (>{ERROR_THRESHOLD*100:.0f}%) entre IOPS/Throughput/BlockSize "
             f"no perfil '{profile.name}'."
         )
-    elif overall_status == "warning":
+    elif include_messages and overall_status == "warning":
         messages.append(
             f"⚠️ Divergência moderada ({WARNING_THRESHOLD*100:.0f}%-{ERROR_THRESHOLD*100:.0f}%) "
             f"no perfil '{profile.name}'. Recomenda-se revisar valores."
@@ -109,61 +173,114 @@ def validate_storage_profile(profile: StorageProfile) -> StorageProfileValidatio
     )
 
 
-def _validate_axis(
+class _AxisMetrics(NamedTuple):
+    """Valores calculados e divergências de um eixo (sem mensagens)."""
+    throughput_calculated: float
+    iops_calculated: int
+    block_size_calculated: float
+    throughput_div: float
+    iops_div: float
+    block_size_div: float
+    max_div: float
+    status: str
+
+
+def _axis_metrics_batch(
+    iops: Sequence[int],
+    throughput_mbps: Sequence[float],
+    block_size_kb: Sequence[float]
+) -> List[_AxisMetrics]:
+    """
+    Kernel numérico da validação sobre colunas de eixos.
+    
+    Formula: Throughput(MB/s) = (IOPS × BlockSize(KB)) / 1024
+    Divergência: abs(informado - calculado) / max(informado, calculado), como fração (0.0 - 1.0)
+    
+    Args:
+        iops: IOPS máximos informados, um por eixo
+        throughput_mbps: Throughput em MB/s informado, um por eixo
+        block_size_kb: Block size em KB informado, um por eixo
+    
+    Returns:
+        Lista de _AxisMetrics, na ordem das colunas
+    """
+    results = []
+    for io, tp, bs in zip(iops, throughput_mbps, block_size_kb):
+        tp_k = tp * _K1024
+        
+        # 1) Throughput a partir de IOPS e Block Size
+        tp_calc = io * bs * _INV_1024
+        # 2) IOPS a partir de Throughput e Block Size (0 se block size inválido)
+        io_calc = int(tp_k / bs) if bs > 0 else 0
+        # 3) Block Size a partir de Throughput e IOPS (0 se IOPS inválido)
+        bs_calc = tp_k / io if io > 0 else 0.0
+        
+        # Divergências (inline): |informado - calculado| / max(|informado|, |calculado|);
+        # o denominador só é 0 quando ambos são 0, caso em que a divergência é 0
+        den = max(abs(tp), abs(tp_calc))
+        tp_div = abs(tp - tp_calc) / den if den else 0.0
+        den = max(abs(io), abs(io_calc))
+        io_div = abs(io - io_calc) / den if den else 0.0
+        den = max(abs(bs), abs(bs_calc))
+        bs_div = abs(bs - bs_calc) / den if den else 0.0
+        
+        # Status pela maior divergência (lookup, sem if/elif)
+        max_div = max(tp_div, io_div, bs_div)
+        status = _STATUS_TABLE[(max_div > WARNING_THRESHOLD) + (max_div > ERROR_THRESHOLD)]
+        
+        results.append(_AxisMetrics(
+            tp_calc, io_calc, bs_calc, tp_div, io_div, bs_div, max_div, status
+        ))
+    return results
+
+
+def _build_axis_result(
     iops: int,
     throughput_mbps: float,
     block_size_kb: float,
-    axis_name: str
+    metrics: _AxisMetrics
 ) -> StorageValidationResult:
+    """Monta o StorageValidationResult (sem mensagens) a partir das métricas do eixo."""
+    return StorageValidationResult(
+        iops_informed=iops,
+        throughput_mbps_informed=throughput_mbps,
+        block_size_kb_informed=block_size_kb,
+        throughput_mbps_calculated=metrics.throughput_calculated,
+        iops_calculated=metrics.iops_calculated,
+        block_size_kb_calculated=metrics.block_size_calculated,
+        throughput_divergence_pct=metrics.throughput_div,
+        iops_divergence_pct=metrics.iops_div,
+        block_size_divergence_pct=metrics.block_size_div,
+        status=metrics.status,
+        messages=[]
+    )
+
+
+def _format_axis_messages(result: StorageValidationResult, axis_name: str) -> list[str]:
     """
-    Valida consistência de um eixo (read ou write).
-    
-    Formula: Throughput(MB/s) = (IOPS × BlockSize(KB)) / 1024
+    Gera as mensagens de um eixo com divergência (vazia para status "ok").
     
     Args:
-        iops: IOPS máximos informados
-        throughput_mbps: Throughput em MB/s informado
-        block_size_kb: Block size em KB informado
+        result: Validação do eixo
         axis_name: "read" ou "write"
     
     Returns:
-        StorageValidationResult
+        Lista de mensagens formatadas
     """
-    # Calcular valores teóricos
-    # 1) Throughput a partir de IOPS e Block Size
-    throughput_calculated = (iops * block_size_kb) / 1024.0
-    
-    # 2) IOPS a partir de Throughput e Block Size
-    if block_size_kb > 0:
-        iops_calculated = int((throughput_mbps * 1024.0) / block_size_kb)
-    else:
-        iops_calculated = 0
-    
-    # 3) Block Size a partir de Throughput e IOPS
-    if iops > 0:
-        block_size_calculated = (throughput_mbps * 1024.0) / iops
-    else:
-        block_size_calculated = 0.0
+    throughput_mbps = result.throughput_mbps_informed
+    throughput_calculated = result.throughput_mbps_calculated
+    throughput_div = result.throughput_divergence_pct
+    iops = result.iops_informed
+    iops_calculated = result.iops_calculated
+    iops_div = result.iops_divergence_pct
+    block_size_kb = result.block_size_kb_informed
+    block_size_calculated = result.block_size_kb_calculated
+    block_size_div = result.block_size_divergence_pct
     
-    # Calcular divergências
-    throughput_div = _calc_divergence(throughput_mbps, throughput_calculated)
-    iops_div = _calc_divergence(iops, iops_calculated)
-    block_size_div = _calc_divergence(block_size_kb, block_size_calculated)
-    
-    # Determinar status (usar a maior divergência)
-    max_div = max(throughput_div, iops_div, block_size_div)
-    
-    if max_div > ERROR_THRESHOLD:
-        status = "error"
-    elif max_div > WARNING_THRESHOLD:
-        status = "warning"
-    else:
-        status = "ok"
-    
-    # Gerar mensagens
     messages = []
     
-    if status == "error":
+    if result.status == "error":
+        max_div = max(throughput_div, iops_div, block_size_div)
         messages.append(
             f"❌ [{axis_name.upper()}] Divergência crítica (>{ERROR_THRESHOLD*100:.0f}%)"
         )
@@ -186,7 +303,7 @@ def _validate_axis(
                 f"Divergência: {block_size_div*100:.1f}%"
             )
     
-    elif status == "warning":
+    elif result.status == "warning":
         messages.append(
             f"⚠️ [{axis_name.upper()}] Divergência moderada ({WARNING_THRESHOLD*100:.0f}%-{ERROR_THRESHOLD*100:.0f}%)"
         )
@@ -206,118 +323,114 @@ def _validate_axis(
                 f"{block_size_calculated:.1f} KB (calculado) → {block_size_div*100:.1f}%"
             )
     
-    return StorageValidationResult(
-        iops_informed=iops,
-        throughput_mbps_informed=throughput_mbps,
-        block_size_kb_informed=block_size_kb,
-        throughput_mbps_calculated=throughput_calculated,
-        iops_calculated=iops_calculated,
-        block_size_kb_calculated=block_size_calculated,
-        throughput_divergence_pct=throughput_div,
-        iops_divergence_pct=iops_div,
-        block_size_divergence_pct=block_size_div,
-        status=status,
-        messages=messages
-    )
+    return messages
 
 
-def _calc_divergence(informed: float, calculated: float) -> float:
-    """
-    Calcula divergência percentual entre valor informado e calculado.
-    
-    diff_pct = abs(informado - calculado) / max(informado, calculado)
-    
-    Args:
-        informed: Valor informado
-        calculated: Valor calculado
-    
-    Returns:
-        Divergência como fração (0.0 - 1.0)
-    """
-    if informed == 0 and calculated == 0:
-        return 0.0
-    
-    max_val = max(abs(informed), abs(calculated))
-    if max_val == 0:
-        return 0.0
-    
-    return abs(informed - calculated) / max_val
+class _AxisReportKey(NamedTuple):
+    """Retrato imutável (hashável) de um StorageValidationResult para o cache do relatório."""
+    iops_informed: int
+    throughput_mbps_informed: float
+    block_size_kb_informed: float
+    throughput_mbps_calculated: float
+    iops_calculated: int
+    block_size_kb_calculated: float
+    throughput_divergence_pct: float
+    iops_divergence_pct: float
+    block_size_divergence_pct: float
+    status: str
+    messages: Tuple[str, ...]
+
+
+def _axis_report_key(v: StorageValidationResult) -> _AxisReportKey:
+    return _AxisReportKey(
+        v.iops_informed, v.throughput_mbps_informed, v.block_size_kb_informed,
+        v.throughput_mbps_calculated, v.iops_calculated, v.block_size_kb_calculated,
+        v.throughput_divergence_pct, v.iops_divergence_pct, v.block_size_divergence_pct,
+        v.status, tuple(v.messages)
+    )
 
 
 def format_validation_report(validation: StorageProfileValidation) -> str:
     """
     Formata relatório de validação em texto.
     
+    Memoizado pelos valores da validação (re-execuções do mesmo perfil
+    devolvem a string já formatada).
+    
     Args:
         validation: Resultado da validação
     
     Returns:
         String formatada para inclusão em relatório
     """
-    lines = []
-    
-    lines.append(f"Storage Profile: {validation.profile_name}")
-    lines.append(f"Status Geral: {validation.overall_status.upper()}")
-    lines.append("")
-    
-    # Tabela READ
-    lines.append("READ VALIDATION:")
-    lines.append("=" * 100)
-    lines.append(f"{'Métrica':<25} {'Informado':>20} {'Calculado':>20} {'Divergência':>15} {'Status':>15}")
-    lines.append("-" * 100)
-    
-    rv = validation.read_validation
-    lines.append(
-        f"{'IOPS':<25} {rv.iops_informed:>20,} {rv.iops_calculated:>20,} "
-        f"{rv.iops_divergence_pct*100:>14.1f}% {rv.status:>15}"
-    )
-    lines.append(
-        f"{'Block Size (KB)':<25} {rv.block_size_kb_informed:>20,.1f} {rv.block_size_kb_calculated:>20,.1f} "
-        f"{rv.block_size_divergence_pct*100:>14.1f}% {rv.status:>15}"
-    )
-    lines.append(
-        f"{'Throughput (MB/s)':<25} {rv.throughput_mbps_informed:>20,.1f} {rv.throughput_mbps_calculated:>20,.1f} "
-        f"{rv.throughput_divergence_pct*100:>14.1f}% {rv.status:>15}"
-    )
-    lines.append("")
-    
-    # Tabela WRITE
-    lines.append("WRITE VALIDATION:")
-    lines.append("=" * 100)
-    lines.append(f"{'Métrica':<25} {'Informado':>20} {'Calculado':>20} {'Divergência':>15} {'Status':>15}")
-    lines.append("-" * 100)
-    
-    wv = validation.write_validation
-    lines.append(
-        f"{'IOPS':<25} {wv.iops_informed:>20,} {wv.iops_calculated:>20,} "
-        f"{wv.iops_divergence_pct*100:>14.1f}% {wv.status:>15}"
-    )
-    lines.append(
-        f"{'Block Size (KB)':<25} {wv.block_size_kb_informed:>20,.1f} {wv.block_size_kb_calculated:>20,.1f} "
-        f"{wv.block_size_divergence_pct*100:>14.1f}% {wv.status:>15}"
+    return _format_validation_report(
+        validation.profile_name,
+        validation.overall_status,
+        tuple(validation.messages),
+        _axis_report_key(validation.read_validation),
+        _axis_report_key(validation.write_validation)
     )
-    lines.append(
-        f"{'Throughput (MB/s)':<25} {wv.throughput_mbps_informed:>20,.1f} {wv.throughput_mbps_calculated:>20,.1f} "
-        f"{wv.throughput_divergence_pct*100:>14.1f}% {wv.status:>15}"
-    )
-    lines.append("")
+
+
+def clear_validation_report_cache() -> None:
+    """Descarta os relatórios memoizados (ex.: após alterar os thresholds)."""
+    _format_validation_report.cache_clear()
+
+
+@functools.lru_cache(maxsize=64)
+def _format_validation_report(
+    profile_name: str,
+    overall_status: str,
+    messages: Tuple[str, ...],
+    rv: _AxisReportKey,
+    wv: _AxisReportKey
+) -> str:
+    buf = io.StringIO()
+    write = buf.write
+    
+    write(f"Storage Profile: {profile_name}\n")
+    write(f"Status Geral: {overall_status.upper()}\n")
+    write("\n")
+    
+    _write_axis_table(write, "READ VALIDATION:", rv)
+    _write_axis_table(write, "WRITE VALIDATION:", wv)
     
     # Mensagens
-    if validation.messages:
-        lines.append("MENSAGENS:")
-        for msg in validation.messages:
-            lines.append(f"  {msg}")
-        lines.append("")
+    if messages:
+        write("MENSAGENS:\n")
+        for msg in messages:
+            write(f"  {msg}\n")
+        write("\n")
     
-    if rv.messages:
-        for msg in rv.messages:
-            lines.append(f"  {msg}")
+    for msg in rv.messages:
+        write(f"  {msg}\n")
     
-    if wv.messages:
-        for msg in wv.messages:
-            lines.append(f"  {msg}")
+    for msg in wv.messages:
+        write(f"  {msg}\n")
     
-    return "\n".join(lines)
+    # Sem quebra de linha final (mesmo formato de "\n".join)
+    return buf.getvalue()[:-1]
+
+
+def _write_axis_table(write, title: str, v: _AxisReportKey) -> None:
+    """Escreve a tabela de validação de um eixo (read ou write)."""
+    write(f"{title}\n")
+    write(_TABLE_HEADER)
+    write(_IOPS_ROW_FMT.format(
+        name="IOPS", informed=v.iops_informed, calculated=v.iops_calculated,
+        div=v.iops_divergence_pct * 100, status=v.status
+    ))
+    write(_FLOAT_ROW_FMT.format(
+        name="Block Size (KB)", informed=v.block_size_kb_informed,
+        calculated=v.block_size_kb_calculated, div=v.block_size_divergence_pct * 100,
+        status=v.status
+    ))
+    write(_FLOAT_ROW_FMT.format(
+        name="Throughput (MB/s)", informed=v.throughput_mbps_informed,
+        calculated=v.throughput_mbps_calculated, div=v.throughput_divergence_pct * 100,
+        status=v.status
+    ))
+    write("\n")
 
 
 def validation_to_dict(validation: StorageProfileValidation) -> Dict[str, Any]:
@@ -333,31 +446,24 @@ def validation_to_dict(validation: StorageProfileValidation) -> Dict[str, Any]:
     return {
         "profile_name": validation.profile_name,
         "overall_status": validation.overall_status,
-        "read": {
-            "iops_informed": validation.read_validation.iops_informed,
-            "iops_calculated": validation.read_validation.iops_calculated,
-            "iops_divergence_pct": round(validation.read_validation.iops_divergence_pct, 4),
-            "throughput_mbps_informed": round(validation.read_validation.throughput_mbps_informed, 2),
-            "throughput_mbps_calculated": round(validation.read_validation.throughput_mbps_calculated, 2),
-            "throughput_divergence_pct": round(validation.read_validation.throughput_divergence_pct, 4),
-            "block_size_kb_informed": round(validation.read_validation.block_size_kb_informed, 2),
-            "block_size_kb_calculated": round(validation.read_validation.block_size_kb_calculated, 2),
-            "block_size_divergence_pct": round(validation.read_validation.block_size_divergence_pct, 4),
-            "status": validation.read_validation.status,
-            "messages": validation.read_validation.messages
-        },
-        "write": {
-            "iops_informed": validation.write_validation.iops_informed,
-            "iops_calculated": validation.write_validation.iops_calculated,
-            "iops_divergence_pct": round(validation.write_validation.iops_divergence_pct, 4),
-            "throughput_mbps_informed": round(validation.write_validation.throughput_mbps_informed, 2),
-            "throughput_mbps_calculated": round(validation.write_validation.throughput_mbps_calculated, 2),
-            "throughput_divergence_pct": round(validation.write_validation.throughput_divergence_pct, 4),
-            "block_size_kb_informed": round(validation.write_validation.block_size_kb_informed, 2),
-            "block_size_kb_calculated": round(validation.write_validation.block_size_kb_calculated, 2),
-            "block_size_divergence_pct": round(validation.write_validation.block_size_divergence_pct, 4),
-            "status": validation.write_validation.status,
-            "messages": validation.write_validation.messages
-        },
+        "read": _axis_to_dict(validation.read_validation),
+        "write": _axis_to_dict(validation.write_validation),
         "messages": validation.messages
     }
+
+
+def _axis_to_dict(v: StorageValidationResult) -> Dict[str, Any]:
+    """Converte a validação de um eixo para dicionário (bloco "read"/"write")."""
+    return {
+        "iops_informed": v.iops_informed,
+        "iops_calculated": v.iops_calculated,
+        "iops_divergence_pct": round(v.iops_divergence_pct, 4),
+        "throughput_mbps_informed": round(v.throughput_mbps_informed, 2),
+        "throughput_mbps_calculated": round(v.throughput_mbps_calculated, 2),
+        "throughput_divergence_pct": round(v.throughput_divergence_pct, 4),
+        "block_size_kb_informed": round(v.block_size_kb_informed, 2),
+        "block_size_kb_calculated": round(v.block_size_kb_calculated, 2),
+        "block_size_divergence_pct": round(v.block_size_divergence_pct, 4),
+        "status": v.status,
+        "messages": v.messages
+    }
@@ -2,6 +2,7 @@
 Cálculos de VRAM (pesos fixos + KV variável + budget operacional).
 """
 
+import functools
 import math
 from dataclasses import dataclass
 from typing import List, Optional
@@ -13,7 +14,7 @@ from .servers import ServerSpec
 GIB_FACTOR = 2**30
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class VRAMResult:
     """Resultado do cálculo de VRAM."""
     # Pesos do modelo
@@ -50,36 +51,47 @@ def calc_weights_memory(
     Returns:
         (weights_gib, was_estimated, warnings)
     """
-    warnings = []
-    
     if weights_memory_override is not None:
-        return weights_memory_override, False, warnings
-    
-    # Tentar obter do models.json
-    weights_gib = model.get_weights_memory(weights_precision)
-    
-    if weights_gib is not None:
-        return weights_gib, False, warnings
+        return weights_memory_override, False, []
+    
+    # Memoizado pelos valores primitivos que determinam o resultado; a lista
+    # de warnings é sempre uma cópia nova (o chamador pode estendê-la)
+    weights_gib, was_estimated, warnings = _weights_memory_cached(
+        weights_precision,
+        model.get_weights_memory(weights_precision),
+        model.total_params_b
+    )
+    return weights_gib, was_estimated, list(warnings)
+
+
+@functools.lru_cache(maxsize=256)
+def _weights_memory_cached(
+    weights_precision: str,
+    weights_gib_informed: Optional[float],
+    total_params_b: Optional[float]
+) -> tuple[float, bool, tuple[str, ...]]:
+    """Núcleo de calc_weights_memory sobre primitivos hasháveis (warnings em tupla)."""
+    # Valor do models.json
+    if weights_gib_informed is not None:
+        return weights_gib_informed, False, ()
     
     # Estimar se total_params_b disponível
-    if model.total_params_b is not None:
-        bytes_per_param = model.weights_bytes_per_param(weights_precision)
-        weights_gib = model.total_params_b * 1e9 * bytes_per_param / GIB_FACTOR
+    if total_params_b is not None:
+        bytes_per_param = ModelSpec.weights_bytes_per_param(weights_precision)
+        weights_gib = total_params_b * 1e9 * bytes_per_param / GIB_FACTOR
         
-        warnings.append(
+        return weights_gib, True, (
             f"⚠️  AVISO: Memória de pesos para {weights_precision.upper()} foi ESTIMADA "
-            f"({weights_gib:.2f} GiB) a partir de total_params_b={model.total_params_b}B. "
-            f"Para sizing preciso, forneça valor exato em models.json ou via CLI."
+            f"({weights_gib:.2f} GiB) a partir de total_params_b={total_params_b}B. "
+            f"Para sizing preciso, forneça valor exato em models.json ou via CLI.",
         )
-        return weights_gib, True, warnings
     
     # Fallback: não foi possível determinar
-    warnings.append(
+    return 0.0, True, (
         f"🚨 ERRO CRÍTICO: Memória de pesos para {weights_precision.upper()} NÃO PÔDE SER "
         "DETERMINADA. Assumindo 0 GiB, o que provavelmente levará a sizing incorreto. "
-        "Forneça weights_memory_gib em models.json, total_params_b, ou via CLI."
+        "Forneça weights_memory_gib em models.json, total_params_b, ou via CLI.",
     )
-    return 0.0, True, warnings
 
 
 def calc_vram(
@@ -5,12 +5,16 @@ Estima tempo necessário para carregar artefatos do modelo do storage para memó
 considerando throughput e IOPS disponíveis, pattern de acesso (seq/rand) e concorrência.
 """
 
+import io
 from dataclasses import dataclass
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from .storage import StorageProfile
 
 
-@dataclass
+_INV_1024 = 1.0 / 1024.0  # KB -> MB e IOPS×KB -> MB/s sem divisão
+
+
+@dataclass(frozen=True, slots=True)
 class WarmupEstimate:
     """Estimativa de tempo de warmup/cold start."""
     
@@ -34,7 +38,7 @@ class WarmupEstimate:
     
     # Análise
     bottleneck: str  # "throughput-limited" ou "iops-limited"
-    rationale: Dict[str, Any]
+    rationale: Optional[Dict[str, Any]]  # None se include_rationale=False
 
 
 def calc_warmup_estimate(
@@ -42,7 +46,8 @@ def calc_warmup_estimate(
     artifact_size_gib: float,
     warmup_concurrency: int = 1,
     read_pattern: str = "seq",
-    utilization_ratio: float = 0.8
+    utilization_ratio: float = 0.8,
+    include_rationale: bool = True
 ) -> WarmupEstimate:
     """
     Calcula estimativa de tempo de warmup/cold start.
@@ -53,6 +58,8 @@ def calc_warmup_estimate(
         warmup_concurrency: Número de pods iniciando em paralelo
         read_pattern: "seq" (sequencial) ou "rand" (random)
         utilization_ratio: Fração do max utilizável (ex.: 0.8 = 80%)
+        include_rationale: Se False, não monta o rationale (laços de sizing que
+            só precisam dos tempos)
     
     Returns:
         WarmupEstimate com tempos e análise
@@ -62,44 +69,35 @@ def calc_warmup_estimate(
     
     # Calcular throughput efetivo
     # Usar throughput teórico (IOPS × BlockSize) se menor que informado
-    throughput_theoretical_mbps = (storage.iops_read_max * storage.block_size_kb_read) / 1024.0
+    throughput_theoretical_mbps = storage.iops_read_max * storage.block_size_kb_read * _INV_1024
     throughput_base_mbps = min(storage.throughput_read_mbps, throughput_theoretical_mbps)
     throughput_effective_mbps = throughput_base_mbps * utilization_ratio
     
     # Calcular IOPS efetivo
     iops_effective = int(storage.iops_read_max * utilization_ratio)
     
+    # Recíproco do throughput (0 se storage sem throughput efetivo)
+    inv_tp = 1.0 / throughput_effective_mbps if throughput_effective_mbps > 0 else 0.0
+    
     # 1) Tempo por pod (individual, sem concorrência)
-    if throughput_effective_mbps > 0:
-        warmup_time_per_pod_s = artifact_size_mib / throughput_effective_mbps
-    else:
-        warmup_time_per_pod_s = 0.0
+    warmup_time_per_pod_s = artifact_size_mib * inv_tp
     
     # 2) Tempo com concorrência (assumindo storage como gargalo compartilhado)
-    if throughput_effective_mbps > 0:
-        total_data_mib = artifact_size_mib * warmup_concurrency
-        warmup_time_cluster_s = total_data_mib / throughput_effective_mbps
-    else:
-        warmup_time_cluster_s = 0.0
+    warmup_time_cluster_s = warmup_time_per_pod_s * warmup_concurrency
     
     # 3) Se pattern é random, validar por IOPS
     warmup_time_by_iops_s = 0.0
-    if read_pattern == "rand" and storage.block_size_kb_read > 0:
-        # Calcular número de IOs necessários
-        bytes_per_io_mib = storage.block_size_kb_read / 1024.0
+    if read_pattern == "rand" and storage.block_size_kb_read > 0 and iops_effective > 0:
+        # Número de IOs necessários e tempo para completá-las (1 pod)
+        bytes_per_io_mib = storage.block_size_kb_read * _INV_1024
         total_ios = artifact_size_mib / bytes_per_io_mib
+        warmup_time_by_iops_pod_s = total_ios * (1.0 / iops_effective)
+        
+        # Com concorrência
+        warmup_time_by_iops_s = warmup_time_by_iops_pod_s * warmup_concurrency
         
-        if iops_effective > 0:
-            # Tempo para completar todas as IOs (1 pod)
-            warmup_time_by_iops_s = total_ios / iops_effective
-            
-            # Com concorrência
-            total_ios_cluster = total_ios * warmup_concurrency
-            warmup_time_by_iops_cluster_s = total_ios_cluster / iops_effective
-            
-            # Para random, usar o máximo entre throughput e IOPS
-            warmup_time_cluster_s = max(warmup_time_cluster_s, warmup_time_by_iops_cluster_s)
-            warmup_time_by_iops_s = warmup_time_by_iops_cluster_s
+        # Para random, usar o máximo entre throughput e IOPS
+        warmup_time_cluster_s = max(warmup_time_cluster_s, warmup_time_by_iops_s)
     
     # 4) Determinar tempo final e bottleneck
     if read_pattern == "rand" and warmup_time_by_iops_s > warmup_time_cluster_s * 1.1:
@@ -111,8 +109,49 @@ def calc_warmup_estimate(
         warmup_time_final_s = warmup_time_cluster_s
         bottleneck = "throughput-limited"
     
-    # Racional
-    rationale = {
+    # Racional (opcional)
+    rationale = _build_rationale(
+        artifact_size_gib, artifact_size_mib, warmup_concurrency, read_pattern,
+        utilization_ratio, storage, throughput_effective_mbps, iops_effective,
+        warmup_time_per_pod_s, warmup_time_cluster_s, warmup_time_by_iops_s,
+        warmup_time_final_s, bottleneck
+    ) if include_rationale else None
+    
+    return WarmupEstimate(
+        artifact_size_gib=artifact_size_gib,
+        artifact_size_mib=artifact_size_mib,
+        warmup_concurrency=warmup_concurrency,
+        read_pattern=read_pattern,
+        utilization_ratio=utilization_ratio,
+        throughput_effective_mbps=throughput_effective_mbps,
+        iops_effective=iops_effective,
+        block_size_kb=storage.block_size_kb_read,
+        warmup_time_per_pod_s=warmup_time_per_pod_s,
+        warmup_time_cluster_s=warmup_time_cluster_s,
+        warmup_time_by_iops_s=warmup_time_by_iops_s,
+        warmup_time_final_s=warmup_time_final_s,
+        bottleneck=bottleneck,
+        rationale=rationale
+    )
+
+
+def _build_rationale(
+    artifact_size_gib: float,
+    artifact_size_mib: float,
+    warmup_concurrency: int,
+    read_pattern: str,
+    utilization_ratio: float,
+    storage: StorageProfile,
+    throughput_effective_mbps: float,
+    iops_effective: int,
+    warmup_time_per_pod_s: float,
+    warmup_time_cluster_s: float,
+    warmup_time_by_iops_s: float,
+    warmup_time_final_s: float,
+    bottleneck: str
+) -> Dict[str, Any]:
+    """Monta o rationale de calc_warmup_estimate (fórmulas, inputs e significado)."""
+    return {
         "formula_throughput": "warmup_time_s = (artifact_size_mib × concurrency) / throughput_effective_mbps",
         "formula_iops": "warmup_time_s = (total_ios × concurrency) / iops_effective (se pattern==rand)",
         "inputs": {
@@ -145,23 +184,6 @@ def calc_warmup_estimate(
             "Impacta tempo de recuperação após falha e scale-out velocity."
         )
     }
-    
-    return WarmupEstimate(
-        artifact_size_gib=artifact_size_gib,
-        artifact_size_mib=artifact_size_mib,
-        warmup_concurrency=warmup_concurrency,
-        read_pattern=read_pattern,
-        utilization_ratio=utilization_ratio,
-        throughput_effective_mbps=throughput_effective_mbps,
-        iops_effective=iops_effective,
-        block_size_kb=storage.block_size_kb_read,
-        warmup_time_per_pod_s=warmup_time_per_pod_s,
-        warmup_time_cluster_s=warmup_time_cluster_s,
-        warmup_time_by_iops_s=warmup_time_by_iops_s,
-        warmup_time_final_s=warmup_time_final_s,
-        bottleneck=bottleneck,
-        rationale=rationale
-    )
 
 
 def format_warmup_report(warmup: WarmupEstimate) -> str:
@@ -174,33 +196,36 @@ def format_warmup_report(warmup: WarmupEstimate) -> str:
     Returns:
         String formatada
     """
-    lines = []
-    
-    lines.append("WARMUP / COLD START ESTIMATE:")
-    lines.append("=" * 100)
-    lines.append(f"Artifact Size:        {warmup.artifact_size_gib:.2f} GiB ({warmup.artifact_size_mib:.1f} MiB)")
-    lines.append(f"Concurrency:          {warmup.warmup_concurrency} pods")
-    lines.append(f"Read Pattern:         {warmup.read_pattern.upper()}")
-    lines.append(f"Utilization Ratio:    {warmup.utilization_ratio*100:.0f}%")
-    lines.append("")
-    
-    lines.append("STORAGE EFFECTIVE:")
-    lines.append(f"  • Throughput:       {warmup.throughput_effective_mbps:.1f} MB/s")
-    lines.append(f"  • IOPS:             {warmup.iops_effective:,}")
-    lines.append(f"  • Block Size:       {warmup.block_size_kb:.1f} KB")
-    lines.append("")
-    
-    lines.append("WARMUP TIME ESTIMATES:")
-    lines.append(f"  • Per pod:          {warmup.warmup_time_per_pod_s:.1f} seconds ({warmup.warmup_time_per_pod_s/60:.2f} min)")
-    lines.append(f"  • Cluster ({warmup.warmup_concurrency} pods): {warmup.warmup_time_final_s:.1f} seconds ({warmup.warmup_time_final_s/60:.2f} min)")
-    lines.append(f"  • Bottleneck:       {warmup.bottleneck.upper()}")
-    lines.append("")
-    
-    lines.append("OPERATIONAL IMPACT:")
-    lines.append(f"  {warmup.rationale['operational_meaning']}")
-    lines.append("")
-    
-    return "\n".join(lines)
+    buf = io.StringIO()
+    write = buf.write
+    
+    write("WARMUP / COLD START ESTIMATE:\n")
+    write("=" * 100 + "\n")
+    write(f"Artifact Size:        {warmup.artifact_size_gib:.2f} GiB ({warmup.artifact_size_mib:.1f} MiB)\n")
+    write(f"Concurrency:          {warmup.warmup_concurrency} pods\n")
+    write(f"Read Pattern:         {warmup.read_pattern.upper()}\n")
+    write(f"Utilization Ratio:    {warmup.utilization_ratio*100:.0f}%\n")
+    write("\n")
+    
+    write("STORAGE EFFECTIVE:\n")
+    write(f"  • Throughput:       {warmup.throughput_effective_mbps:.1f} MB/s\n")
+    write(f"  • IOPS:             {warmup.iops_effective:,}\n")
+    write(f"  • Block Size:       {warmup.block_size_kb:.1f} KB\n")
+    write("\n")
+    
+    write("WARMUP TIME ESTIMATES:\n")
+    write(f"  • Per pod:          {warmup.warmup_time_per_pod_s:.1f} seconds ({warmup.warmup_time_per_pod_s/60:.2f} min)\n")
+    write(f"  • Cluster ({warmup.warmup_concurrency} pods): {warmup.warmup_time_final_s:.1f} seconds ({warmup.warmup_time_final_s/60:.2f} min)\n")
+    write(f"  • Bottleneck:       {warmup.bottleneck.upper()}\n")
+    write("\n")
+    
+    if warmup.rationale is not None:
+        write("OPERATIONAL IMPACT:\n")
+        write(f"  {warmup.rationale['operational_meaning']}\n")
+        write("\n")
+    
+    # Sem quebra de linha final (mesmo formato de "\n".join)
+    return buf.getvalue()[:-1]
 
 
 def warmup_to_dict(warmup: WarmupEstimate) -> Dict[str, Any]:
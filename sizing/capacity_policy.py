@@ -9,30 +9,74 @@ Essa margem protege contra subdimensionamento e permite:
 - Resiliência operacional
 """
 
-from dataclasses import dataclass
-from typing import List, Dict, Any
+from dataclasses import dataclass, field
+from typing import Dict, Any, Callable, FrozenSet, Sequence, Tuple
+import functools
 import json
+import os
+from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # orjson é opcional: sem ele usa json da stdlib
+    orjson = None
 
-@dataclass
+
+# Métricas às quais a margem pode ser aplicada (apply_margin_to)
+_VALID_TARGETS: FrozenSet[str] = frozenset({
+    "storage_total",
+    "storage_model",
+    "storage_cache",
+    "storage_logs",
+    "storage_operational"
+})
+_VALID_TARGETS_SORTED = sorted(_VALID_TARGETS)
+
+
+def _no_margin(base_value: float) -> float:
+    """Métrica fora de apply_to: valor base inalterado."""
+    return base_value
+
+
+@dataclass(frozen=True, slots=True)
 class CapacityPolicy:
     """
     Política de margem de capacidade para storage.
     
     Attributes:
         margin_percent: Percentual de margem (0.0 a 1.0). Ex: 0.50 = 50%
-        apply_to: Lista de métricas às quais aplicar a margem
+        apply_to: Métricas às quais aplicar a margem (tupla: a política é imutável)
         target_load_time_sec: Tempo máximo (segundos) para carregar modelo no restart
         notes: Justificativa da política
         source: Origem da política (arquivo ou CLI override)
     """
     
     margin_percent: float
-    apply_to: List[str]
+    apply_to: Tuple[str, ...]
     target_load_time_sec: float = 60.0  # Default: 60 segundos
     notes: str = ""
     source: str = "parameters.json"
     
+    # Derivados (pré-calculados em __post_init__ para apply_margin)
+    _apply_to_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    _apply_fn: Dict[str, Callable[[float], float]] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        # frozen=True: atributos derivados via object.__setattr__
+        apply_to_set = frozenset(self.apply_to)
+        multiplier = 1 + self.margin_percent
+        
+        def with_margin(base_value: float) -> float:
+            # Arredondar para 2 casas decimais
+            return round(base_value * multiplier, 2)
+        
+        # Função de margem por métrica: decidida uma vez, sem if por chamada
+        object.__setattr__(self, "_apply_to_set", apply_to_set)
+        object.__setattr__(self, "_apply_fn", {
+            name: with_margin if name in apply_to_set else _no_margin
+            for name in _VALID_TARGETS | apply_to_set
+        })
+    
     def validate(self) -> None:
         """Valida a política de capacidade."""
         if self.margin_percent < 0:
@@ -58,19 +102,11 @@ class CapacityPolicy:
                 f"Use valores >= 10 segundos para garantir viabilidade com storage real."
             )
         
-        valid_targets = {
-            "storage_total",
-            "storage_model",
-            "storage_cache",
-            "storage_logs",
-            "storage_operational"
-        }
-        
         for target in self.apply_to:
-            if target not in valid_targets:
+            if target not in _VALID_TARGETS:
                 raise ValueError(
                     f"Métrica inválida em 'apply_margin_to': {target}. "
-                    f"Valores válidos: {sorted(valid_targets)}"
+                    f"Valores válidos: {_VALID_TARGETS_SORTED}"
                 )
     
     def apply_margin(self, base_value: float, metric_name: str) -> float:
@@ -84,12 +120,28 @@ class CapacityPolicy:
         Returns:
             Valor recomendado com margem aplicada (ou valor base se não aplicável)
         """
-        if metric_name in self.apply_to:
-            recommended = base_value * (1 + self.margin_percent)
-            # Arredondar para 2 casas decimais
-            return round(recommended, 2)
-        else:
-            return base_value
+        return self._apply_fn.get(metric_name, _no_margin)(base_value)
+    
+    def apply_margin_vector(
+        self,
+        base_values: Sequence[float],
+        metric_names: Sequence[str]
+    ) -> Tuple[float, ...]:
+        """
+        Aplica apply_margin a vários valores em uma chamada.
+        
+        Args:
+            base_values: Valores base calculados
+            metric_names: Nome da métrica de cada valor (mesma ordem)
+        
+        Returns:
+            Tupla com os valores recomendados, na ordem de base_values
+        """
+        get_fn = self._apply_fn.get
+        return tuple(
+            get_fn(name, _no_margin)(value)
+            for value, name in zip(base_values, metric_names)
+        )
     
     def get_margin_info(self, base_value: float, metric_name: str) -> Dict[str, Any]:
         """
@@ -98,12 +150,16 @@ class CapacityPolicy:
         Returns:
             Dict com base_value, recommended_value, margin_applied, margin_percent
         """
-        recommended = self.apply_margin(base_value, metric_name)
-        margin_applied = metric_name in self.apply_to
+        base_rounded = round(base_value, 2)
+        margin_applied = metric_name in self._apply_to_set
+        # Com margem, apply_margin já arredonda; sem margem, recomendado == base
+        recommended = (
+            self._apply_fn[metric_name](base_value) if margin_applied else base_rounded
+        )
         
         return {
-            "base_value": round(base_value, 2),
-            "recommended_value": round(recommended, 2),
+            "base_value": base_rounded,
+            "recommended_value": recommended,
             "margin_applied": margin_applied,
             "margin_percent": self.margin_percent if margin_applied else 0.0,
             "metric_name": metric_name
@@ -117,6 +173,9 @@ def load_capacity_policy(
     """
     Carrega política de capacidade do arquivo JSON.
     
+    O parse do arquivo é memoizado por (filepath, mtime); override e
+    validação são aplicados a cada chamada.
+    
     Args:
         filepath: Caminho para o arquivo de política
         override_margin: Percentual de override via CLI (opcional)
@@ -129,8 +188,7 @@ def load_capacity_policy(
         ValueError: Se a política for inválida
     """
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = _load_raw(filepath, os.stat(filepath).st_mtime_ns)
     except FileNotFoundError:
         raise FileNotFoundError(
             f"❌ ERRO: Arquivo de política de capacidade não encontrado: {filepath}\n\n"
@@ -143,8 +201,6 @@ def load_capacity_policy(
             f'  "notes": "Margem recomendada para crescimento e eventos não previstos."\n'
             f'}}\n'
         )
-    except json.JSONDecodeError as e:
-        raise ValueError(f"❌ ERRO: Arquivo {filepath} não é um JSON válido: {e}")
     
     # Validar campos obrigatórios
     if "capacity_margin_percent" not in data:
@@ -166,7 +222,7 @@ def load_capacity_policy(
     
     policy = CapacityPolicy(
         margin_percent=margin_percent,
-        apply_to=data["apply_margin_to"],
+        apply_to=tuple(data["apply_margin_to"]),
         target_load_time_sec=target_load_time_sec,
         notes=data.get("notes", ""),
         source=source
@@ -176,3 +232,19 @@ def load_capacity_policy(
     policy.validate()
     
     return policy
+
+
+@functools.lru_cache(maxsize=8)
+def _load_raw(filepath: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Lê e parseia o arquivo de política (memoizado).
+    
+    mtime_ns faz parte da chave: editar o arquivo invalida a entrada. O dict
+    retornado é compartilhado entre chamadas e não deve ser modificado.
+    """
+    try:
+        # Bytes em uma leitura só, sem camada de texto (o parser decodifica UTF-8)
+        raw = Path(filepath).read_bytes()
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except json.JSONDecodeError as e:  # orjson.JSONDecodeError é subclasse
+        raise ValueError(f"❌ ERRO: Arquivo {filepath} não é um JSON válido: {e}")
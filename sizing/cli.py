@@ -7,12 +7,65 @@ Dois modos mutuamente exclusivos:
 """
 
 import argparse
+import functools
 import json
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Optional
 
-
-@dataclass
+try:
+    import orjson
+except ImportError:  # orjson é opcional: sem ele usa json da stdlib
+    orjson = None
+
+
+# Validação cruzada de modo. --concurrency e --ttft já são mutuamente
+# exclusivos no argparse; as demais combinações são resolvidas por tabela.
+_ERR_TPOT_WITH_CONCURRENCY = (
+    "ERRO: --tpot não pode ser usado com --concurrency.\n"
+    "       Use --ttft e --tpot juntos para o MODO B (Sizing por SLO).\n"
+    "       Use --concurrency sozinho para o MODO A (Sizing por Concorrência)."
+)
+_ERR_TTFT_WITHOUT_TPOT = (
+    "ERRO: --ttft requer --tpot. TTFT e TPOT são obrigatórios em conjunto no MODO B (Sizing por SLO).\n"
+    "       Exemplo: --ttft 2000 --tpot 8.0"
+)
+_ERR_TPOT_WITHOUT_TTFT = (
+    "ERRO: --tpot requer --ttft. TTFT e TPOT são obrigatórios em conjunto no MODO B (Sizing por SLO).\n"
+    "       Exemplo: --ttft 2000 --tpot 8.0"
+)
+_ERR_NO_MODE = (
+    "ERRO: Nenhum modo especificado. Escolha exatamente UM dos modos:\n"
+    "       MODO A — Sizing por Concorrência: --concurrency <N>\n"
+    "       MODO B — Sizing por SLO:          --ttft <ms> --tpot <tok/s>"
+)
+
+# Índice: (concurrency << 2) | (ttft << 1) | tpot → (sizing_mode, erro)
+_MODE_TABLE = (
+    (None, _ERR_NO_MODE),                   # 000
+    (None, _ERR_TPOT_WITHOUT_TTFT),         # 001
+    (None, _ERR_TTFT_WITHOUT_TPOT),         # 010
+    ("slo_driven", None),                   # 011 — MODO B
+    ("concurrency_driven", None),           # 100 — MODO A
+    (None, _ERR_TPOT_WITH_CONCURRENCY),     # 101
+    (None, _ERR_TTFT_WITHOUT_TPOT),         # 110 (bloqueado pelo argparse)
+    (None, _ERR_TPOT_WITH_CONCURRENCY),     # 111 (bloqueado pelo argparse)
+)
+
+
+# Argumentos do modo, traduzidos por parse_cli_args (não são campos de CLIConfig)
+_MODE_ARGS = ("concurrency", "ttft", "tpot", "ttft_p99")
+
+# Placeholders de --validate-only para seleções/contexto não informados
+_VALIDATE_ONLY_DEFAULTS = {
+    "model_name": "dummy",
+    "server_name": "dummy",
+    "storage_name": "dummy",
+    "effective_context": 1,
+}
+
+
+@dataclass(frozen=True, slots=True)
 class CLIConfig:
     """Configuração derivada dos argumentos CLI."""
     # Seleções
@@ -63,15 +116,21 @@ class CLIConfig:
 def _load_default_concurrency_slo_mode() -> int:
     """Carrega default_concurrency_slo_mode de parameters.json com fallback."""
     try:
-        with open('parameters.json', 'r', encoding='utf-8') as f:
-            params = json.load(f)
-            return int(params.get('default_concurrency_slo_mode', 1000))
+        raw = Path('parameters.json').read_bytes()
+        params = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        return int(params.get('default_concurrency_slo_mode', 1000))
     except Exception:
         return 1000
 
 
+@functools.cache
 def create_arg_parser() -> argparse.ArgumentParser:
-    """Cria parser de argumentos CLI."""
+    """
+    Cria parser de argumentos CLI.
+    
+    O parser é construído uma vez por processo e reutilizado (parse_args não
+    o altera); create_arg_parser.cache_clear() força uma nova construção.
+    """
     parser = argparse.ArgumentParser(
         description=(
             "Sizing de Infraestrutura para Inferência de LLMs\n\n"
@@ -85,9 +144,13 @@ def create_arg_parser() -> argparse.ArgumentParser:
     )
 
     # Seleções (obrigatórias exceto em --validate-only)
-    parser.add_argument("--model", help="Nome do modelo (ex: opt-oss-120b)")
-    parser.add_argument("--server", help="Nome do servidor (ex: dgx-b300)")
-    parser.add_argument("--storage", help="Nome do perfil de storage (ex: profile_default)")
+    # (dest = nome do campo em CLIConfig; metavar preserva o texto do --help)
+    parser.add_argument("--model", dest="model_name", metavar="MODEL",
+                        help="Nome do modelo (ex: opt-oss-120b)")
+    parser.add_argument("--server", dest="server_name", metavar="SERVER",
+                        help="Nome do servidor (ex: dgx-b300)")
+    parser.add_argument("--storage", dest="storage_name", metavar="STORAGE",
+                        help="Nome do perfil de storage (ex: profile_default)")
 
     # ─── MODOS MUTUAMENTE EXCLUSIVOS ──────────────────────────────────────────
     mode_group = parser.add_mutually_exclusive_group()
@@ -181,76 +244,36 @@ def parse_cli_args() -> CLIConfig:
 
     # ── Modo --validate-only ──────────────────────────────────────────────────
     if args.validate_only:
-        return CLIConfig(
-            model_name=args.model if args.model else "dummy",
-            server_name=args.server if args.server else "dummy",
-            storage_name=args.storage if args.storage else "dummy",
-            concurrency=args.concurrency if args.concurrency else 1,
+        # Seleções/contexto ausentes recebem placeholders (não usados na validação)
+        placeholders = {
+            name: getattr(args, name) or default
+            for name, default in _VALIDATE_ONLY_DEFAULTS.items()
+        }
+        return _config_from_args(
+            args,
+            concurrency=args.concurrency or 1,
             concurrency_input=args.concurrency,
-            effective_context=args.effective_context if args.effective_context else 1,
-            kv_precision=args.kv_precision,
-            kv_budget_ratio=args.kv_budget_ratio,
-            runtime_overhead_gib=args.runtime_overhead_gib,
-            peak_headroom_ratio=args.peak_headroom_ratio,
-            weights_precision=args.weights_precision,
-            weights_memory_gib=args.weights_memory_gib,
-            replicas_per_node=args.replicas_per_node,
-            tensor_parallel=args.tensor_parallel,
-            pipeline_parallel=args.pipeline_parallel,
-            model_artifact_size_gib=args.model_artifact_size_gib,
-            warmup_concurrency=args.warmup_concurrency,
-            warmup_read_pattern=args.warmup_read_pattern,
-            warmup_utilization_ratio=args.warmup_utilization_ratio,
-            capacity_margin=args.capacity_margin,
-            target_load_time=args.target_load_time,
             ttft_input_ms=None,
             tpot_input_ms=None,
             ttft_p99=None,
             sizing_mode="concurrency_driven",
-            executive_report=args.executive_report,
-            verbose=args.verbose,
-            validate_only=True
+            **placeholders
         )
 
     # ── Detectar e validar modo de operação ──────────────────────────────────
 
-    has_concurrency = args.concurrency is not None
-    has_ttft = args.ttft is not None
-    has_tpot = args.tpot is not None
-
-    # Verificar: --tpot sem --ttft (o grupo mutually exclusive já impede --tpot com --concurrency
-    # pois --tpot não está no grupo, então validamos manualmente)
-    if has_tpot and has_concurrency:
-        parser.error(
-            "ERRO: --tpot não pode ser usado com --concurrency.\n"
-            "       Use --ttft e --tpot juntos para o MODO B (Sizing por SLO).\n"
-            "       Use --concurrency sozinho para o MODO A (Sizing por Concorrência)."
-        )
-
-    # MODO B: --ttft e --tpot devem vir JUNTOS
-    if has_ttft and not has_tpot:
-        parser.error(
-            "ERRO: --ttft requer --tpot. TTFT e TPOT são obrigatórios em conjunto no MODO B (Sizing por SLO).\n"
-            "       Exemplo: --ttft 2000 --tpot 8.0"
-        )
-
-    if has_tpot and not has_ttft:
-        parser.error(
-            "ERRO: --tpot requer --ttft. TTFT e TPOT são obrigatórios em conjunto no MODO B (Sizing por SLO).\n"
-            "       Exemplo: --ttft 2000 --tpot 8.0"
-        )
-
-    # Nenhum modo especificado
-    if not has_concurrency and not has_ttft:
-        parser.error(
-            "ERRO: Nenhum modo especificado. Escolha exatamente UM dos modos:\n"
-            "       MODO A — Sizing por Concorrência: --concurrency <N>\n"
-            "       MODO B — Sizing por SLO:          --ttft <ms> --tpot <tok/s>"
-        )
+    # Máscara de 3 bits (concurrency, ttft, tpot) → modo ou mensagem de erro
+    mask = (
+        ((args.concurrency is not None) << 2)
+        | ((args.ttft is not None) << 1)
+        | (args.tpot is not None)
+    )
+    sizing_mode, error = _MODE_TABLE[mask]
+    if error is not None:
+        parser.error(error)
 
     # ── Modo A: Concorrência-Driven ──────────────────────────────────────────
-    if has_concurrency:
-        sizing_mode = "concurrency_driven"
+    if sizing_mode == "concurrency_driven":
         effective_concurrency = args.concurrency
         concurrency_input = args.concurrency
         ttft_input_ms = None
@@ -259,7 +282,6 @@ def parse_cli_args() -> CLIConfig:
 
     # ── Modo B: SLO-Driven ───────────────────────────────────────────────────
     else:
-        sizing_mode = "slo_driven"
         # Usa concorrência padrão de parameters.json para cálculos de VRAM/storage
         effective_concurrency = _load_default_concurrency_slo_mode()
         concurrency_input = None
@@ -267,33 +289,27 @@ def parse_cli_args() -> CLIConfig:
         tpot_input_ms = args.tpot
         ttft_p99 = args.ttft_p99
 
-    return CLIConfig(
-        model_name=args.model,
-        server_name=args.server,
-        storage_name=args.storage,
+    return _config_from_args(
+        args,
         concurrency=effective_concurrency,
         concurrency_input=concurrency_input,
-        effective_context=args.effective_context,
-        kv_precision=args.kv_precision,
-        kv_budget_ratio=args.kv_budget_ratio,
-        runtime_overhead_gib=args.runtime_overhead_gib,
-        peak_headroom_ratio=args.peak_headroom_ratio,
-        weights_precision=args.weights_precision,
-        weights_memory_gib=args.weights_memory_gib,
-        replicas_per_node=args.replicas_per_node,
-        tensor_parallel=args.tensor_parallel,
-        pipeline_parallel=args.pipeline_parallel,
-        model_artifact_size_gib=args.model_artifact_size_gib,
-        warmup_concurrency=args.warmup_concurrency,
-        warmup_read_pattern=args.warmup_read_pattern,
-        warmup_utilization_ratio=args.warmup_utilization_ratio,
-        capacity_margin=args.capacity_margin,
-        target_load_time=args.target_load_time,
         ttft_input_ms=ttft_input_ms,
         tpot_input_ms=tpot_input_ms,
         ttft_p99=ttft_p99,
-        sizing_mode=sizing_mode,
-        executive_report=args.executive_report,
-        verbose=args.verbose,
-        validate_only=args.validate_only if args.validate_only else False
+        sizing_mode=sizing_mode
     )
+
+
+def _config_from_args(args: argparse.Namespace, **mode_fields) -> CLIConfig:
+    """
+    Monta CLIConfig a partir dos argumentos parseados.
+    
+    Os dests do argparse coincidem com os campos de CLIConfig e são repassados
+    diretamente; os argumentos que dependem do modo (concorrência e SLO) são
+    descartados e substituídos por mode_fields.
+    """
+    fields = vars(args).copy()
+    for name in _MODE_ARGS:
+        del fields[name]
+    fields.update(mode_fields)
+    return CLIConfig(**fields)
@@ -2,9 +2,12 @@
 Carregador de configurações JSON (models, servers, storage) com validação de schema.
 """
 
+import functools
 import json
+import os
+import sys
 from pathlib import Path
-from typing import Dict, List, Any, Tuple
+from typing import Callable, Dict, List, Any, NamedTuple, Optional, Set, Tuple
 
 from .models import ModelSpec
 from .servers import (
@@ -13,19 +16,200 @@ from .servers import (
     PowerSupplySpec, MaxCurrentSpec, DimensionsSpec
 )
 from .storage import StorageProfile
-from .validator import validate_models, validate_servers, validate_storage_profiles
+from .schemas import MODEL_SCHEMA, SERVER_SCHEMA, STORAGE_SCHEMA
+from .validator import (
+    validate_models, validate_object, validate_servers, validate_storage_profiles
+)
+
+try:
+    import orjson
+except ImportError:  # orjson é opcional: sem ele usa json da stdlib
+    orjson = None
+
+# SIZING_SKIP_VALIDATION=1 desliga a validação de schema por padrão (JSONs já validados no CI)
+_SKIP_VALIDATION_ENV = "SIZING_SKIP_VALIDATION"
+
+# Schema de cada seção para a checagem de um único registro: (schema, tipo, arquivo)
+_RECORD_SCHEMAS = {
+    "models": (MODEL_SCHEMA, "model", "models.json"),
+    "servers": (SERVER_SCHEMA, "server", "servers.json"),
+    "storage": (STORAGE_SCHEMA, "storage", "storage.json"),
+}
+
+
+def _load_json(path: Path) -> Any:
+    """Lê e parseia um JSON de specs (orjson se disponível, direto dos bytes)."""
+    raw = path.read_bytes()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def _intern(value: Any) -> Any:
+    """sys.intern para campos categóricos ("fp8", "nvme", "full"...); None passa direto."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+@functools.lru_cache(maxsize=32)
+def _read_records(
+    path_str: str,
+    mtime_ns: int,
+    section_key: str,
+    validator: Optional[Callable[[List[Dict[str, Any]]], Tuple[List[str], List[str]]]] = None,
+    prepare: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Registros brutos de uma seção do JSON (ex.: "models"), memoizados.
+    
+    mtime_ns faz parte da chave: editar o arquivo invalida a entrada; num hit
+    não há leitura, parse nem validação de schema. validator (validate_*) e
+    prepare (ajuste in-place) rodam uma vez por leitura. A lista retornada é
+    compartilhada entre loaders e não deve ser modificada.
+    """
+    path = Path(path_str)
+    records = _load_json(path).get(section_key, [])
+    if validator is not None:
+        errors, warnings = validator(records)
+        if errors:
+            error_msg = "\n".join(errors)
+            raise ValueError(f"❌ Erros de validação em {path.name}:\n{error_msg}")
+    if prepare is not None:
+        prepare(records)
+    return records
+
+
+class _Section(NamedTuple):
+    """Sub-objeto de servers.json mapeado para uma spec dataclass."""
+    key: str                            # chave no JSON = argumento de ServerSpec/spec pai
+    cls: type
+    fields: Tuple[str, ...]             # opcionais (.get → None se ausentes)
+    required: Tuple[str, ...] = ()      # obrigatórios (KeyError se ausentes)
+    nested: Tuple["_Section", ...] = ()
+    kwarg_prefix: str = ""              # ex.: "208v_3phase_amps" → _208v_3phase_amps
+    interned: Tuple[str, ...] = ()      # opcionais categóricos (sys.intern)
+
+
+# Seções do servidor (CPU, memória, energia, ...); ausentes ou vazias → None.
+# gpu e power são obrigatórios no schema (validados em validate_servers).
+_SERVER_SECTIONS = (
+    _Section("cpu", CPUSpec, (
+        "model", "cores_total", "threads_total",
+        "base_frequency_ghz", "max_boost_frequency_ghz",
+    )),
+    _Section("system_memory", SystemMemorySpec, ("capacity_total_tb", "type", "speed_mhz")),
+    _Section("gpu", GPUSpec,
+             ("total_hbm_gb", "nvlink_bandwidth_tbps_total", "nvlink_generation"),
+             required=("count", "model", "hbm_per_gpu_gb")),
+    _Section("power", PowerSpec, ("input_voltage",), required=("power_kw_max",), nested=(
+        _Section("power_supplies", PowerSupplySpec, ("count", "rating_each_watts", "redundancy")),
+        _Section("max_current", MaxCurrentSpec, ("208v_3phase_amps", "480v_3phase_amps"),
+                 kwarg_prefix="_"),
+    )),
+    _Section("thermal", ThermalSpec, (
+        "heat_output_btu_hr_max",
+        "ambient_temp_operating_c_min", "ambient_temp_operating_c_max",
+    )),
+    _Section("cooling", CoolingSpec, ("airflow_cfm",), interned=("cooling_type",)),
+    _Section("storage", StorageSpec, ("boot_drives", "internal_nvme_slots", "max_internal_storage_tb")),
+    _Section("networking", NetworkingSpec, ("infiniband", "management")),
+    _Section("software", SoftwareSpec, ("os_supported", "nvidia_ai_enterprise", "cuda_version")),
+    _Section("physical", PhysicalSpec, ("weight_kg_max",), nested=(
+        _Section("dimensions_mm", DimensionsSpec, ("width", "depth", "height")),
+    )),
+)
+
+
+def _parse_section(data: Dict[str, Any], section: _Section) -> Any:
+    """Constrói a spec de uma seção (e subseções) ou None se ausente/vazia."""
+    sub = data.get(section.key)
+    if not sub:
+        return None
+    prefix = section.kwarg_prefix
+    kwargs = {prefix + f: sub[f] for f in section.required}
+    for f in section.fields:
+        kwargs[prefix + f] = sub.get(f)
+    for f in section.interned:
+        kwargs[prefix + f] = _intern(sub.get(f))
+    for nested in section.nested:
+        kwargs[nested.key] = _parse_section(sub, nested)
+    return section.cls(**kwargs)
+
+
+def _find_raw(records: List[Dict[str, Any]], key: str) -> Optional[Dict[str, Any]]:
+    """Último registro cujo nome (casefold) é key — mesma precedência do dict em load_*."""
+    for record in reversed(records):
+        if record["name"].casefold() == key:
+            return record
+    return None
+
+
+# Defaults dos campos opcionais de models.json (ausente → valor abaixo)
+_MODEL_DEFAULTS: Dict[str, Any] = {
+    "hybrid_full_layers": None,
+    "hybrid_sliding_layers": None,
+    "sliding_window": None,
+    "default_kv_precision": "fp8",
+    "total_params_b": None,
+    "active_params_b": None,
+    "weights_memory_gib_fp16": None,
+    "weights_memory_gib_bf16": None,
+    "weights_memory_gib_fp8": None,
+    "weights_memory_gib_int8": None,
+    "weights_memory_gib_int4": None,
+    "default_weights_precision": "fp8",
+    "performance": None,
+    "notes": "",
+}
+
+# Defaults dos campos opcionais de storage.json (ausente → valor abaixo)
+_STORAGE_DEFAULTS: Dict[str, Any] = {
+    "capacity_total_tb": 0.0,
+    "usable_capacity_tb": 0.0,
+    "iops_read_max": 0,
+    "iops_write_max": 0,
+    "throughput_read_mbps": 0.0,
+    "throughput_write_mbps": 0.0,
+    "block_size_kb_read": 0.0,
+    "block_size_kb_write": 0.0,
+    "latency_read_ms_p50": 0.0,
+    "latency_read_ms_p99": 0.0,
+    "latency_write_ms_p50": 0.0,
+    "latency_write_ms_p99": 0.0,
+    "rack_units_u": 0,
+    "power_kw": 0.0,
+    "notes": "",
+}
+
+# Formato antigo de storage.json: throughput em Gbps (1 Gbps = 125 MB/s)
+_GBPS_TO_MBPS = 125.0
+_LEGACY_THROUGHPUT_KEYS = (
+    ("throughput_read_mbps", "throughput_read_gbps"),
+    ("throughput_write_mbps", "throughput_write_gbps"),
+)
+
+
+def _upgrade_legacy_throughput(profiles: List[Dict[str, Any]]) -> None:
+    """
+    Retrocompatibilidade: converte throughput em Gbps (formato antigo) para MB/s,
+    in-place e uma única vez no load, quando o perfil não traz o valor em MB/s.
+    """
+    for p in profiles:
+        for mbps_key, gbps_key in _LEGACY_THROUGHPUT_KEYS:
+            if p.get(mbps_key, 0.0) == 0.0 and gbps_key in p:
+                p[mbps_key] = p[gbps_key] * _GBPS_TO_MBPS
 
 
 class ConfigLoader:
     """Carrega e gerencia especificações de models, servers e storage com validação."""
     
-    def __init__(self, base_path: str = ".", validate: bool = True):
+    def __init__(self, base_path: str = ".", validate: Optional[bool] = None):
         """
         Args:
             base_path: Caminho base para os arquivos JSON
-            validate: Se True, valida schemas ao carregar
+            validate: Se True, valida schemas ao carregar. None (padrão) valida,
+                exceto com SIZING_SKIP_VALIDATION=1 no ambiente
         """
         self.base_path = Path(base_path)
+        if validate is None:
+            validate = os.environ.get(_SKIP_VALIDATION_ENV) != "1"
         self.validate = validate
         
         # Cache
@@ -33,345 +217,274 @@ class ConfigLoader:
         self._servers: Dict[str, ServerSpec] = {}
         self._storage: Dict[str, StorageProfile] = {}
         
+        # Chaves cujas specs já passaram por validate() (adiado até o primeiro get_*)
+        self._models_validated: Set[str] = set()
+        self._servers_validated: Set[str] = set()
+        self._storage_validated: Set[str] = set()
+        
         # Dados brutos para validação
         self._models_data: List[Dict[str, Any]] = []
         self._servers_data: List[Dict[str, Any]] = []
         self._storage_data: List[Dict[str, Any]] = []
+        
+        # "Disponíveis: ..." das mensagens de erro, por seção (montado uma vez por leitura)
+        self._available: Dict[str, str] = {}
     
-    def load_models(self, filepath: str = "models.json") -> Dict[str, ModelSpec]:
-        """Carrega especificações de modelos do JSON."""
+    def _read_section(
+        self,
+        filepath: str,
+        section_key: str,
+        validator: Callable[[List[Dict[str, Any]]], Tuple[List[str], List[str]]],
+        label: str,
+        prepare: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Registros brutos de uma seção, com schema validado se ativo (ver _read_records)."""
         path = self.base_path / filepath
         
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            return _read_records(
+                os.path.abspath(path), os.stat(path).st_mtime_ns, section_key,
+                validator if self.validate else None, prepare
+            )
         except FileNotFoundError:
             raise FileNotFoundError(
-                f"❌ Arquivo de modelos não encontrado: {path}\n"
-                "Certifique-se de que models.json existe no diretório."
+                f"❌ Arquivo de {label} não encontrado: {path}\n"
+                f"Certifique-se de que {filepath} existe no diretório."
             )
         except json.JSONDecodeError as e:
             raise ValueError(f"❌ Erro ao parsear {path}: {e}")
+    
+    def _check_record(self, kind: str, record: Dict[str, Any]) -> None:
+        """
+        Schema de um único registro, quando a validação do arquivo está desligada.
         
-        # Armazenar dados brutos
-        self._models_data = data.get("models", [])
-        
-        # Validar schema se solicitado
+        Campo obrigatório ausente (ou com tipo inválido) gera a mesma mensagem da
+        validação completa, em vez de um KeyError cru na construção da spec.
+        """
         if self.validate:
-            errors, warnings = validate_models(self._models_data)
-            if errors:
-                error_msg = "\n".join(errors)
-                raise ValueError(f"❌ Erros de validação em models.json:\n{error_msg}")
-        
-        # Parsear modelos
-        models = {}
-        for m in self._models_data:
-            model = ModelSpec(
-                name=m["name"],
-                num_layers=m["num_layers"],
-                num_key_value_heads=m["num_key_value_heads"],
-                head_dim=m["head_dim"],
-                max_position_embeddings=m["max_position_embeddings"],
-                attention_pattern=m["attention_pattern"],
-                hybrid_full_layers=m.get("hybrid_full_layers"),
-                hybrid_sliding_layers=m.get("hybrid_sliding_layers"),
-                sliding_window=m.get("sliding_window"),
-                default_kv_precision=m.get("default_kv_precision", "fp8"),
-                total_params_b=m.get("total_params_b"),
-                active_params_b=m.get("active_params_b"),
-                weights_memory_gib_fp16=m.get("weights_memory_gib_fp16"),
-                weights_memory_gib_bf16=m.get("weights_memory_gib_bf16"),
-                weights_memory_gib_fp8=m.get("weights_memory_gib_fp8"),
-                weights_memory_gib_int8=m.get("weights_memory_gib_int8"),
-                weights_memory_gib_int4=m.get("weights_memory_gib_int4"),
-                default_weights_precision=m.get("default_weights_precision", "fp8"),
-                performance=m.get("performance", {}),
-                notes=m.get("notes", "")
-            )
-            model.validate()
-            models[model.name.lower()] = model
+            return  # arquivo inteiro já validado em _read_section
+        schema, obj_type, filename = _RECORD_SCHEMAS[kind]
+        errors = validate_object(record, schema, obj_type, record.get("name", "unknown"))
+        if errors:
+            error_msg = "\n".join(errors)
+            raise ValueError(f"❌ Erros de validação em {filename}:\n{error_msg}")
+    
+    def _build_all(
+        self,
+        kind: str,
+        records: List[Dict[str, Any]],
+        build: Callable[[Dict[str, Any]], Any]
+    ) -> Tuple[Dict[str, Any], Set[str]]:
+        """
+        Constrói todas as specs (chave = nome casefold).
         
-        self._models = models
-        return models
+        Com validação ativa as constraints (validate()) são checadas já aqui;
+        caso contrário ficam para o primeiro get_*. Retorna (specs, chaves validadas).
+        """
+        specs = {}
+        validated = set()
+        for record in records:
+            self._check_record(kind, record)
+            spec = build(record)
+            key = spec.name.casefold()
+            if self.validate:
+                spec.validate()
+                validated.add(key)
+            specs[key] = spec
+        return specs, validated
+    
+    def load_models(self, filepath: str = "models.json") -> Dict[str, ModelSpec]:
+        """Carrega especificações de modelos do JSON."""
+        self._read_models_raw(filepath)
+        self._models, self._models_validated = self._build_all("models", self._models_data, self._build_model)
+        return self._models
     
     def load_servers(self, filepath: str = "servers.json") -> Dict[str, ServerSpec]:
         """Carrega especificações de servidores do JSON."""
-        path = self.base_path / filepath
-        
-        try:
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-        except FileNotFoundError:
-            raise FileNotFoundError(
-                f"❌ Arquivo de servidores não encontrado: {path}\n"
-                "Certifique-se de que servers.json existe no diretório."
-            )
-        except json.JSONDecodeError as e:
-            raise ValueError(f"❌ Erro ao parsear {path}: {e}")
-        
-        # Armazenar dados brutos
-        self._servers_data = data.get("servers", [])
-        
-        # Validar schema se solicitado
-        if self.validate:
-            errors, warnings = validate_servers(self._servers_data)
-            if errors:
-                error_msg = "\n".join(errors)
-                raise ValueError(f"❌ Erros de validação em servers.json:\n{error_msg}")
-        
-        # Parsear servidores (estrutura nested)
-        servers = {}
-        for s in self._servers_data:
-            server = self._parse_server(s)
-            server.validate()
-            servers[server.name.lower()] = server
-        
-        self._servers = servers
-        return servers
+        self._read_servers_raw(filepath)
+        self._servers, self._servers_validated = self._build_all("servers", self._servers_data, self._parse_server)
+        return self._servers
+    
+    def load_storage(self, filepath: str = "storage.json") -> Dict[str, StorageProfile]:
+        """Carrega perfis de storage do JSON."""
+        self._read_storage_raw(filepath)
+        self._storage, self._storage_validated = self._build_all("storage", self._storage_data, self._build_storage)
+        return self._storage
+    
+    def _read_models_raw(self, filepath: str = "models.json") -> None:
+        """Lê models.json para _models_data (sem construir specs)."""
+        self._available.pop("models", None)
+        self._models_data = self._read_section(filepath, "models", validate_models, "modelos")
+    
+    def _read_servers_raw(self, filepath: str = "servers.json") -> None:
+        """Lê servers.json para _servers_data (sem construir specs)."""
+        self._available.pop("servers", None)
+        self._servers_data = self._read_section(filepath, "servers", validate_servers, "servidores")
+    
+    def _read_storage_raw(self, filepath: str = "storage.json") -> None:
+        """Lê storage.json para _storage_data (sem construir perfis)."""
+        self._available.pop("storage", None)
+        self._storage_data = self._read_section(
+            filepath, "profiles", validate_storage_profiles, "storage",
+            prepare=_upgrade_legacy_throughput
+        )
+    
+    @staticmethod
+    def _build_model(m: Dict[str, Any]) -> ModelSpec:
+        """Constrói um ModelSpec a partir do registro bruto (sem validate())."""
+        m = {**_MODEL_DEFAULTS, **m}  # opcionais ausentes recebem o default num único merge
+        model = ModelSpec(
+            name=m["name"],
+            num_layers=m["num_layers"],
+            num_key_value_heads=m["num_key_value_heads"],
+            head_dim=m["head_dim"],
+            max_position_embeddings=m["max_position_embeddings"],
+            attention_pattern=_intern(m["attention_pattern"]),
+            hybrid_full_layers=m["hybrid_full_layers"],
+            hybrid_sliding_layers=m["hybrid_sliding_layers"],
+            sliding_window=m["sliding_window"],
+            default_kv_precision=_intern(m["default_kv_precision"]),
+            total_params_b=m["total_params_b"],
+            active_params_b=m["active_params_b"],
+            weights_memory_gib_fp16=m["weights_memory_gib_fp16"],
+            weights_memory_gib_bf16=m["weights_memory_gib_bf16"],
+            weights_memory_gib_fp8=m["weights_memory_gib_fp8"],
+            weights_memory_gib_int8=m["weights_memory_gib_int8"],
+            weights_memory_gib_int4=m["weights_memory_gib_int4"],
+            default_weights_precision=_intern(m["default_weights_precision"]),
+            performance=m["performance"] or {},
+            notes=m["notes"]
+        )
+        return model
     
     def _parse_server(self, s: Dict[str, Any]) -> ServerSpec:
-        """Parse servidor com estrutura hierárquica."""
-        
-        # Parse CPU (opcional)
-        cpu = None
-        if "cpu" in s and s["cpu"]:
-            cpu = CPUSpec(
-                model=s["cpu"].get("model"),
-                cores_total=s["cpu"].get("cores_total"),
-                threads_total=s["cpu"].get("threads_total"),
-                base_frequency_ghz=s["cpu"].get("base_frequency_ghz"),
-                max_boost_frequency_ghz=s["cpu"].get("max_boost_frequency_ghz")
-            )
-        
-        # Parse System Memory (opcional)
-        system_memory = None
-        if "system_memory" in s and s["system_memory"]:
-            system_memory = SystemMemorySpec(
-                capacity_total_tb=s["system_memory"].get("capacity_total_tb"),
-                type=s["system_memory"].get("type"),
-                speed_mhz=s["system_memory"].get("speed_mhz")
-            )
-        
-        # Parse GPU (obrigatório)
-        gpu = None
-        if "gpu" in s and s["gpu"]:
-            gpu = GPUSpec(
-                count=s["gpu"]["count"],
-                model=s["gpu"]["model"],
-                hbm_per_gpu_gb=s["gpu"]["hbm_per_gpu_gb"],
-                total_hbm_gb=s["gpu"].get("total_hbm_gb"),
-                nvlink_bandwidth_tbps_total=s["gpu"].get("nvlink_bandwidth_tbps_total"),
-                nvlink_generation=s["gpu"].get("nvlink_generation")
-            )
-        
-        # Parse Power (obrigatório)
-        power = None
-        if "power" in s and s["power"]:
-            power_supplies = None
-            if "power_supplies" in s["power"] and s["power"]["power_supplies"]:
-                power_supplies = PowerSupplySpec(
-                    count=s["power"]["power_supplies"].get("count"),
-                    rating_each_watts=s["power"]["power_supplies"].get("rating_each_watts"),
-                    redundancy=s["power"]["power_supplies"].get("redundancy")
-                )
-            
-            max_current = None
-            if "max_current" in s["power"] and s["power"]["max_current"]:
-                max_current = MaxCurrentSpec(
-                    _208v_3phase_amps=s["power"]["max_current"].get("208v_3phase_amps"),
-                    _480v_3phase_amps=s["power"]["max_current"].get("480v_3phase_amps")
-                )
-            
-            power = PowerSpec(
-                power_kw_max=s["power"]["power_kw_max"],
-                power_supplies=power_supplies,
-                input_voltage=s["power"].get("input_voltage"),
-                max_current=max_current
-            )
-        
-        # Parse Thermal (opcional)
-        thermal = None
-        if "thermal" in s and s["thermal"]:
-            thermal = ThermalSpec(
-                heat_output_btu_hr_max=s["thermal"].get("heat_output_btu_hr_max"),
-                ambient_temp_operating_c_min=s["thermal"].get("ambient_temp_operating_c_min"),
-                ambient_temp_operating_c_max=s["thermal"].get("ambient_temp_operating_c_max")
-            )
-        
-        # Parse Cooling (opcional)
-        cooling = None
-        if "cooling" in s and s["cooling"]:
-            cooling = CoolingSpec(
-                airflow_cfm=s["cooling"].get("airflow_cfm"),
-                cooling_type=s["cooling"].get("cooling_type")
-            )
-        
-        # Parse Storage (opcional)
-        storage_spec = None
-        if "storage" in s and s["storage"]:
-            storage_spec = StorageSpec(
-                boot_drives=s["storage"].get("boot_drives"),
-                internal_nvme_slots=s["storage"].get("internal_nvme_slots"),
-                max_internal_storage_tb=s["storage"].get("max_internal_storage_tb")
-            )
-        
-        # Parse Networking (opcional)
-        networking = None
-        if "networking" in s and s["networking"]:
-            networking = NetworkingSpec(
-                infiniband=s["networking"].get("infiniband"),
-                management=s["networking"].get("management")
-            )
-        
-        # Parse Software (opcional)
-        software = None
-        if "software" in s and s["software"]:
-            software = SoftwareSpec(
-                os_supported=s["software"].get("os_supported"),
-                nvidia_ai_enterprise=s["software"].get("nvidia_ai_enterprise"),
-                cuda_version=s["software"].get("cuda_version")
-            )
-        
-        # Parse Physical (opcional)
-        physical = None
-        if "physical" in s and s["physical"]:
-            dimensions = None
-            if "dimensions_mm" in s["physical"] and s["physical"]["dimensions_mm"]:
-                dimensions = DimensionsSpec(
-                    width=s["physical"]["dimensions_mm"].get("width"),
-                    depth=s["physical"]["dimensions_mm"].get("depth"),
-                    height=s["physical"]["dimensions_mm"].get("height")
-                )
-            
-            physical = PhysicalSpec(
-                dimensions_mm=dimensions,
-                weight_kg_max=s["physical"].get("weight_kg_max")
-            )
+        """Parse servidor com estrutura hierárquica (seções via _SERVER_SECTIONS)."""
+        sections = {
+            section.key: _parse_section(s, section) for section in _SERVER_SECTIONS
+        }
         
         # Criar ServerSpec
         return ServerSpec(
             name=s["name"],
-            manufacturer=s.get("manufacturer"),
-            form_factor=s.get("form_factor"),
+            manufacturer=_intern(s.get("manufacturer")),
+            form_factor=_intern(s.get("form_factor")),
             rack_units_u=s.get("rack_units_u", 10),
-            cpu=cpu,
-            system_memory=system_memory,
-            gpu=gpu,
-            power=power,
-            thermal=thermal,
-            cooling=cooling,
-            storage=storage_spec,
-            networking=networking,
-            software=software,
-            physical=physical,
+            **sections,
             notes=s.get("notes", ""),
             source=s.get("source")
         )
     
-    def load_storage(self, filepath: str = "storage.json") -> Dict[str, StorageProfile]:
-        """Carrega perfis de storage do JSON."""
-        path = self.base_path / filepath
-        
-        try:
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-        except FileNotFoundError:
-            raise FileNotFoundError(
-                f"❌ Arquivo de storage não encontrado: {path}\n"
-                "Certifique-se de que storage.json existe no diretório."
-            )
-        except json.JSONDecodeError as e:
-            raise ValueError(f"❌ Erro ao parsear {path}: {e}")
-        
-        # Armazenar dados brutos
-        self._storage_data = data.get("profiles", [])
-        
-        # Validar schema se solicitado
-        if self.validate:
-            errors, warnings = validate_storage_profiles(self._storage_data)
-            if errors:
-                error_msg = "\n".join(errors)
-                raise ValueError(f"❌ Erros de validação em storage.json:\n{error_msg}")
-        
-        # Parsear perfis de storage
-        profiles = {}
-        for p in self._storage_data:
-            # Retrocompatibilidade: converter Gbps para MB/s se necessário
-            throughput_read_mbps = p.get("throughput_read_mbps", 0.0)
-            throughput_write_mbps = p.get("throughput_write_mbps", 0.0)
-            
-            # Se não tem MB/s mas tem Gbps (formato antigo), converter
-            if throughput_read_mbps == 0.0 and "throughput_read_gbps" in p:
-                throughput_read_mbps = p["throughput_read_gbps"] * 125.0  # Gbps → MB/s
-            if throughput_write_mbps == 0.0 and "throughput_write_gbps" in p:
-                throughput_write_mbps = p["throughput_write_gbps"] * 125.0
-            
-            profile = StorageProfile(
-                name=p["name"],
-                type=p["type"],
-                capacity_total_tb=p.get("capacity_total_tb", 0.0),
-                usable_capacity_tb=p.get("usable_capacity_tb", 0.0),
-                iops_read_max=p.get("iops_read_max", 0),
-                iops_write_max=p.get("iops_write_max", 0),
-                throughput_read_mbps=throughput_read_mbps,
-                throughput_write_mbps=throughput_write_mbps,
-                block_size_kb_read=p.get("block_size_kb_read", 0.0),
-                block_size_kb_write=p.get("block_size_kb_write", 0.0),
-                latency_read_ms_p50=p.get("latency_read_ms_p50", 0.0),
-                latency_read_ms_p99=p.get("latency_read_ms_p99", 0.0),
-                latency_write_ms_p50=p.get("latency_write_ms_p50", 0.0),
-                latency_write_ms_p99=p.get("latency_write_ms_p99", 0.0),
-                rack_units_u=p.get("rack_units_u", 0),
-                power_kw=p.get("power_kw", 0.0),
-                notes=p.get("notes", "")
-            )
-            profile.validate()
-            profiles[profile.name.lower()] = profile
-        
-        self._storage = profiles
-        return profiles
+    @staticmethod
+    def _build_storage(p: Dict[str, Any]) -> StorageProfile:
+        """Constrói um StorageProfile a partir do registro bruto (sem validate())."""
+        p = {**_STORAGE_DEFAULTS, **p}  # opcionais ausentes recebem o default num único merge
+        profile = StorageProfile(
+            name=p["name"],
+            type=_intern(p["type"]),
+            capacity_total_tb=p["capacity_total_tb"],
+            usable_capacity_tb=p["usable_capacity_tb"],
+            iops_read_max=p["iops_read_max"],
+            iops_write_max=p["iops_write_max"],
+            throughput_read_mbps=p["throughput_read_mbps"],
+            throughput_write_mbps=p["throughput_write_mbps"],
+            block_size_kb_read=p["block_size_kb_read"],
+            block_size_kb_write=p["block_size_kb_write"],
+            latency_read_ms_p50=p["latency_read_ms_p50"],
+            latency_read_ms_p99=p["latency_read_ms_p99"],
+            latency_write_ms_p50=p["latency_write_ms_p50"],
+            latency_write_ms_p99=p["latency_write_ms_p99"],
+            rack_units_u=p["rack_units_u"],
+            power_kw=p["power_kw"],
+            notes=p["notes"]
+        )
+        return profile
     
     def get_model(self, name: str) -> ModelSpec:
-        """Busca modelo por nome (case-insensitive)."""
-        if not self._models:
-            self.load_models()
+        """Busca modelo por nome (case-insensitive), construindo só o solicitado."""
+        # Chaves normalizadas com casefold: um único acesso ao dict
+        key = name.casefold()
+        model = self._models.get(key)
+        if model is None:
+            raw = self._find_model_raw(key)
+            if raw is None:
+                available = self._available_names("models", self._models_data)
+                raise ValueError(
+                    f"❌ Modelo '{name}' não encontrado em models.json.\n"
+                    f"Modelos disponíveis: {available}"
+                )
+            self._check_record("models", raw)
+            model = self._models[key] = self._build_model(raw)
         
-        name_normalized = name.lower()
-        if name_normalized not in self._models:
-            available = ", ".join(self._models.keys())
-            raise ValueError(
-                f"❌ Modelo '{name}' não encontrado em models.json.\n"
-                f"Modelos disponíveis: {available}"
-            )
-        return self._models[name_normalized]
+        # validate() uma vez por spec, no primeiro uso
+        if key not in self._models_validated:
+            model.validate()
+            self._models_validated.add(key)
+        return model
     
     def get_server(self, name: str) -> ServerSpec:
-        """Busca servidor por nome (case-insensitive)."""
-        if not self._servers:
-            self.load_servers()
+        """Busca servidor por nome (case-insensitive), construindo só o solicitado."""
+        key = name.casefold()
+        server = self._servers.get(key)
+        if server is None:
+            raw = self._find_server_raw(key)
+            if raw is None:
+                available = self._available_names("servers", self._servers_data)
+                raise ValueError(
+                    f"❌ Servidor '{name}' não encontrado em servers.json.\n"
+                    f"Servidores disponíveis: {available}"
+                )
+            self._check_record("servers", raw)
+            server = self._servers[key] = self._parse_server(raw)
         
-        name_normalized = name.lower()
-        if name_normalized not in self._servers:
-            available = ", ".join(self._servers.keys())
-            raise ValueError(
-                f"❌ Servidor '{name}' não encontrado em servers.json.\n"
-                f"Servidores disponíveis: {available}"
-            )
-        return self._servers[name_normalized]
+        if key not in self._servers_validated:
+            server.validate()
+            self._servers_validated.add(key)
+        return server
     
     def get_storage(self, name: str) -> StorageProfile:
-        """Busca perfil de storage por nome (case-insensitive)."""
-        if not self._storage:
-            self.load_storage()
+        """Busca perfil de storage por nome (case-insensitive), construindo só o solicitado."""
+        key = name.casefold()
+        profile = self._storage.get(key)
+        if profile is None:
+            raw = self._find_storage_raw(key)
+            if raw is None:
+                available = self._available_names("storage", self._storage_data)
+                raise ValueError(
+                    f"❌ Perfil de storage '{name}' não encontrado em storage.json.\n"
+                    f"Perfis disponíveis: {available}"
+                )
+            self._check_record("storage", raw)
+            profile = self._storage[key] = self._build_storage(raw)
         
-        name_normalized = name.lower()
-        if name_normalized not in self._storage:
-            available = ", ".join(self._storage.keys())
-            raise ValueError(
-                f"❌ Perfil de storage '{name}' não encontrado em storage.json.\n"
-                f"Perfis disponíveis: {available}"
-            )
-        return self._storage[name_normalized]
+        if key not in self._storage_validated:
+            profile.validate()
+            self._storage_validated.add(key)
+        return profile
+    
+    def _available_names(self, kind: str, records: List[Dict[str, Any]]) -> str:
+        """Nomes disponíveis (casefold, ordem do arquivo) para mensagens de erro, memoizados."""
+        available = self._available.get(kind)
+        if available is None:
+            available = self._available[kind] = ", ".join(r["name"].casefold() for r in records)
+        return available
+    
+    def _find_model_raw(self, key: str) -> Optional[Dict[str, Any]]:
+        """Registro bruto do modelo (nome já casefold); lê models.json se preciso."""
+        if not self._models_data:
+            self._read_models_raw()
+        return _find_raw(self._models_data, key)
+    
+    def _find_server_raw(self, key: str) -> Optional[Dict[str, Any]]:
+        """Registro bruto do servidor (nome já casefold); lê servers.json se preciso."""
+        if not self._servers_data:
+            self._read_servers_raw()
+        return _find_raw(self._servers_data, key)
+    
+    def _find_storage_raw(self, key: str) -> Optional[Dict[str, Any]]:
+        """Registro bruto do perfil (nome já casefold); lê storage.json se preciso."""
+        if not self._storage_data:
+            self._read_storage_raw()
+        return _find_raw(self._storage_data, key)
     
     def get_raw_data(self) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]:
         """
@@ -5,8 +5,21 @@ Definições de modelos LLM e suas especificações arquiteturais.
 from dataclasses import dataclass, field
 from typing import Any, Dict, Optional
 
+# Tabelas de precisão (montadas uma vez, não a cada chamada)
+_KV_BYTES_PER_ELEM: Dict[str, int] = {"fp16": 2, "bf16": 2, "fp8": 1, "int8": 1}
+_WEIGHTS_BYTES_PER_PARAM: Dict[str, float] = {
+    "fp16": 2.0, "bf16": 2.0, "fp8": 1.0, "int8": 1.0, "int4": 0.5,
+}
+_WEIGHTS_MEMORY_FIELDS: Dict[str, str] = {
+    "fp16": "weights_memory_gib_fp16",
+    "bf16": "weights_memory_gib_bf16",
+    "fp8": "weights_memory_gib_fp8",
+    "int8": "weights_memory_gib_int8",
+    "int4": "weights_memory_gib_int4",
+}
 
-@dataclass
+
+@dataclass(slots=True)
 class ModelSpec:
     """Especificação arquitetural de um modelo LLM."""
     
@@ -79,34 +92,15 @@ class ModelSpec:
     
     def get_weights_memory(self, precision: str) -> Optional[float]:
         """Retorna memória dos pesos em GiB para a precisão especificada."""
-        field_map = {
-            "fp16": self.weights_memory_gib_fp16,
-            "bf16": self.weights_memory_gib_bf16,
-            "fp8": self.weights_memory_gib_fp8,
-            "int8": self.weights_memory_gib_int8,
-            "int4": self.weights_memory_gib_int4,
-        }
-        return field_map.get(precision)
+        field_name = _WEIGHTS_MEMORY_FIELDS.get(precision)
+        return getattr(self, field_name) if field_name is not None else None
     
     @staticmethod
     def kv_bytes_per_elem(precision: str) -> int:
         """Retorna bytes por elemento de KV cache para a precisão especificada."""
-        precision_map = {
-            "fp16": 2,
-            "bf16": 2,
-            "fp8": 1,
-            "int8": 1,
-        }
-        return precision_map.get(precision, 1)
+        return _KV_BYTES_PER_ELEM.get(precision, 1)
     
     @staticmethod
     def weights_bytes_per_param(precision: str) -> float:
         """Retorna bytes por parâmetro para a precisão especificada."""
-        precision_map = {
-            "fp16": 2.0,
-            "bf16": 2.0,
-            "fp8": 1.0,
-            "int8": 1.0,
-            "int4": 0.5,
-        }
-        return precision_map.get(precision, 1.0)
+        return _WEIGHTS_BYTES_PER_PARAM.get(precision, 1.0)
@@ -5,12 +5,20 @@ Define e valida os requisitos de storage estrutural da plataforma de IA
 (Sistema Operacional, NVIDIA AI Enterprise, Runtime, etc.) por servidor.
 """
 
-from dataclasses import dataclass
-from typing import Dict, Any
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Any, List, Sequence
+import functools
 import json
+import os
 
+try:
+    import orjson
+except ImportError:  # orjson é opcional: sem ele usa json da stdlib
+    orjson = None
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class PlatformStorageProfile:
     """
     Profile de storage estrutural da plataforma por servidor.
@@ -35,6 +43,23 @@ class PlatformStorageProfile:
     notes: str = ""
     source: str = "platform_storage_profile.json"
     
+    # Derivados (pré-calculados em __post_init__; os volumes não mudam)
+    _total_per_server_gb: float = field(init=False, repr=False, compare=False)
+    _total_per_server_tb: float = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        # frozen=True: atributos derivados via object.__setattr__
+        total_gb = (
+            self.os_installation_gb +
+            self.nvidia_ai_enterprise_gb +
+            self.container_runtime_gb +
+            self.model_runtime_engines_gb +
+            self.platform_dependencies_gb +
+            self.config_and_metadata_gb
+        )
+        object.__setattr__(self, "_total_per_server_gb", total_gb)
+        object.__setattr__(self, "_total_per_server_tb", total_gb / 1024.0)
+    
     def validate(self) -> None:
         """Valida o profile de storage da plataforma."""
         fields = [
@@ -55,19 +80,12 @@ class PlatformStorageProfile:
     @property
     def total_per_server_gb(self) -> float:
         """Volume total da plataforma por servidor em GB."""
-        return (
-            self.os_installation_gb +
-            self.nvidia_ai_enterprise_gb +
-            self.container_runtime_gb +
-            self.model_runtime_engines_gb +
-            self.platform_dependencies_gb +
-            self.config_and_metadata_gb
-        )
+        return self._total_per_server_gb
     
     @property
     def total_per_server_tb(self) -> float:
         """Volume total da plataforma por servidor em TB."""
-        return self.total_per_server_gb / 1024.0
+        return self._total_per_server_tb
     
     def calc_total_platform_volume_tb(self, num_nodes: int) -> float:
         """
@@ -84,7 +102,26 @@ class PlatformStorageProfile:
                 f"❌ ERRO: Número de nós deve ser > 0: {num_nodes}"
             )
         
-        return self.total_per_server_tb * num_nodes
+        return self._total_per_server_tb * num_nodes
+    
+    def calc_total_platform_volume_tb_batch(self, node_counts: Sequence[int]) -> List[float]:
+        """
+        Versão em lote de calc_total_platform_volume_tb para varreduras de num_nodes.
+        
+        Args:
+            node_counts: Números de servidores DGX (cada um > 0)
+        
+        Returns:
+            Volumes totais em TB, na mesma ordem de node_counts
+        """
+        bad = [n for n in node_counts if n <= 0]
+        if bad:
+            raise ValueError(
+                f"❌ ERRO: Número de nós deve ser > 0: {bad[0]}"
+            )
+        
+        total_per_server_tb = self._total_per_server_tb
+        return [total_per_server_tb * n for n in node_counts]
     
     def get_breakdown(self) -> Dict[str, float]:
         """
@@ -100,7 +137,7 @@ class PlatformStorageProfile:
             "Engines de Inferência": self.model_runtime_engines_gb,
             "Dependências da Plataforma": self.platform_dependencies_gb,
             "Configuração e Metadados": self.config_and_metadata_gb,
-            "TOTAL por servidor": self.total_per_server_gb
+            "TOTAL por servidor": self._total_per_server_gb
         }
     
     def get_rationale(self, num_nodes: int) -> Dict[str, Any]:
@@ -114,6 +151,7 @@ class PlatformStorageProfile:
             Dict com fórmula, inputs, assumption e operational_meaning
         """
         total_tb = self.calc_total_platform_volume_tb(num_nodes)
+        total_per_server_tb = self._total_per_server_tb
         
         return {
             "formula": "platform_volume_total_tb = total_per_server_tb × num_nodes",
@@ -124,20 +162,44 @@ class PlatformStorageProfile:
                 "model_runtime_engines_gb": self.model_runtime_engines_gb,
                 "platform_dependencies_gb": self.platform_dependencies_gb,
                 "config_and_metadata_gb": self.config_and_metadata_gb,
-                "total_per_server_gb": round(self.total_per_server_gb, 2),
-                "total_per_server_tb": round(self.total_per_server_tb, 3),
+                "total_per_server_gb": round(self._total_per_server_gb, 2),
+                "total_per_server_tb": round(total_per_server_tb, 3),
                 "num_nodes": num_nodes,
                 "total_tb": round(total_tb, 3)
             },
             "assumption": f"Volume estrutural fixo por servidor DGX. Não inclui pesos de modelos ou dados dinâmicos. "
                          f"Considera instalação completa do SO, NVIDIA AI Enterprise, runtime e engines de inferência.",
-            "operational_meaning": f"Cada servidor DGX requer {self.total_per_server_tb:.2f} TB para a pilha completa de software. "
+            "operational_meaning": f"Cada servidor DGX requer {total_per_server_tb:.2f} TB para a pilha completa de software. "
                                   f"Total de {total_tb:.2f} TB para {num_nodes} nó(s). "
                                   f"Este volume é fixo e não varia com concorrência ou modelo. "
                                   f"Crítico para boot, runtime e operação da plataforma."
         }
 
 
+# Campos obrigatórios do profile (volumes em GB), na ordem das mensagens de erro
+_REQUIRED_FIELDS = (
+    "os_installation_gb",
+    "nvidia_ai_enterprise_gb",
+    "container_runtime_gb",
+    "model_runtime_engines_gb",
+    "platform_dependencies_gb",
+    "config_and_metadata_gb",
+)
+_REQUIRED_FIELD_SET = frozenset(_REQUIRED_FIELDS)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_profile_json(filepath: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Lê e parseia o profile da plataforma (memoizado).
+    
+    mtime_ns faz parte da chave: editar o arquivo invalida a entrada. O dict
+    retornado é compartilhado entre chamadas e não deve ser modificado.
+    """
+    raw = Path(filepath).read_bytes()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
 def load_platform_storage_profile(
     filepath: str = "platform_storage_profile.json"
 ) -> PlatformStorageProfile:
@@ -155,8 +217,7 @@ def load_platform_storage_profile(
         ValueError: Se o profile for inválido
     """
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = _load_profile_json(os.path.abspath(filepath), os.stat(filepath).st_mtime_ns)
     except FileNotFoundError:
         raise FileNotFoundError(
             f"❌ ERRO: Arquivo de profile de storage da plataforma não encontrado: {filepath}\n\n"
@@ -176,28 +237,16 @@ def load_platform_storage_profile(
         raise ValueError(f"❌ ERRO: Arquivo {filepath} não é um JSON válido: {e}")
     
     # Validar campos obrigatórios
-    required_fields = [
-        "os_installation_gb",
-        "nvidia_ai_enterprise_gb",
-        "container_runtime_gb",
-        "model_runtime_engines_gb",
-        "platform_dependencies_gb",
-        "config_and_metadata_gb"
-    ]
-    
-    for field in required_fields:
-        if field not in data:
-            raise ValueError(
-                f"❌ ERRO: Campo obrigatório '{field}' ausente em {filepath}"
-            )
+    missing = _REQUIRED_FIELD_SET.difference(data)
+    if missing:
+        # Todos os ausentes de uma vez, na ordem de _REQUIRED_FIELDS
+        names = ", ".join(f"'{f}'" for f in _REQUIRED_FIELDS if f in missing)
+        if len(missing) == 1:
+            raise ValueError(f"❌ ERRO: Campo obrigatório {names} ausente em {filepath}")
+        raise ValueError(f"❌ ERRO: Campos obrigatórios {names} ausentes em {filepath}")
     
     profile = PlatformStorageProfile(
-        os_installation_gb=data["os_installation_gb"],
-        nvidia_ai_enterprise_gb=data["nvidia_ai_enterprise_gb"],
-        container_runtime_gb=data["container_runtime_gb"],
-        model_runtime_engines_gb=data["model_runtime_engines_gb"],
-        platform_dependencies_gb=data["platform_dependencies_gb"],
-        config_and_metadata_gb=data["config_and_metadata_gb"],
+        **{f: data[f] for f in _REQUIRED_FIELDS},
         notes=data.get("notes", ""),
         source=filepath
     )
@@ -0,0 +1,56 @@
+"""
+Formatação de rationales para saída (JSON/relatórios).
+
+Os calculadores guardam os valores de "inputs" com precisão total; o
+arredondamento para exibição é feito aqui, uma única vez, na exportação.
+"""
+
+from typing import Any, Dict, Optional
+
+
+# Casas decimais por campo de "inputs" (demais floats usam a precisão padrão)
+_FIELD_PRECISION: Dict[str, int] = {
+    # storage_model
+    "weights_gib": 2,
+    # storage_cache
+    "cache_per_node_gib": 2,
+    # storage_logs
+    "requests_per_second": 2,
+    "logs_per_day_gib": 2,
+    # throughput
+    "storage_model_tb": 2,
+    "model_per_node_gib": 2,
+    # storage_total
+    "storage_model_base_tb": 3,
+    "storage_cache_base_tb": 3,
+    "storage_logs_base_tb": 3,
+    "storage_operational_base_tb": 3,
+    "platform_volume_total_tb": 3,
+    "storage_total_base_tb": 3,
+}
+
+
+def format_rationale(r: Optional[Dict[str, Any]], precision: int = 4) -> Optional[Dict[str, Any]]:
+    """
+    Retorna cópia do rationale com os floats arredondados para exibição.
+
+    Args:
+        r: Rationale (dicts aninhados); None é devolvido como None
+        precision: Casas decimais para floats sem precisão própria em _FIELD_PRECISION
+
+    Returns:
+        Novo dict; o original (possivelmente compartilhado via cache) não é alterado
+    """
+    if r is None:
+        return None
+    return _format_value(r, None, precision)
+
+
+def _format_value(value: Any, key: Optional[str], precision: int) -> Any:
+    if isinstance(value, float):
+        return round(value, _FIELD_PRECISION.get(key, precision))
+    if isinstance(value, dict):
+        return {k: _format_value(v, k, precision) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_format_value(v, key, precision) for v in value]
+    return value
@@ -2,12 +2,146 @@
 Geração de relatório executivo (resumo para terminal e relatório Markdown executivo).
 """
 
+import io
+from datetime import datetime
 from typing import Dict, Optional
 from .calc_scenarios import ScenarioResult
 from .models import ModelSpec
 from .servers import ServerSpec
 
 
+# ─── Trechos estáticos do relatório executivo (Markdown) ─────────────────────
+# Cada constante é um bloco de linhas completas (terminadas em "\n") escrito de
+# uma vez no buffer; os templates usam str.format com campos nomeados.
+
+_MD_SLO_INTRO = (
+    "## Parâmetros de Demanda e SLO\n"
+    "\n"
+    "**Concorrência** — Número de requisições/sessões simultâneas atendidas. "
+    "Determina a capacidade operacional e o custo da infraestrutura.\n"
+    "\n"
+    "**TTFT (Time To First Token)** — Tempo até o primeiro token ser entregue ao usuário "
+    "(inclui rede, fila e processamento do prompt). "
+    "Define a percepção de responsividade: TTFT alto faz o sistema parecer lento.\n"
+    "\n"
+    "**TPOT (Time Per Output Token)** — Velocidade de geração contínua de tokens (tokens/segundo). "
+    "Define a fluidez do streaming: TPOT baixo torna a leitura truncada e lenta.\n"
+    "\n"
+)
+
+_MD_SLO_TABLE_HEADER = (
+    "| Parâmetro | Entrada | Resultado (Cenário Recomendado) | Observação Operacional |\n"
+    "|-----------|---------|----------------------------------|------------------------|\n"
+)
+
+_MD_HEADER = (
+    "# Relatorio Executivo — Sizing de Infraestrutura para Inferencia\n"
+    "\n"
+    "**Modelo:** {model_name}  \n"
+    "**Servidor de Inferencia:** {server_name}  \n"
+    "**Data:** {date}  \n"
+    "**Modo de Sizing:** {modo_label}  \n"
+    "\n"
+    "---\n"
+    "\n"
+)
+
+_MD_SCENARIOS_OVERVIEW = (
+    "## Cenarios Avaliados\n"
+    "\n"
+    "| Cenario | Objetivo | Tolerancia a Falhas | Risco Operacional |\n"
+    "|---------|----------|---------------------|-------------------|\n"
+    "| **Minimo** | Atender no limite | Nenhuma | Alto |\n"
+    "| **Recomendado** | Producao estavel | Falha simples (N+1) | Medio |\n"
+    "| **Ideal** | Alta resiliencia | Falhas multiplas (N+2) | Baixo |\n"
+    "\n"
+    "Avaliar multiplos cenarios e essencial para equilibrar custo de investimento com risco operacional.\n"
+    "\n"
+    "---\n"
+    "\n"
+)
+
+_MD_MODEL_INFO = (
+    "## Informacoes do Modelo Avaliado\n"
+    "\n"
+    "| Item | Valor |\n"
+    "|------|-------|\n"
+    "| Modelo | {model_name} |\n"
+    "| Numero de camadas | {num_layers} |\n"
+    "| Contexto maximo | {max_context:,} tokens |\n"
+    "| Padrao de atencao | {attention_pattern} |\n"
+    "| Precisao KV cache | {kv_precision} |\n"
+    "\n"
+    "O modelo consome memoria viva (KV cache) proporcional ao contexto e concorrencia.\n"
+    "\n"
+    "---\n"
+    "\n"
+)
+
+_MD_UNIT_CONSUMPTION = (
+    "## Consumo Unitario do Modelo\n"
+    "\n"
+    "| Recurso | Consumo por Sessao | Significado Operacional |\n"
+    "|---------|-------------------|------------------------|\n"
+    "| KV cache | {kv_per_session_gib:.2f} GiB | Memoria ocupada enquanto sessao esta ativa |\n"
+    "| GPU HBM | {hbm_pct:.1f}% de um no | Fracao da capacidade GPU consumida |\n"
+    "\n"
+    "Cada sessao ativa reserva parte do servidor. A soma das reservas define o limite fisico do no.\n"
+    "\n"
+    "---\n"
+    "\n"
+)
+
+_MD_GOVERNANCE = (
+    "**Governanca:** Storage e recurso critico. Subdimensionamento impacta:\n"
+    "- Tempo de recuperacao (restart lento)\n"
+    "- Escalabilidade (gargalo em scale-out)\n"
+    "- Auditoria e conformidade (retencao inadequada de logs)\n"
+    "\n"
+    "---\n"
+    "\n"
+)
+
+_MD_GLOSSARY = (
+    "## Glossario Executivo de Termos\n"
+    "\n"
+    "| Metrica | O que significa | Por que importa | Impacto se subdimensionado |\n"
+    "| --- | --- | --- | --- |\n"
+    "| **Servidores de Inferencia** | Quantidade de servidores necessarios para atender a carga. | "
+    "Define investimento em hardware e influencia energia, rack e custo total. | "
+    "Subdimensionamento causa indisponibilidade. |\n"
+    "| **Sessoes por servidor** | Numero de conversas simultaneas que um servidor suporta. | "
+    "Indica o limite fisico antes de atingir saturacao de memoria. | "
+    "Operar no limite aumenta risco de instabilidade. |\n"
+    "| **KV por sessao** | Memoria de GPU consumida por cada conversa ativa. | "
+    "Principal fator que determina quantas sessoes cabem por servidor. | "
+    "Conversas mais longas aumentam consumo e reduzem capacidade. |\n"
+    "| **Energia (Compute + Storage)** | Consumo total de energia dos servidores e storage. | "
+    "Impacta custo operacional mensal e capacidade eletrica do datacenter. | "
+    "Subdimensionar pode causar sobrecarga eletrica. |\n"
+    "| **Rack (Compute + Storage)** | Espaco fisico no datacenter. | "
+    "Define viabilidade fisica de implantacao. | "
+    "Espaco insuficiente limita crescimento. |\n"
+    "| **Storage total** | Capacidade necessaria para modelo + cache + logs. | "
+    "Espaco minimo para operar o ambiente. | "
+    "Falta de espaco pode impedir inicializacao ou escala. |\n"
+    "| **TTFT** | Tempo ate o primeiro token (rede + fila + prefill). | "
+    "Latencia percebida pelo usuario — define se o sistema parece responsivo. | "
+    "TTFT alto faz o usuario perceber demora antes de qualquer resposta. |\n"
+    "| **TPOT** | Velocidade de geracao de tokens (tokens/segundo). | "
+    "Determina a fluidez do streaming. | "
+    "TPOT baixo torna o streaming lento e perceptivelmente truncado. |\n"
+    "| **Concorrencia maxima (SLOs)** | Sessoes simultaneas atendidas dentro dos SLOs de latencia. | "
+    "Indica o limite real de uso mantendo qualidade de servico. | "
+    "Exceder este limite causa TTFT infinito (filas) e TPOT inaceitavel. |\n"
+    "\n"
+    "---\n"
+    "\n"
+    "*Relatorio gerado automaticamente pela Calculadora de Sizing de Infraestrutura para Inferencia.*\n"
+    "\n"
+)
+
+
 def format_exec_summary(
     model_name: str,
     server_name: str,
@@ -31,33 +165,34 @@ def format_exec_summary(
       - Número de servidores por cenário
       - Caminhos dos relatórios
     """
-    lines = []
+    buf = io.StringIO()
+    write = buf.write
 
-    lines.append("=" * 80)
-    lines.append("RESUMO — SIZING DE INFRAESTRUTURA PARA INFERENCIA")
-    lines.append("=" * 80)
-    lines.append("")
+    write("=" * 80 + "\n")
+    write("RESUMO — SIZING DE INFRAESTRUTURA PARA INFERENCIA\n")
+    write("=" * 80 + "\n")
+    write("\n")
 
     # Modo e entradas
     if sizing_mode == "slo_driven":
-        lines.append(f"Modo:                MODO B — Sizing por SLO")
-        lines.append(f"Modelo:              {model_name}")
-        lines.append(f"Servidor Inferencia: {server_name}")
-        lines.append(f"Contexto Efetivo:    {effective_context:,} tokens")
-        lines.append(f"Precisao KV Cache:   {kv_precision.upper()}")
-        lines.append("")
-        lines.append(f"Entradas SLO:")
-        lines.append(f"  TTFT alvo:         {ttft_input_ms} ms")
-        lines.append(f"  TPOT alvo:         {tpot_input_ms} tok/s")
+        write(f"Modo:                MODO B — Sizing por SLO\n")
+        write(f"Modelo:              {model_name}\n")
+        write(f"Servidor Inferencia: {server_name}\n")
+        write(f"Contexto Efetivo:    {effective_context:,} tokens\n")
+        write(f"Precisao KV Cache:   {kv_precision.upper()}\n")
+        write("\n")
+        write(f"Entradas SLO:\n")
+        write(f"  TTFT alvo:         {ttft_input_ms} ms\n")
+        write(f"  TPOT alvo:         {tpot_input_ms} tok/s\n")
     else:
-        lines.append(f"Modo:                MODO A — Sizing por Concorrencia")
-        lines.append(f"Modelo:              {model_name}")
-        lines.append(f"Servidor Inferencia: {server_name}")
-        lines.append(f"Contexto Efetivo:    {effective_context:,} tokens")
-        lines.append(f"Concorrencia:        {concurrency_input:,} sessoes simultaneas")
-        lines.append(f"Precisao KV Cache:   {kv_precision.upper()}")
+        write(f"Modo:                MODO A — Sizing por Concorrencia\n")
+        write(f"Modelo:              {model_name}\n")
+        write(f"Servidor Inferencia: {server_name}\n")
+        write(f"Contexto Efetivo:    {effective_context:,} tokens\n")
+        write(f"Concorrencia:        {concurrency_input:,} sessoes simultaneas\n")
+        write(f"Precisao KV Cache:   {kv_precision.upper()}\n")
 
-    lines.append("")
+    write("\n")
 
     # Tabela de resultados por cenário
     qual_pt = {'excellent': 'Excelente', 'good': 'Bom', 'acceptable': 'Aceitavel', 'slow': 'Lento', None: 'N/A'}
@@ -65,11 +200,11 @@ def format_exec_summary(
 
     if sizing_mode == "slo_driven":
         # Modo B: mostrar concorrência final calculada
-        lines.append("-" * 110)
+        write("-" * 110 + "\n")
         header = (f"{'Cenario':<16} {'Servidores':<12} {'Concorr. Final':<16} {'TTFT Final':<22} "
                   f"{'TPOT Final':<22} {'kW':<8} {'Rack':<8}")
-        lines.append(header)
-        lines.append("-" * 110)
+        write(header + "\n")
+        write("-" * 110 + "\n")
 
         for key in ["minimum", "recommended", "ideal"]:
             s = scenarios[key]
@@ -90,17 +225,17 @@ def format_exec_summary(
             row = (f"{s.config.name:<16} {s.nodes_final:<12} {conc_final:<16} "
                    f"{ttft_display:<22} {tpot_str:<22} "
                    f"{s.total_power_kw_with_storage:<8.1f} {s.total_rack_u_with_storage:<8}")
-            lines.append(row)
+            write(row + "\n")
 
-        lines.append("-" * 110)
+        write("-" * 110 + "\n")
 
     else:
         # Modo A: mostrar TTFT/TPOT estimados
-        lines.append("-" * 110)
+        write("-" * 110 + "\n")
         header = (f"{'Cenario':<16} {'Servidores':<12} {'TTFT Estimado':<22} "
                   f"{'TPOT Estimado':<22} {'kW':<8} {'Rack':<8} {'Storage (TB)':<14}")
-        lines.append(header)
-        lines.append("-" * 110)
+        write(header + "\n")
+        write("-" * 110 + "\n")
 
         for key in ["minimum", "recommended", "ideal"]:
             s = scenarios[key]
@@ -121,22 +256,23 @@ def format_exec_summary(
             row = (f"{s.config.name:<16} {s.nodes_final:<12} {ttft_display:<22} "
                    f"{tpot_display:<22} {s.total_power_kw_with_storage:<8.1f} "
                    f"{s.total_rack_u_with_storage:<8} {storage_display:<14}")
-            lines.append(row)
+            write(row + "\n")
 
-        lines.append("-" * 110)
+        write("-" * 110 + "\n")
 
-    lines.append("")
+    write("\n")
+
+    rec = scenarios["recommended"]
 
     # Nota sobre margem
-    if scenarios["recommended"].storage and scenarios["recommended"].storage.margin_applied:
-        margin_pct = scenarios["recommended"].storage.margin_percent * 100
-        platform_per_server_tb = scenarios["recommended"].storage.platform_per_server_tb
-        lines.append(f"[INFO] Storage considera margem adicional de {margin_pct:.0f}% sobre o volume base.")
-        lines.append(f"[INFO] Storage inclui volume estrutural da plataforma ({platform_per_server_tb:.2f} TB/servidor).")
-        lines.append("")
+    if rec.storage and rec.storage.margin_applied:
+        margin_pct = rec.storage.margin_percent * 100
+        platform_per_server_tb = rec.storage.platform_per_server_tb
+        write(f"[INFO] Storage considera margem adicional de {margin_pct:.0f}% sobre o volume base.\n")
+        write(f"[INFO] Storage inclui volume estrutural da plataforma ({platform_per_server_tb:.2f} TB/servidor).\n")
+        write("\n")
 
     # Cenário recomendado
-    rec = scenarios["recommended"]
     rec_la = rec.latency
     rec_sc = rec.slo_capacity
 
@@ -149,11 +285,11 @@ def format_exec_summary(
         conc_final = rec_sc.max_concurrency_combined
         ttft_ms = _fmt_ttft(rec_la)
         tpot_val = f"{rec_la.tpot_tokens_per_sec:.1f} tok/s" if rec_la else "N/A"
-        lines.append(
+        write(
             f"Cenario RECOMENDADO: {rec.nodes_final} servidor(es) de inferencia | "
             f"{conc_final:,} sessoes dentro dos SLOs | "
             f"TTFT: {ttft_ms} | TPOT: {tpot_val} | "
-            f"{rec.total_power_kw_with_storage:.1f} kW | {rec.total_rack_u_with_storage}U"
+            f"{rec.total_power_kw_with_storage:.1f} kW | {rec.total_rack_u_with_storage}U\n"
         )
     else:
         storage_info = f" | {rec.storage.storage_total_recommended_tb:.1f} TB storage" if rec.storage else ""
@@ -162,53 +298,40 @@ def format_exec_summary(
             lat_info = f" | TTFT: {ttft_ms} | TPOT: {rec_la.tpot_tokens_per_sec:.1f} tok/s"
         else:
             lat_info = ""
-        lines.append(
+        write(
             f"Cenario RECOMENDADO: {rec.nodes_final} servidor(es) de inferencia | "
             f"{concurrency_input:,} sessoes | "
             f"{rec.total_power_kw_with_storage:.1f} kW | {rec.total_rack_u_with_storage}U"
-            f"{storage_info}{lat_info}"
+            f"{storage_info}{lat_info}\n"
         )
 
-    lines.append(f"Tolerancia a Falhas: {rec.config.ha_mode.upper()}")
-    lines.append("")
-    lines.append("=" * 80)
-    lines.append("Relatorios salvos em:")
-    lines.append(f"   Texto:  {text_report_path}")
-    lines.append(f"   JSON:   {json_report_path}")
-    lines.append("")
+    write(f"Tolerancia a Falhas: {rec.config.ha_mode.upper()}\n")
+    write("\n")
+    write("=" * 80 + "\n")
+    write("Relatorios salvos em:\n")
+    write(f"   Texto:  {text_report_path}\n")
+    write(f"   JSON:   {json_report_path}\n")
+    write("\n")
 
-    return "\n".join(lines)
+    return buf.getvalue()[:-1]
 
 
-def _slo_demand_table(
+def _write_slo_demand_table(
+    write,
     sizing_mode: str,
     ttft_input_ms: Optional[int],
     tpot_input_ms: Optional[float],
     concurrency_input: Optional[int],
     scenarios: Dict[str, ScenarioResult],
     scenario_key: str = "recommended"
-) -> list:
+) -> None:
     """
-    Gera a seção 'Parâmetros de Demanda e SLO' como lista de linhas Markdown.
+    Escreve a seção 'Parâmetros de Demanda e SLO' (Markdown) via write.
 
     Para Modo A: entrada=concorrência, resultado=concorrência+TTFT/TPOT estimados.
     Para Modo B: entrada=TTFT+TPOT, resultado=concorrência_final+TTFT/TPOT finais.
     """
-    lines = []
-    lines.append("## Parâmetros de Demanda e SLO")
-    lines.append("")
-
-    # Descrições didáticas
-    lines.append("**Concorrência** — Número de requisições/sessões simultâneas atendidas. "
-                 "Determina a capacidade operacional e o custo da infraestrutura.")
-    lines.append("")
-    lines.append("**TTFT (Time To First Token)** — Tempo até o primeiro token ser entregue ao usuário "
-                 "(inclui rede, fila e processamento do prompt). "
-                 "Define a percepção de responsividade: TTFT alto faz o sistema parecer lento.")
-    lines.append("")
-    lines.append("**TPOT (Time Per Output Token)** — Velocidade de geração contínua de tokens (tokens/segundo). "
-                 "Define a fluidez do streaming: TPOT baixo torna a leitura truncada e lenta.")
-    lines.append("")
+    write(_MD_SLO_INTRO)
 
     s = scenarios[scenario_key]
     la = s.latency
@@ -244,14 +367,11 @@ def _slo_demand_table(
         ttft_obs = "Estimativa para o cenário recomendado"
         tpot_obs = "Estimativa para o cenário recomendado"
 
-    lines.append("| Parâmetro | Entrada | Resultado (Cenário Recomendado) | Observação Operacional |")
-    lines.append("|-----------|---------|----------------------------------|------------------------|")
-    lines.append(f"| **Concorrência** | {conc_entrada} | {conc_resultado} | {conc_obs} |")
-    lines.append(f"| **TTFT P50** | {ttft_entrada} | {ttft_resultado} | {ttft_obs} |")
-    lines.append(f"| **TPOT** | {tpot_entrada} | {tpot_resultado} | {tpot_obs} |")
-    lines.append("")
-
-    return lines
+    write(_MD_SLO_TABLE_HEADER)
+    write(f"| **Concorrência** | {conc_entrada} | {conc_resultado} | {conc_obs} |\n")
+    write(f"| **TTFT P50** | {ttft_entrada} | {ttft_resultado} | {ttft_obs} |\n")
+    write(f"| **TPOT** | {tpot_entrada} | {tpot_resultado} | {tpot_obs} |\n")
+    write("\n")
 
 
 def format_executive_markdown(
@@ -270,37 +390,37 @@ def format_executive_markdown(
     """
     Gera relatório executivo completo em Markdown.
     """
-    lines = []
-
-    lines.append("# Relatorio Executivo — Sizing de Infraestrutura para Inferencia")
-    lines.append("")
-    lines.append(f"**Modelo:** {model.name}  ")
-    lines.append(f"**Servidor de Inferencia:** {server.name}  ")
-    lines.append(f"**Data:** {__import__('datetime').datetime.now().strftime('%Y-%m-%d %H:%M:%S')}  ")
     if sizing_mode == "slo_driven":
         modo_label = f"MODO B — Sizing por SLO (TTFT={ttft_input_ms}ms / TPOT={tpot_input_ms} tok/s)"
     else:
         modo_label = f"MODO A — Sizing por Concorrencia ({concurrency_input:,} sessoes)"
-    lines.append(f"**Modo de Sizing:** {modo_label}  ")
-    lines.append("")
-    lines.append("---")
-    lines.append("")
+    now_str = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    buf = io.StringIO()
+    write = buf.write
+
+    write(_MD_HEADER.format(
+        model_name=model.name,
+        server_name=server.name,
+        date=now_str,
+        modo_label=modo_label,
+    ))
 
     # ── Parâmetros de Demanda e SLO ──────────────────────────────────────────
-    lines.extend(_slo_demand_table(
+    _write_slo_demand_table(
+        write,
         sizing_mode=sizing_mode,
         ttft_input_ms=ttft_input_ms,
         tpot_input_ms=tpot_input_ms,
         concurrency_input=concurrency_input,
         scenarios=scenarios,
         scenario_key="recommended"
-    ))
-    lines.append("---")
-    lines.append("")
+    )
+    write("---\n")
+    write("\n")
 
     # ── Sumário Executivo ─────────────────────────────────────────────────────
-    lines.append("## Sumario Executivo")
-    lines.append("")
+    write("## Sumario Executivo\n")
+    write("\n")
 
     rec = scenarios["recommended"]
     storage_rec = rec.storage if rec.storage else None
@@ -309,30 +429,30 @@ def format_executive_markdown(
 
     if sizing_mode == "slo_driven":
         conc_final = rec_sc.max_concurrency_combined if rec_sc else 0
-        lines.append(
+        write(
             f"O dimensionamento e guiado pelos **SLOs de latencia** definidos "
             f"(TTFT ≤ {ttft_input_ms}ms / TPOT ≥ {tpot_input_ms} tok/s). "
-            f"A infraestrutura e calculada para maximizar a **concorrencia atendivel** dentro dessas metas."
+            f"A infraestrutura e calculada para maximizar a **concorrencia atendivel** dentro dessas metas.\n"
         )
-        lines.append("")
-        lines.append(
+        write("\n")
+        write(
             f"O cenario recomendado suporta **{conc_final:,} sessoes simultaneas** "
-            f"com {rec.nodes_final} servidor(es) de inferencia {server.name}."
+            f"com {rec.nodes_final} servidor(es) de inferencia {server.name}.\n"
         )
     else:
-        lines.append(
+        write(
             f"Para sustentar **{concurrency_input:,} sessoes simultaneas** com contexto de "
             f"**{effective_context:,} tokens** utilizando o modelo **{model.name}**, "
-            f"a infraestrutura e dimensionada por **memoria GPU (KV cache)** e **storage**."
+            f"a infraestrutura e dimensionada por **memoria GPU (KV cache)** e **storage**.\n"
         )
-    lines.append("")
+    write("\n")
 
-    lines.append(
+    write(
         f"O principal limitador de capacidade e o consumo de HBM para armazenar o estado de atencao "
         f"(KV cache) de cada sessao ativa. Storage e dimensionado para operacao continua (pesos do modelo, "
-        f"cache de runtime, logs e auditoria), garantindo resiliencia, tempo de recuperacao e governanca operacional."
+        f"cache de runtime, logs e auditoria), garantindo resiliencia, tempo de recuperacao e governanca operacional.\n"
     )
-    lines.append("")
+    write("\n")
 
     if rec_la:
         ttft_display = f"{rec_la.ttft_p50_ms:.0f}ms" if rec_la.ttft_p50_ms < 99000 else "inf"
@@ -345,116 +465,84 @@ def format_executive_markdown(
             'SLO_MARGINAL': 'SLOs de latencia atendidos com margem minima.',
             'NO_SLO': 'Latencias estimadas (sem SLO definido).'
         }.get(rec_la.status, '')
-        lines.append(
+        write(
             f"O cenario recomendado apresenta **TTFT de {ttft_display}** (qualidade: {ttft_qual}) e "
-            f"**TPOT de {rec_la.tpot_tokens_per_sec:.2f} tok/s** (qualidade: {tpot_qual}). {slo_text}"
+            f"**TPOT de {rec_la.tpot_tokens_per_sec:.2f} tok/s** (qualidade: {tpot_qual}). {slo_text}\n"
         )
-        lines.append("")
+        write("\n")
 
-    lines.append(
-        f"**Recomendacao:** {rec.nodes_final} servidor(es) de inferencia {server.name} "
+    write(
+        f"**Recomendacao:** {rec.nodes_final} servidor(es) de inferencia {server.name} \n"
     )
     if storage_rec:
-        lines.append(
+        write(
             f"({rec.total_power_kw:.1f} kW, {rec.total_rack_u}U rack, "
-            f"{storage_rec.storage_total_recommended_tb:.1f} TB storage) "
+            f"{storage_rec.storage_total_recommended_tb:.1f} TB storage) \n"
         )
     else:
-        lines.append(f"({rec.total_power_kw:.1f} kW, {rec.total_rack_u}U rack) ")
-    lines.append(f"com tolerancia a falhas {rec.config.ha_mode.upper()}.")
-    lines.append("")
-    lines.append("---")
-    lines.append("")
-
-    # ── Cenários Avaliados ────────────────────────────────────────────────────
-    lines.append("## Cenarios Avaliados")
-    lines.append("")
-    lines.append("| Cenario | Objetivo | Tolerancia a Falhas | Risco Operacional |")
-    lines.append("|---------|----------|---------------------|-------------------|")
-    lines.append("| **Minimo** | Atender no limite | Nenhuma | Alto |")
-    lines.append("| **Recomendado** | Producao estavel | Falha simples (N+1) | Medio |")
-    lines.append("| **Ideal** | Alta resiliencia | Falhas multiplas (N+2) | Baixo |")
-    lines.append("")
-    lines.append("Avaliar multiplos cenarios e essencial para equilibrar custo de investimento com risco operacional.")
-    lines.append("")
-    lines.append("---")
-    lines.append("")
-
-    # ── Informações do Modelo ─────────────────────────────────────────────────
-    lines.append("## Informacoes do Modelo Avaliado")
-    lines.append("")
-    lines.append("| Item | Valor |")
-    lines.append("|------|-------|")
-    lines.append(f"| Modelo | {model.name} |")
-    lines.append(f"| Numero de camadas | {model.num_layers} |")
-    lines.append(f"| Contexto maximo | {model.max_position_embeddings:,} tokens |")
-    lines.append(f"| Padrao de atencao | {model.attention_pattern} |")
-    lines.append(f"| Precisao KV cache | {kv_precision.upper()} |")
-    lines.append("")
-    lines.append("O modelo consome memoria viva (KV cache) proporcional ao contexto e concorrencia.")
-    lines.append("")
-    lines.append("---")
-    lines.append("")
-
-    # ── Consumo Unitário ──────────────────────────────────────────────────────
-    lines.append("## Consumo Unitario do Modelo")
-    lines.append("")
-    lines.append("| Recurso | Consumo por Sessao | Significado Operacional |")
-    lines.append("|---------|-------------------|------------------------|")
-    lines.append(f"| KV cache | {rec.vram.vram_per_session_gib:.2f} GiB | Memoria ocupada enquanto sessao esta ativa |")
-    lines.append(
-        f"| GPU HBM | {(rec.vram.vram_per_session_gib/rec.vram.hbm_total_gib*100):.1f}% de um no | "
-        f"Fracao da capacidade GPU consumida |"
-    )
-    lines.append("")
-    lines.append("Cada sessao ativa reserva parte do servidor. A soma das reservas define o limite fisico do no.")
-    lines.append("")
-    lines.append("---")
-    lines.append("")
+        write(f"({rec.total_power_kw:.1f} kW, {rec.total_rack_u}U rack) \n")
+    write(f"com tolerancia a falhas {rec.config.ha_mode.upper()}.\n")
+    write("\n")
+    write("---\n")
+    write("\n")
+
+    # ── Cenários Avaliados / Informações do Modelo / Consumo Unitário ────────
+    write(_MD_SCENARIOS_OVERVIEW)
+    write(_MD_MODEL_INFO.format(
+        model_name=model.name,
+        num_layers=model.num_layers,
+        max_context=model.max_position_embeddings,
+        attention_pattern=model.attention_pattern,
+        kv_precision=kv_precision.upper(),
+    ))
+    write(_MD_UNIT_CONSUMPTION.format(
+        kv_per_session_gib=rec.vram.vram_per_session_gib,
+        hbm_pct=rec.vram.vram_per_session_gib / rec.vram.hbm_total_gib * 100,
+    ))
 
     # ── Resultados por Cenário ────────────────────────────────────────────────
-    lines.append("## Resultados por Cenario")
-    lines.append("")
+    write("## Resultados por Cenario\n")
+    write("\n")
 
     qual_label_md = {'excellent': 'Excelente', 'good': 'Bom', 'acceptable': 'Aceitavel', 'slow': 'Lento'}
     slo_label_md = {'OK': '[OK] Atende', 'SLO_MARGINAL': '[MARGINAL]', 'NO_SLO': '[Estimativa]'}
 
     for key in ["minimum", "recommended", "ideal"]:
         s = scenarios[key]
-        lines.append(f"### Cenario {s.config.name}")
-        lines.append("")
-        lines.append("| Metrica | Valor |")
-        lines.append("|---------|-------|")
-        lines.append(f"| Servidores de Inferencia | {s.nodes_final} |")
-        lines.append(f"| Sessoes por servidor (capacidade) | {s.vram.sessions_per_node} |")
-        lines.append(f"| Sessoes por servidor (operando) | {s.sessions_per_node_effective} |")
-        lines.append(f"| KV por sessao | {s.vram.vram_per_session_gib:.2f} GiB |")
-        lines.append(
+        st = s.storage
+        write(f"### Cenario {s.config.name}\n")
+        write("\n")
+        write("| Metrica | Valor |\n")
+        write("|---------|-------|\n")
+        write(f"| Servidores de Inferencia | {s.nodes_final} |\n")
+        write(f"| Sessoes por servidor (capacidade) | {s.vram.sessions_per_node} |\n")
+        write(f"| Sessoes por servidor (operando) | {s.sessions_per_node_effective} |\n")
+        write(f"| KV por sessao | {s.vram.vram_per_session_gib:.2f} GiB |\n")
+        write(
             f"| VRAM total por servidor | "
-            f"{s.vram_total_node_effective_gib:.1f} GiB ({s.hbm_utilization_ratio_effective*100:.1f}% HBM) |"
+            f"{s.vram_total_node_effective_gib:.1f} GiB ({s.hbm_utilization_ratio_effective*100:.1f}% HBM) |\n"
         )
-        lines.append(
+        write(
             f"| **Energia (Compute + Storage)** | "
-            f"**{s.total_power_kw_with_storage:.1f} kW** ({s.total_power_kw:.1f} + {s.storage_power_kw:.1f}) |"
+            f"**{s.total_power_kw_with_storage:.1f} kW** ({s.total_power_kw:.1f} + {s.storage_power_kw:.1f}) |\n"
         )
-        lines.append(
+        write(
             f"| **Rack (Compute + Storage)** | "
-            f"**{s.total_rack_u_with_storage}U** ({s.total_rack_u} + {s.storage_rack_u}) |"
+            f"**{s.total_rack_u_with_storage}U** ({s.total_rack_u} + {s.storage_rack_u}) |\n"
         )
 
-        if s.storage:
-            st = s.storage
-            lines.append(f"| **Storage total** | **{st.storage_total_recommended_tb:.2f} TB** |")
-            lines.append(f"| Storage (modelo) | {st.storage_model_recommended_tb:.2f} TB |")
-            lines.append(f"| Storage (cache) | {st.storage_cache_recommended_tb:.2f} TB |")
-            lines.append(f"| Storage (logs) | {st.storage_logs_recommended_tb:.2f} TB |")
-            lines.append(f"| IOPS (pico R/W) | {st.iops_read_peak:,} / {st.iops_write_peak:,} |")
-            lines.append(
+        if st:
+            write(f"| **Storage total** | **{st.storage_total_recommended_tb:.2f} TB** |\n")
+            write(f"| Storage (modelo) | {st.storage_model_recommended_tb:.2f} TB |\n")
+            write(f"| Storage (cache) | {st.storage_cache_recommended_tb:.2f} TB |\n")
+            write(f"| Storage (logs) | {st.storage_logs_recommended_tb:.2f} TB |\n")
+            write(f"| IOPS (pico R/W) | {st.iops_read_peak:,} / {st.iops_write_peak:,} |\n")
+            write(
                 f"| Throughput (pico R/W) | "
-                f"{st.throughput_read_peak_gbps:.1f} / {st.throughput_write_peak_gbps:.1f} GB/s |"
+                f"{st.throughput_read_peak_gbps:.1f} / {st.throughput_write_peak_gbps:.1f} GB/s |\n"
             )
 
-        lines.append(f"| Arquitetura HA | {s.config.ha_mode.upper()} |")
+        write(f"| Arquitetura HA | {s.config.ha_mode.upper()} |\n")
 
         # TTFT/TPOT
         if s.latency:
@@ -469,113 +557,112 @@ def format_executive_markdown(
             ttft_qual = qual_label_md.get(la.ttft_quality, la.ttft_quality)
             tpot_qual = qual_label_md.get(la.tpot_quality, la.tpot_quality)
             slo_val = slo_label_md.get(la.status, la.status)
-            lines.append(f"| **TTFT P50 (latencia 1o token)** | **{ttft_val}** — {ttft_qual} |")
-            lines.append(f"| TTFT P99 | {ttft_p99_val} |")
-            lines.append(f"| **TPOT (velocidade streaming)** | **{tpot_val}** — {tpot_qual} |")
-            lines.append(f"| Utilizacao GPU (queuing) | {util_val} |")
-            lines.append(f"| Gargalo | {la.bottleneck.split(' - ')[0]} |")
+            write(f"| **TTFT P50 (latencia 1o token)** | **{ttft_val}** — {ttft_qual} |\n")
+            write(f"| TTFT P99 | {ttft_p99_val} |\n")
+            write(f"| **TPOT (velocidade streaming)** | **{tpot_val}** — {tpot_qual} |\n")
+            write(f"| Utilizacao GPU (queuing) | {util_val} |\n")
+            write(f"| Gargalo | {la.bottleneck.split(' - ')[0]} |\n")
             if la.status != 'NO_SLO':
-                lines.append(f"| **Status SLO Latencia** | **{slo_val}** |")
+                write(f"| **Status SLO Latencia** | **{slo_val}** |\n")
 
         # Capacidade máxima por SLO (Modo B)
         if s.slo_capacity and sizing_mode == "slo_driven":
             sc = s.slo_capacity
             if sc.is_feasible:
-                lines.append(f"| **Concorrencia maxima (SLOs)** | **{sc.max_concurrency_combined:,} sessoes** |")
-                lines.append(
+                write(f"| **Concorrencia maxima (SLOs)** | **{sc.max_concurrency_combined:,} sessoes** |\n")
+                write(
                     f"| Max por TTFT | "
-                    f"{sc.max_concurrency_from_ttft:,} sessoes (util. max: {sc.util_max_from_ttft*100:.1f}%) |"
+                    f"{sc.max_concurrency_from_ttft:,} sessoes (util. max: {sc.util_max_from_ttft*100:.1f}%) |\n"
                 )
-                lines.append(
+                write(
                     f"| Max por TPOT | "
-                    f"{sc.max_concurrency_from_tpot:,} sessoes (sess./servidor max: {sc.sessions_per_node_max_from_tpot}) |"
+                    f"{sc.max_concurrency_from_tpot:,} sessoes (sess./servidor max: {sc.sessions_per_node_max_from_tpot}) |\n"
                 )
-                lines.append(f"| Fator limitante | {sc.limiting_factor} |")
+                write(f"| Fator limitante | {sc.limiting_factor} |\n")
 
-        lines.append("")
+        write("\n")
 
         if key == "minimum":
-            lines.append(
+            write(
                 f"**Analise Computacional:** Opera no limite da capacidade sem margem para picos ou falhas. "
-                f"Risco operacional **alto** — qualquer indisponibilidade de hardware afeta o servico diretamente."
+                f"Risco operacional **alto** — qualquer indisponibilidade de hardware afeta o servico diretamente.\n"
             )
-            if s.storage:
-                lines.append(
-                    f"**Analise Storage:** {s.storage.storage_total_recommended_tb:.1f} TB recomendado "
-                    f"(base: {s.storage.storage_total_base_tb:.1f} TB). "
-                    f"IOPS e throughput dimensionados sem margem."
+            if st:
+                write(
+                    f"**Analise Storage:** {st.storage_total_recommended_tb:.1f} TB recomendado "
+                    f"(base: {st.storage_total_base_tb:.1f} TB). "
+                    f"IOPS e throughput dimensionados sem margem.\n"
                 )
         elif key == "recommended":
-            lines.append(
+            write(
                 f"**Analise Computacional:** Equilibra eficiencia e resiliencia. "
                 f"Suporta picos de ate {s.config.peak_headroom_ratio*100:.0f}% "
-                f"e tolera falha de 1 servidor sem degradacao. **Adequado para producao.**"
+                f"e tolera falha de 1 servidor sem degradacao. **Adequado para producao.**\n"
             )
-            if s.storage:
-                lines.append(
-                    f"**Analise Storage:** {s.storage.storage_total_recommended_tb:.1f} TB recomendado "
-                    f"(base: {s.storage.storage_total_base_tb:.1f} TB) com margem de capacidade. "
-                    f"Tempo de recuperacao aceitavel."
+            if st:
+                write(
+                    f"**Analise Storage:** {st.storage_total_recommended_tb:.1f} TB recomendado "
+                    f"(base: {st.storage_total_base_tb:.1f} TB) com margem de capacidade. "
+                    f"Tempo de recuperacao aceitavel.\n"
                 )
         else:
-            lines.append(
+            write(
                 f"**Analise Computacional:** Maxima resiliencia com margem para multiplas falhas. "
-                f"Risco operacional **minimo**. Ideal para servicos criticos."
+                f"Risco operacional **minimo**. Ideal para servicos criticos.\n"
             )
-            if s.storage:
-                lines.append(
-                    f"**Analise Storage:** {s.storage.storage_total_recommended_tb:.1f} TB recomendado "
-                    f"(base: {s.storage.storage_total_base_tb:.1f} TB) com margem ampla. "
-                    f"Maxima resiliencia."
+            if st:
+                write(
+                    f"**Analise Storage:** {st.storage_total_recommended_tb:.1f} TB recomendado "
+                    f"(base: {st.storage_total_base_tb:.1f} TB) com margem ampla. "
+                    f"Maxima resiliencia.\n"
                 )
-        lines.append("")
+        write("\n")
 
-    lines.append("---")
-    lines.append("")
+    write("---\n")
+    write("\n")
 
     # ── Comparação Executiva ──────────────────────────────────────────────────
-    lines.append("## Comparacao Executiva dos Cenarios")
-    lines.append("")
-    lines.append("| Criterio | Minimo | Recomendado | Ideal |")
-    lines.append("|----------|--------|-------------|-------|")
-    lines.append(
+    write("## Comparacao Executiva dos Cenarios\n")
+    write("\n")
+    s_min, s_rec, s_ideal = scenarios["minimum"], scenarios["recommended"], scenarios["ideal"]
+    write("| Criterio | Minimo | Recomendado | Ideal |\n")
+    write("|----------|--------|-------------|-------|\n")
+    write(
         f"| Servidores de Inferencia | "
-        f"{scenarios['minimum'].nodes_final} | "
-        f"{scenarios['recommended'].nodes_final} | "
-        f"{scenarios['ideal'].nodes_final} |"
+        f"{s_min.nodes_final} | "
+        f"{s_rec.nodes_final} | "
+        f"{s_ideal.nodes_final} |\n"
     )
-    lines.append(
+    write(
         f"| Energia Total (kW) | "
-        f"{scenarios['minimum'].total_power_kw_with_storage:.1f} | "
-        f"{scenarios['recommended'].total_power_kw_with_storage:.1f} | "
-        f"{scenarios['ideal'].total_power_kw_with_storage:.1f} |"
+        f"{s_min.total_power_kw_with_storage:.1f} | "
+        f"{s_rec.total_power_kw_with_storage:.1f} | "
+        f"{s_ideal.total_power_kw_with_storage:.1f} |\n"
     )
-    lines.append(
+    write(
         f"| Rack Total (U) | "
-        f"{scenarios['minimum'].total_rack_u_with_storage} | "
-        f"{scenarios['recommended'].total_rack_u_with_storage} | "
-        f"{scenarios['ideal'].total_rack_u_with_storage} |"
+        f"{s_min.total_rack_u_with_storage} | "
+        f"{s_rec.total_rack_u_with_storage} | "
+        f"{s_ideal.total_rack_u_with_storage} |\n"
     )
 
-    if all(scenarios[k].storage for k in ['minimum', 'recommended', 'ideal']):
-        st_min = scenarios['minimum'].storage
-        st_rec = scenarios['recommended'].storage
-        st_ideal = scenarios['ideal'].storage
-        lines.append(
+    st_min, st_rec, st_ideal = s_min.storage, s_rec.storage, s_ideal.storage
+    if st_min and st_rec and st_ideal:
+        write(
             f"| Storage (TB) | "
             f"{st_min.storage_total_recommended_tb:.1f} | "
             f"{st_rec.storage_total_recommended_tb:.1f} | "
-            f"{st_ideal.storage_total_recommended_tb:.1f} |"
+            f"{st_ideal.storage_total_recommended_tb:.1f} |\n"
         )
-        lines.append(
+        write(
             f"| IOPS pico (R) | "
             f"{st_min.iops_read_peak:,} | "
             f"{st_rec.iops_read_peak:,} | "
-            f"{st_ideal.iops_read_peak:,} |"
+            f"{st_ideal.iops_read_peak:,} |\n"
         )
 
-    lines.append(f"| Tolerancia a falhas | Nenhuma | 1 servidor | 2 servidores |")
-    lines.append(f"| Risco operacional | Alto | Medio | Baixo |")
+    write(f"| Tolerancia a falhas | Nenhuma | 1 servidor | 2 servidores |\n")
+    write(f"| Risco operacional | Alto | Medio | Baixo |\n")
 
     if any(scenarios[k].latency is not None for k in scenarios):
         def _ttft_str(k):
@@ -592,11 +679,11 @@ def format_executive_markdown(
                 return "N/A"
             return f"{la.tpot_tokens_per_sec:.1f} tok/s ({qual_label_md.get(la.tpot_quality, la.tpot_quality)})"
 
-        lines.append(
-            f"| **TTFT P50** | {_ttft_str('minimum')} | {_ttft_str('recommended')} | {_ttft_str('ideal')} |"
+        write(
+            f"| **TTFT P50** | {_ttft_str('minimum')} | {_ttft_str('recommended')} | {_ttft_str('ideal')} |\n"
         )
-        lines.append(
-            f"| **TPOT** | {_tpot_str('minimum')} | {_tpot_str('recommended')} | {_tpot_str('ideal')} |"
+        write(
+            f"| **TPOT** | {_tpot_str('minimum')} | {_tpot_str('recommended')} | {_tpot_str('ideal')} |\n"
         )
 
     if sizing_mode == "slo_driven":
@@ -608,71 +695,65 @@ def format_executive_markdown(
                 return "INVIAVEL"
             return f"{sc.max_concurrency_combined:,} sessoes"
 
-        lines.append(
+        write(
             f"| **Concorrencia maxima (SLOs)** | "
             f"{_slo_cap_str('minimum')} | "
             f"{_slo_cap_str('recommended')} | "
-            f"{_slo_cap_str('ideal')} |"
+            f"{_slo_cap_str('ideal')} |\n"
         )
 
-    lines.append("")
-    lines.append(
-        f"**Conclusao:** O cenario **RECOMENDADO** oferece o melhor equilibrio custo-risco para operacao em producao."
+    write("\n")
+    write(
+        f"**Conclusao:** O cenario **RECOMENDADO** oferece o melhor equilibrio custo-risco para operacao em producao.\n"
     )
-    if scenarios['recommended'].storage:
-        lines.append(
-            "Storage subdimensionado compromete resiliencia e tempo de recuperacao, mesmo com GPUs suficientes."
+    if rec.storage:
+        write(
+            "Storage subdimensionado compromete resiliencia e tempo de recuperacao, mesmo com GPUs suficientes.\n"
         )
-    lines.append("")
-    lines.append("---")
-    lines.append("")
+    write("\n")
+    write("---\n")
+    write("\n")
 
     # ── Recomendação Final ────────────────────────────────────────────────────
-    lines.append("## Recomendacao Final")
-    lines.append("")
-    lines.append(
+    write("## Recomendacao Final\n")
+    write("\n")
+    write(
         f"Recomenda-se o **cenario RECOMENDADO** com "
-        f"**{rec.nodes_final} servidor(es) de inferencia {server.name}**, que:"
+        f"**{rec.nodes_final} servidor(es) de inferencia {server.name}**, que:\n"
     )
-    lines.append("")
+    write("\n")
     if sizing_mode == "slo_driven" and rec_sc:
-        lines.append(f"- Atende os SLOs de latencia (TTFT ≤ {ttft_input_ms}ms / TPOT ≥ {tpot_input_ms} tok/s)")
-        lines.append(f"- Suporta **{rec_sc.max_concurrency_combined:,} sessoes simultaneas** dentro dos SLOs")
+        write(f"- Atende os SLOs de latencia (TTFT ≤ {ttft_input_ms}ms / TPOT ≥ {tpot_input_ms} tok/s)\n")
+        write(f"- Suporta **{rec_sc.max_concurrency_combined:,} sessoes simultaneas** dentro dos SLOs\n")
     else:
-        lines.append(f"- Atende os requisitos de capacidade ({concurrency_input:,} sessoes)")
-    lines.append(f"- Suporta picos de ate {rec.config.peak_headroom_ratio*100:.0f}%")
-    lines.append(f"- Tolera falha de 1 servidor sem degradacao ({rec.config.ha_mode.upper()})")
-    lines.append(f"- Consome {rec.total_power_kw:.1f} kW e ocupa {rec.total_rack_u}U de rack")
+        write(f"- Atende os requisitos de capacidade ({concurrency_input:,} sessoes)\n")
+    write(f"- Suporta picos de ate {rec.config.peak_headroom_ratio*100:.0f}%\n")
+    write(f"- Tolera falha de 1 servidor sem degradacao ({rec.config.ha_mode.upper()})\n")
+    write(f"- Consome {rec.total_power_kw:.1f} kW e ocupa {rec.total_rack_u}U de rack\n")
 
     if storage_rec:
-        lines.append(
+        write(
             f"- Requer {storage_rec.storage_total_recommended_tb:.1f} TB de storage "
-            f"({storage_name}, incluindo margem de capacidade)"
+            f"({storage_name}, incluindo margem de capacidade)\n"
         )
-        lines.append(
-            f"  - IOPS pico: {storage_rec.iops_read_peak:,} leitura / {storage_rec.iops_write_peak:,} escrita"
+        write(
+            f"  - IOPS pico: {storage_rec.iops_read_peak:,} leitura / {storage_rec.iops_write_peak:,} escrita\n"
         )
-        lines.append(
+        write(
             f"  - Throughput pico: {storage_rec.throughput_read_peak_gbps:.1f} GB/s leitura / "
-            f"{storage_rec.throughput_write_peak_gbps:.1f} GB/s escrita"
+            f"{storage_rec.throughput_write_peak_gbps:.1f} GB/s escrita\n"
         )
 
-    lines.append(f"- Mantem risco operacional em nivel **aceitavel** para producao")
-    lines.append("")
+    write(f"- Mantem risco operacional em nivel **aceitavel** para producao\n")
+    write("\n")
 
-    lines.append("**Governanca:** Storage e recurso critico. Subdimensionamento impacta:")
-    lines.append("- Tempo de recuperacao (restart lento)")
-    lines.append("- Escalabilidade (gargalo em scale-out)")
-    lines.append("- Auditoria e conformidade (retencao inadequada de logs)")
-    lines.append("")
-    lines.append("---")
-    lines.append("")
+    write(_MD_GOVERNANCE)
 
     # ── Análise de Latência ───────────────────────────────────────────────────
     any_latency = any(scenarios[k].latency is not None for k in scenarios)
     if any_latency:
-        lines.append("## Analise de Latencia de Inferencia (TTFT e TPOT)")
-        lines.append("")
+        write("## Analise de Latencia de Inferencia (TTFT e TPOT)\n")
+        write("\n")
 
         first_la = next(
             (scenarios[k].latency for k in ["minimum", "recommended", "ideal"] if scenarios[k].latency),
@@ -680,13 +761,13 @@ def format_executive_markdown(
         )
 
         if first_la and sizing_mode == "slo_driven":
-            lines.append("**SLO Definido:**")
-            lines.append(f"- TTFT (Time to First Token) P50: **{ttft_input_ms}ms**")
-            lines.append(f"- TPOT minimo: **{tpot_input_ms:.1f} tokens/s**")
-            lines.append("")
+            write("**SLO Definido:**\n")
+            write(f"- TTFT (Time to First Token) P50: **{ttft_input_ms}ms**\n")
+            write(f"- TPOT minimo: **{tpot_input_ms:.1f} tokens/s**\n")
+            write("\n")
 
-        lines.append("| Cenario | Servidores | Conc. Final | TTFT P50 | TPOT | Gargalo |")
-        lines.append("|---------|------------|-------------|----------|------|---------|")
+        write("| Cenario | Servidores | Conc. Final | TTFT P50 | TPOT | Gargalo |\n")
+        write("|---------|------------|-------------|----------|------|---------|\n")
         for key in ["minimum", "recommended", "ideal"]:
             s = scenarios[key]
             la = s.latency
@@ -701,98 +782,41 @@ def format_executive_markdown(
             )
             bottleneck_short = la.bottleneck.split(' - ')[0] if ' - ' in la.bottleneck else la.bottleneck[:30]
             scenario_name = {'minimum': 'Minimo', 'recommended': 'Recomendado', 'ideal': 'Ideal'}[key]
-            lines.append(
-                f"| {scenario_name} | {s.nodes_final} | {conc_txt} | {ttft_txt} | {tpot_txt} | {bottleneck_short} |"
+            write(
+                f"| {scenario_name} | {s.nodes_final} | {conc_txt} | {ttft_txt} | {tpot_txt} | {bottleneck_short} |\n"
             )
 
-        lines.append("")
+        write("\n")
 
-        rec_la_detail = scenarios['recommended'].latency
+        rec_la_detail = rec.latency
         if rec_la_detail:
             total_latency = rec_la_detail.ttft_p50_ms
-            lines.append("**Breakdown de Latencia TTFT (Cenario Recomendado):**")
+            write("**Breakdown de Latencia TTFT (Cenario Recomendado):**\n")
             if total_latency > 0 and total_latency < 99000:
                 net_pct = rec_la_detail.network_latency_p50_ms / total_latency * 100
                 pref_pct = rec_la_detail.prefill_time_ms / total_latency * 100
-                lines.append(f"- Network: {rec_la_detail.network_latency_p50_ms:.0f}ms ({net_pct:.1f}%)")
-                lines.append(f"- Prefill: {rec_la_detail.prefill_time_ms:.0f}ms ({pref_pct:.1f}%)")
+                write(f"- Network: {rec_la_detail.network_latency_p50_ms:.0f}ms ({net_pct:.1f}%)\n")
+                write(f"- Prefill: {rec_la_detail.prefill_time_ms:.0f}ms ({pref_pct:.1f}%)\n")
                 if rec_la_detail.queuing_delay_p50_ms < 99000:
                     q_pct = rec_la_detail.queuing_delay_p50_ms / total_latency * 100
-                    lines.append(
-                        f"- Queuing: {rec_la_detail.queuing_delay_p50_ms:.0f}ms ({q_pct:.1f}%)"
+                    write(
+                        f"- Queuing: {rec_la_detail.queuing_delay_p50_ms:.0f}ms ({q_pct:.1f}%)\n"
                     )
                 else:
-                    lines.append("- Queuing: inf (sistema saturado)")
-            lines.append(
+                    write("- Queuing: inf (sistema saturado)\n")
+            write(
                 f"- TPOT por sessao: {rec_la_detail.tpot_tokens_per_sec:.2f} tok/s "
-                f"(ITL: {rec_la_detail.itl_ms_per_token:.0f}ms/token)"
+                f"(ITL: {rec_la_detail.itl_ms_per_token:.0f}ms/token)\n"
             )
-            lines.append(f"- Utilizacao: {rec_la_detail.utilization*100:.1f}%")
-            lines.append("")
-            lines.append(f"**Gargalo Principal:** {rec_la_detail.bottleneck}")
-            lines.append("")
+            write(f"- Utilizacao: {rec_la_detail.utilization*100:.1f}%\n")
+            write("\n")
+            write(f"**Gargalo Principal:** {rec_la_detail.bottleneck}\n")
+            write("\n")
 
-        lines.append("---")
-        lines.append("")
+        write("---\n")
+        write("\n")
 
     # ── Glossário ─────────────────────────────────────────────────────────────
-    lines.append("## Glossario Executivo de Termos")
-    lines.append("")
-    lines.append(
-        "| Metrica | O que significa | Por que importa | Impacto se subdimensionado |"
-    )
-    lines.append("| --- | --- | --- | --- |")
-    lines.append(
-        "| **Servidores de Inferencia** | Quantidade de servidores necessarios para atender a carga. | "
-        "Define investimento em hardware e influencia energia, rack e custo total. | "
-        "Subdimensionamento causa indisponibilidade. |"
-    )
-    lines.append(
-        "| **Sessoes por servidor** | Numero de conversas simultaneas que um servidor suporta. | "
-        "Indica o limite fisico antes de atingir saturacao de memoria. | "
-        "Operar no limite aumenta risco de instabilidade. |"
-    )
-    lines.append(
-        "| **KV por sessao** | Memoria de GPU consumida por cada conversa ativa. | "
-        "Principal fator que determina quantas sessoes cabem por servidor. | "
-        "Conversas mais longas aumentam consumo e reduzem capacidade. |"
-    )
-    lines.append(
-        "| **Energia (Compute + Storage)** | Consumo total de energia dos servidores e storage. | "
-        "Impacta custo operacional mensal e capacidade eletrica do datacenter. | "
-        "Subdimensionar pode causar sobrecarga eletrica. |"
-    )
-    lines.append(
-        "| **Rack (Compute + Storage)** | Espaco fisico no datacenter. | "
-        "Define viabilidade fisica de implantacao. | "
-        "Espaco insuficiente limita crescimento. |"
-    )
-    lines.append(
-        "| **Storage total** | Capacidade necessaria para modelo + cache + logs. | "
-        "Espaco minimo para operar o ambiente. | "
-        "Falta de espaco pode impedir inicializacao ou escala. |"
-    )
-    lines.append(
-        "| **TTFT** | Tempo ate o primeiro token (rede + fila + prefill). | "
-        "Latencia percebida pelo usuario — define se o sistema parece responsivo. | "
-        "TTFT alto faz o usuario perceber demora antes de qualquer resposta. |"
-    )
-    lines.append(
-        "| **TPOT** | Velocidade de geracao de tokens (tokens/segundo). | "
-        "Determina a fluidez do streaming. | "
-        "TPOT baixo torna o streaming lento e perceptivelmente truncado. |"
-    )
-    lines.append(
-        "| **Concorrencia maxima (SLOs)** | Sessoes simultaneas atendidas dentro dos SLOs de latencia. | "
-        "Indica o limite real de uso mantendo qualidade de servico. | "
-        "Exceder este limite causa TTFT infinito (filas) e TPOT inaceitavel. |"
-    )
-    lines.append("")
-    lines.append("---")
-    lines.append("")
-    lines.append(
-        "*Relatorio gerado automaticamente pela Calculadora de Sizing de Infraestrutura para Inferencia.*"
-    )
-    lines.append("")
+    write(_MD_GLOSSARY)
 
-    return "\n".join(lines)
+    return buf.getvalue()[:-1]
@@ -8,6 +8,7 @@ from .models import ModelSpec
 from .servers import ServerSpec
 from .storage import StorageProfile
 from .calc_response_time import LatencyAnalysis, latency_analysis_to_dict
+from .rationale_format import format_rationale
 
 
 def format_full_report(
@@ -604,7 +605,7 @@ def format_json_report(
                 "throughput_read_steady_gbps": round(s.storage.throughput_read_steady_gbps, 2),
                 "throughput_write_steady_gbps": round(s.storage.throughput_write_steady_gbps, 2)
             }
-            result["rationale_storage"] = s.storage.rationale
+            result["rationale_storage"] = format_rationale(s.storage.rationale)
         
         # Adicionar análise de latência se disponível
         if s.latency is not None:
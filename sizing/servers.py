@@ -10,7 +10,7 @@ from typing import Optional, List, Dict, Any
 GB_TO_GIB = 10**9 / 2**30  # 0.931322574615478515625
 
 
-@dataclass
+@dataclass(slots=True)
 class CPUSpec:
     """Especificação de CPU."""
     model: Optional[str] = None
@@ -20,7 +20,7 @@ class CPUSpec:
     max_boost_frequency_ghz: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SystemMemorySpec:
     """Especificação de memória do sistema."""
     capacity_total_tb: Optional[float] = None
@@ -28,7 +28,7 @@ class SystemMemorySpec:
     speed_mhz: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class GPUSpec:
     """Especificação de GPU."""
     count: int
@@ -68,7 +68,7 @@ class GPUSpec:
         return self.total_hbm_gb * GB_TO_GIB
 
 
-@dataclass
+@dataclass(slots=True)
 class PowerSupplySpec:
     """Especificação de fontes de alimentação."""
     count: Optional[int] = None
@@ -76,14 +76,14 @@ class PowerSupplySpec:
     redundancy: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MaxCurrentSpec:
     """Especificação de corrente máxima."""
     _208v_3phase_amps: Optional[int] = None
     _480v_3phase_amps: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PowerSpec:
     """Especificação de consumo elétrico."""
     power_kw_max: float
@@ -97,7 +97,7 @@ class PowerSpec:
             raise ValueError(f"Server {server_name}: power.power_kw_max must be > 0")
 
 
-@dataclass
+@dataclass(slots=True)
 class ThermalSpec:
     """Especificação térmica."""
     heat_output_btu_hr_max: Optional[float] = None
@@ -105,14 +105,14 @@ class ThermalSpec:
     ambient_temp_operating_c_max: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CoolingSpec:
     """Especificação de refrigeração."""
     airflow_cfm: Optional[float] = None
     cooling_type: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class StorageSpec:
     """Especificação de storage interno."""
     boot_drives: Optional[str] = None
@@ -120,14 +120,14 @@ class StorageSpec:
     max_internal_storage_tb: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class NetworkingSpec:
     """Especificação de rede."""
     infiniband: Optional[str] = None
     management: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SoftwareSpec:
     """Especificação de software."""
     os_supported: Optional[List[str]] = None
@@ -135,7 +135,7 @@ class SoftwareSpec:
     cuda_version: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DimensionsSpec:
     """Dimensões físicas."""
     width: Optional[int] = None
@@ -143,14 +143,14 @@ class DimensionsSpec:
     height: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PhysicalSpec:
     """Especificação física."""
     dimensions_mm: Optional[DimensionsSpec] = None
     weight_kg_max: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ServerSpec:
     """Especificação completa de hardware de um servidor GPU (estrutura hierárquica)."""
     
@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class StorageProfile:
     """Especificação de um perfil de storage para operação de inferência."""
     
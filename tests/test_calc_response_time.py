@@ -0,0 +1,113 @@
+"""
+Testes do cálculo de latência TTFT/TPOT e da leitura de parameters.json.
+"""
+
+import json
+
+import pytest
+
+from sizing import calc_response_time
+from sizing.calc_response_time import (
+    calc_latency_analysis,
+    calc_latency_analysis_dict,
+    calc_max_concurrency_from_slo,
+    calc_max_concurrency_from_slo_batch,
+    latency_analyses_to_json_bytes,
+    latency_analysis_to_dict,
+    latency_analysis_to_json_bytes,
+    load_latency_benchmarks,
+    load_parameter,
+)
+from sizing.config_loader import ConfigLoader
+
+
+_LOADER = ConfigLoader(base_path=".", validate=False)
+_MODEL = _LOADER.get_model("opt-oss-120b")
+_SERVER = _LOADER.get_server("dgx-b300")
+
+# (num_nodes, sessions_per_node, concurrency, ttft_p50, ttft_p99, tpot_min)
+_CASES = [
+    (3, 500, 1000, None, None, None),          # estimativa sem SLO
+    (3, 500, 1000, 1000, 2000, 8.0),           # validação contra SLO
+    (0, 0, 1000, 1000, 2000, 8.0),             # fila saturada e ITL indefinido
+]
+
+
+def test_latency_benchmarks_are_read_only():
+    benchmarks = load_latency_benchmarks()
+    expected = benchmarks['ttft_excellent_ms']
+    with pytest.raises(TypeError):
+        benchmarks['ttft_excellent_ms'] = 1
+    # O cache de parameters.json não é alterado pelos chamadores
+    assert load_latency_benchmarks()['ttft_excellent_ms'] == expected
+    assert load_parameter('latency_benchmarks', None)['ttft_excellent_ms'] == expected
+
+
+def test_missing_parameter_returns_default():
+    assert load_parameter('parametro_inexistente', 42) == 42
+
+
+@pytest.mark.parametrize("case", _CASES)
+def test_dict_fast_path_matches_latency_analysis(case):
+    args = (_MODEL, _SERVER, *case, 65536)
+    assert calc_latency_analysis_dict(*args) == latency_analysis_to_dict(calc_latency_analysis(*args))
+
+
+def test_saturated_case_uses_sentinel_strings():
+    d = calc_latency_analysis_dict(_MODEL, _SERVER, *_CASES[2], 65536)
+    assert d["expected"]["queuing_delay_p50_ms"] == "saturated"
+    assert d["expected"]["queuing_delay_p99_ms"] == "saturated"
+    assert d["expected"]["itl_ms_per_token"] == "n/a"
+
+
+@pytest.mark.parametrize("backend", ["orjson", "stdlib"])
+def test_json_bytes_decode_to_latency_dicts(backend, monkeypatch):
+    if backend == "stdlib":
+        monkeypatch.setattr(calc_response_time, "orjson", None)
+    elif calc_response_time.orjson is None:
+        pytest.skip("orjson não instalado")
+    analyses = [calc_latency_analysis(_MODEL, _SERVER, *case, 65536) for case in _CASES] + [None]
+    expected = [latency_analysis_to_dict(la) for la in analyses]
+
+    decoded = json.loads(latency_analyses_to_json_bytes(analyses))
+    assert decoded == expected
+    assert json.loads(latency_analysis_to_json_bytes(analyses[2])) == expected[2]
+    # Sentinelas de saturação sobrevivem à serialização
+    assert decoded[2]["expected"]["queuing_delay_p50_ms"] == "saturated"
+    assert decoded[2]["expected"]["itl_ms_per_token"] == "n/a"
+
+
+# Contexto curto: prefill de ~683 ms cabe num TTFT de 2000 ms (decode de 130 tok/s no B300)
+_SLO_CONTEXT = 4096
+
+
+@pytest.mark.parametrize("ttft, tpot", [(None, None), (2000, 0.1), (2000, 1.0)])
+def test_slo_batch_matches_scalar(ttft, tpot):
+    node_counts = [1, 2, 4, 8]
+    batch = calc_max_concurrency_from_slo_batch(_MODEL, _SERVER, node_counts, 500, ttft, tpot, _SLO_CONTEXT)
+    assert batch == [
+        calc_max_concurrency_from_slo(_MODEL, _SERVER, n, 500, ttft, tpot, _SLO_CONTEXT)
+        for n in node_counts
+    ]
+    assert all(cap.is_feasible for cap in batch)
+    assert [cap.max_concurrency_from_tpot for cap in batch] == [
+        batch[0].max_concurrency_from_tpot * n for n in node_counts
+    ]
+
+
+def test_slo_batch_limiting_factor():
+    ttft_limited = calc_max_concurrency_from_slo(_MODEL, _SERVER, 4, 500, 2000, 0.1, _SLO_CONTEXT)
+    tpot_limited = calc_max_concurrency_from_slo(_MODEL, _SERVER, 4, 500, 2000, 1.0, _SLO_CONTEXT)
+    assert ttft_limited.limiting_factor == "TTFT"
+    assert ttft_limited.max_concurrency_combined == ttft_limited.max_concurrency_from_ttft
+    assert tpot_limited.limiting_factor == "TPOT"
+    assert tpot_limited.max_concurrency_combined == tpot_limited.max_concurrency_from_tpot == 520
+
+
+def test_slo_batch_ttft_budget_exhausted():
+    batch = calc_max_concurrency_from_slo_batch(_MODEL, _SERVER, [1, 4], 500, 100, 1.0, _SLO_CONTEXT)
+    for cap in batch:
+        assert cap.is_feasible is False
+        assert cap.queuing_budget_ms <= 0
+        assert cap.max_concurrency_combined == 0
+        assert "TTFT minimo viavel" in cap.infeasibility_reason
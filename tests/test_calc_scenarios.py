@@ -0,0 +1,157 @@
+"""
+Testes do cálculo de cenários (nós, sessões e viabilidade).
+"""
+
+import pytest
+
+from sizing.calc_response_time import calc_latency_analysis
+from sizing.calc_scenarios import (
+    ScenarioConfig,
+    calc_scenario,
+    calc_scenarios_fused,
+    compute_slo_capacity,
+    create_scenario_configs,
+)
+from sizing.calc_vram import VRAMResult, calc_vram
+from sizing.config_loader import ConfigLoader
+
+
+_CONFIG = ScenarioConfig(
+    name="RECOMENDADO",
+    peak_headroom_ratio=0.2,
+    ha_mode="n+1",
+    ha_extra_nodes=1,
+    kv_budget_ratio=0.7,
+)
+
+
+def _vram(sessions_per_node: int, fixed_model_gib: float) -> VRAMResult:
+    """VRAMResult de um nó com 1000 GiB de HBM e 3 GiB de KV por sessão."""
+    budget = max(0.0, 1000.0 - fixed_model_gib - 100.0)
+    return VRAMResult(
+        weights_gib=fixed_model_gib,
+        weights_estimated=False,
+        fixed_model_gib=fixed_model_gib,
+        hbm_total_gib=1000.0,
+        budget_for_sessions_gib=budget,
+        sessions_budget_gib=budget * 0.7,
+        vram_per_session_gib=3.0,
+        sessions_per_node=sessions_per_node,
+        vram_total_node_at_limit_gib=fixed_model_gib + 100.0 + sessions_per_node * 3.0,
+        warnings=[],
+    )
+
+
+def test_feasible_scenario():
+    scenario = calc_scenario(_CONFIG, _vram(100, 500.0), concurrency=250, runtime_overhead_gib=100.0)
+    assert scenario.is_feasible is True
+    assert scenario.infeasibility_reason == ""
+    assert scenario.nodes_capacity == 3        # ceil(250 / 100)
+    assert scenario.nodes_with_headroom == 4   # ceil(3 x 1.2)
+    assert scenario.nodes_final == 5           # + 1 (N+1)
+    assert scenario.sessions_per_node_effective == 50
+    assert scenario.vram_total_node_effective_gib == 500.0 + 100.0 + 50 * 3.0
+    assert scenario.hbm_utilization_ratio_effective == 0.75
+
+
+def test_zero_sessions_per_node_is_infeasible():
+    scenario = calc_scenario(_CONFIG, _vram(0, 899.0), concurrency=250, runtime_overhead_gib=100.0)
+    assert scenario.is_feasible is False
+    assert scenario.nodes_final == 0
+    assert scenario.hbm_utilization_ratio_effective == 0.0
+    # O motivo cita os termos reais: budget de KV (1 GiB x 0.7) contra o KV por sessão
+    reason = scenario.infeasibility_reason
+    assert "budget de KV (0.70 GiB)" in reason
+    assert "KV/sessão (3.00 GiB)" in reason
+    assert "pesos 899.0 GiB" in reason
+    assert "overhead 100.0 GiB" in reason
+
+
+@pytest.mark.parametrize("slo", [
+    (None, None, None),
+    (1000, 2000, 8.0),
+])
+def test_fused_matches_scenario_plus_latency(slo):
+    loader = ConfigLoader(base_path=".", validate=False)
+    model = loader.get_model("opt-oss-120b")
+    server = loader.get_server("dgx-b300")
+    configs = create_scenario_configs(peak_headroom_ratio=0.2, kv_budget_ratio=0.7)
+
+    # O cenário ideal recebe um KV/sessão que não cabe no nó: inviável, sem latência
+    kv_per_session = {"minimum": 2.0, "recommended": 2.0, "ideal": 5000.0}
+    vrams = {
+        key: calc_vram(
+            model=model, server=server, kv_gib_per_session=kv_per_session[key],
+            concurrency=1000, runtime_overhead_gib=120.0,
+            kv_budget_ratio=cfg.kv_budget_ratio, weights_precision="fp8",
+        )
+        for key, cfg in configs.items()
+    }
+
+    fused = calc_scenarios_fused(
+        configs, vrams, 1000, 120.0, model, server, 65536, *slo
+    )
+
+    assert list(fused) == list(configs)
+    for key, (scenario, latency) in fused.items():
+        expected = calc_scenario(configs[key], vrams[key], 1000, 120.0)
+        assert scenario.core == expected.core
+        assert scenario.latency is latency
+        if not expected.is_feasible:
+            assert latency is None
+            continue
+        assert latency == calc_latency_analysis(
+            model, server, expected.nodes_final, expected.sessions_per_node_effective,
+            1000, *slo, 65536
+        )
+    assert fused["ideal"][0].is_feasible is False
+    assert fused["minimum"][0].is_feasible is True
+
+
+def _slo_capacity(target_ttft_p50_ms=None, target_tpot_min_tokens_per_sec=None):
+    """4 nós x 100 sessões; prefill 100 ms + decode 900 ms; rede 10 ms; decode 2000 tok/s."""
+    return compute_slo_capacity(
+        num_nodes=4, sessions_per_node=100,
+        prefill_time_ms=100.0, decode_time_ms=900.0, decode_tokens_per_sec=2000.0,
+        network_p50_ms=10.0, queuing_factor_p50=0.3, max_utilization=0.95,
+        target_ttft_p50_ms=target_ttft_p50_ms,
+        target_tpot_min_tokens_per_sec=target_tpot_min_tokens_per_sec,
+    )
+
+
+def test_slo_capacity_feasible_and_ttft_limited():
+    cap = _slo_capacity(target_ttft_p50_ms=1000, target_tpot_min_tokens_per_sec=10.0)
+    assert cap.is_feasible is True
+    assert cap.infeasibility_reason == ""
+    # budget = 1000 - 10 - 100 = 890; util = 890 / (1000 x 0.3 + 890)
+    assert cap.queuing_budget_ms == 890.0
+    assert cap.util_max_from_ttft == pytest.approx(890.0 / 1190.0)
+    assert cap.max_concurrency_from_ttft == 299
+    assert cap.sessions_per_node_max_from_tpot == 200
+    assert cap.max_concurrency_from_tpot == 800
+    assert cap.max_concurrency_combined == 299
+    assert cap.limiting_factor == "TTFT"
+
+
+def test_slo_capacity_tpot_limited():
+    cap = _slo_capacity(target_ttft_p50_ms=1000, target_tpot_min_tokens_per_sec=50.0)
+    assert cap.is_feasible is True
+    assert cap.max_concurrency_from_tpot == 160   # floor(2000 / 50) x 4 nós
+    assert cap.max_concurrency_combined == 160
+    assert cap.limiting_factor == "TPOT"
+
+
+def test_slo_capacity_without_slo():
+    cap = _slo_capacity()
+    assert cap.limiting_factor == "NO_SLO"
+    assert cap.max_concurrency_combined == 380    # 0.95 x 400 sessões
+
+
+def test_slo_capacity_ttft_below_prefill_is_infeasible():
+    cap = _slo_capacity(target_ttft_p50_ms=100, target_tpot_min_tokens_per_sec=10.0)
+    assert cap.is_feasible is False
+    assert cap.queuing_budget_ms == -10.0
+    assert cap.max_concurrency_from_ttft == 0
+    assert cap.max_concurrency_combined == 0
+    # mínimo viável = rede + prefill x 1.05
+    assert "TTFT minimo viavel: 115ms" in cap.infeasibility_reason
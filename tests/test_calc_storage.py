@@ -0,0 +1,52 @@
+"""
+Testes da normalização de cenários de storage (fator e retenção por cenário).
+"""
+
+import pytest
+
+from sizing.calc_storage import (
+    Scenario,
+    calc_storage_cache_tb,
+    calc_storage_logs_tb,
+    calc_storage_operational_tb,
+)
+
+
+@pytest.mark.parametrize("name, expected", [
+    ("minimum", Scenario.MINIMO),
+    ("minimo", Scenario.MINIMO),
+    ("MÍNIMO", Scenario.MINIMO),
+    ("recommended", Scenario.RECOMENDADO),
+    ("Recomendado", Scenario.RECOMENDADO),
+    ("ideal", Scenario.IDEAL),
+])
+def test_scenario_aliases(name, expected):
+    assert Scenario(name) is expected
+
+
+@pytest.mark.parametrize("scenario, factor, retention_days", [
+    ("minimum", 1.0, 7),
+    ("recommended", 1.5, 30),
+    ("ideal", 2.0, 90),
+])
+def test_factor_and_retention_per_scenario(scenario, factor, retention_days):
+    _, operational = calc_storage_operational_tb(num_nodes=2, scenario=scenario)
+    _, cache = calc_storage_cache_tb(num_nodes=2, sessions_per_node=10, scenario=scenario)
+    _, logs = calc_storage_logs_tb(concurrency=100, num_nodes=2, scenario=scenario)
+    assert operational["inputs"]["scenario_factor"] == factor
+    assert cache["inputs"]["scenario_factor"] == factor
+    assert logs["inputs"]["retention_days"] == retention_days
+
+
+def test_minimum_scenario_is_smaller_than_recommended():
+    minimum_tb, _ = calc_storage_logs_tb(100, 2, scenario="minimum", explain=False)
+    recommended_tb, _ = calc_storage_logs_tb(100, 2, scenario="recommended", explain=False)
+    assert minimum_tb == pytest.approx(recommended_tb * 7 / 30)
+
+
+def test_unknown_scenario_raises():
+    # Antes caía silenciosamente no fator 1.5x / 30 dias
+    with pytest.raises(ValueError):
+        Scenario("maximo")
+    with pytest.raises(ValueError):
+        calc_storage_operational_tb(num_nodes=2, scenario="maximo")
@@ -0,0 +1,43 @@
+"""
+Testes da classificação de status na validação física de storage.
+
+Formula: Throughput(MB/s) = (IOPS × BlockSize(KB)) / 1024
+"""
+
+from sizing.calc_storage_validation import validate_storage_profile
+from sizing.storage import StorageProfile
+
+
+def _profile(read_factor: float) -> StorageProfile:
+    """Perfil consistente (100k IOPS x 32 KB = 3125 MB/s) com o throughput de leitura escalado."""
+    return StorageProfile(
+        name="teste",
+        type="nvme_local",
+        iops_read_max=100_000,
+        iops_write_max=100_000,
+        throughput_read_mbps=3125.0 * read_factor,
+        throughput_write_mbps=3125.0,
+        block_size_kb_read=32.0,
+        block_size_kb_write=32.0,
+    )
+
+
+def test_consistent_profile_is_ok():
+    validation = validate_storage_profile(_profile(1.0))
+    assert validation.read_validation.status == "ok"
+    assert validation.overall_status == "ok"
+
+
+def test_divergence_between_thresholds_is_warning():
+    # 13% acima do calculado: divergência de ~11.5%, entre WARNING (10%) e ERROR (25%)
+    validation = validate_storage_profile(_profile(1.13))
+    assert 0.10 < validation.read_validation.throughput_divergence_pct < 0.25
+    assert validation.read_validation.status == "warning"
+    assert validation.write_validation.status == "ok"
+    assert validation.overall_status == "warning"
+
+
+def test_divergence_above_error_threshold_is_error():
+    validation = validate_storage_profile(_profile(1.5))
+    assert validation.read_validation.status == "error"
+    assert validation.overall_status == "error"
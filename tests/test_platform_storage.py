@@ -0,0 +1,29 @@
+"""
+Testes do volume de storage da plataforma (escalar e em lote).
+"""
+
+import pytest
+
+from sizing.platform_storage import load_platform_storage_profile
+
+
+_PROFILE = load_platform_storage_profile("platform_storage_profile.json")
+
+
+def test_batch_matches_scalar():
+    node_counts = [1, 2, 3, 7, 64]
+    assert _PROFILE.calc_total_platform_volume_tb_batch(node_counts) == [
+        _PROFILE.calc_total_platform_volume_tb(n) for n in node_counts
+    ]
+
+
+def test_empty_batch():
+    assert _PROFILE.calc_total_platform_volume_tb_batch([]) == []
+
+
+@pytest.mark.parametrize("bad", [0, -1])
+def test_non_positive_node_count_raises(bad):
+    with pytest.raises(ValueError, match=f"deve ser > 0: {bad}"):
+        _PROFILE.calc_total_platform_volume_tb(bad)
+    with pytest.raises(ValueError, match=f"deve ser > 0: {bad}"):
+        _PROFILE.calc_total_platform_volume_tb_batch([3, bad, 5])